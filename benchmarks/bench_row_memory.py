@@ -0,0 +1,75 @@
+"""Micro-benchmark: memory held by scraped grid rows.
+
+Compares the original row type (dict-backed frozen dataclass with a per-row `partial` button resolver)
+with the slotted `UsersRowData`, which shares one page reference across the rows of a page, and reports
+the pickled size of a row (the page is not pickled). Row values are shared between both runs, so only
+the per-row overhead is measured.
+
+    python -m benchmarks.bench_row_memory [--rows 10000]
+"""
+import argparse
+import pickle
+import tracemalloc
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Callable, Optional
+
+from src.models.factories.users import UsersRowData
+
+
+@dataclass(frozen=True)
+class DictRowData:
+    id: str
+    name: str
+    username: str
+    email: str
+    phone: str
+    data_id: Optional[str] = None
+    _buttons: Optional[Callable] = field(default=None, repr=False, compare=False)
+
+
+class _Page:
+    def row_buttons(self, key_attr: str, key: str) -> list:
+        return []
+
+
+def build_values(rows: int) -> list[tuple]:
+    return [(str(i), f"name{i}", f"user{i}", f"user{i}@test.com", "123-456", str(i)) for i in range(rows)]
+
+
+def build_dict_rows(values: list[tuple]) -> list:
+    page = _Page()
+    return [DictRowData(*row, partial(page.row_buttons, "data-id", row[5])) for row in values]
+
+
+def build_slotted_rows(values: list[tuple]) -> list:
+    page = _Page()
+    return [UsersRowData(*row, _key_attr="data-id", _page=page) for row in values]
+
+
+def measure(build, values: list[tuple]) -> int:
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    data = build(values)
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    size = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    del data
+    return size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10000, help="rows to build")
+    args = parser.parse_args()
+
+    values = build_values(args.rows)
+    for name, build in (("dict", build_dict_rows), ("slotted", build_slotted_rows)):
+        size = measure(build, values)
+        print(f"{name:<8} {size / args.rows:8.1f} B per row ({args.rows} rows, values excluded)")
+    row = build_slotted_rows(build_values(1))[0]
+    print(f"pickled  {len(pickle.dumps(row)):8d} B per row")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Micro-benchmark: per-assertion cost of response schema validation.
+
+Compares the previous approach (new TypeAdapter per call + response.json() + validate_python)
+with the shipped `validate_response` (cached validator, validating straight from response.content),
+status, time and content-type soft asserts included.
+
+    python -m benchmarks.bench_validate_response [--users 50] [--number 2000]
+"""
+import argparse
+import json
+import timeit
+from datetime import timedelta
+
+from pydantic import TypeAdapter
+from requests import Response
+
+from src.models.user_model import UserModel
+from src.steps.validation_steps import validate_response
+
+
+def make_response(users: int) -> Response:
+    response = Response()
+    response.status_code = 200
+    response.headers["Content-Type"] = "application/json"
+    response.elapsed = timedelta(milliseconds=5)
+    response._content = json.dumps([
+        {"id": i, "name": f"name{i}", "username": f"user{i}", "email": f"user{i}@test.com", "phone": "123-456"}
+        for i in range(users)
+    ]).encode()
+    return response
+
+
+def validate_uncached(response: Response):
+    payload = response.json()
+    many = isinstance(payload, list)
+    return TypeAdapter(list[UserModel] if many else UserModel).validate_python(payload)
+
+
+def validate_shipped(response: Response):
+    return validate_response(response, UserModel, 200, expect_empty=False)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=50, help="users in the response body")
+    parser.add_argument("--number", type=int, default=2000, help="validations per measurement")
+    args = parser.parse_args()
+
+    response = make_response(args.users)
+    for name, func in (("uncached", validate_uncached), ("shipped", validate_shipped)):
+        best = min(timeit.repeat(lambda: func(response), number=args.number, repeat=5))
+        print(f"{name:<9} {best / args.number * 1e6:9.1f} us per assertion ({args.users} users)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,137 @@
 """Pytest execution configuration for Setup and Teardown"""
 import logging
+import os
+import tempfile
+from statistics import mean, median
+from typing import Optional
 
 import pytest
+from _pytest.mark import deselect_by_keyword, deselect_by_mark
+from dependency_injector import providers
 from dotenv import load_dotenv
 
-from core.container import AppContainer
-from src.models.factories.users import build_user, user_test_data_to_payload
+from core.container import AppContainer, WebDriverPool, webdriver_wrapper_resource
+from src.helpers.test_durations import DurationSchedulingPlugin, DurationStore
+from src.models.factories.users import build_user, fake, user_test_data_to_payload
+from src.models.user_model import UserModel
+from src.steps.seeding_steps import seed_user
+from src.stubs.users_api_stub import UsersApiStub
+from src.wrappers.async_user_api_client import AsyncUserApiClient
+from src.wrappers.cassette import CASSETTE_MODES, DEFAULT_CASSETTE_DIR, Cassette, cassette_path
+from src.wrappers.http_transport import session_registry
+from src.wrappers.id_journal import RUN_ID_ENV, new_run_id
 from src.wrappers.user_api_client import UserApiClient
 
 log = logging.getLogger(__name__)
 
+pytest_plugins = ["pytester", "src.helpers.seeding", "src.perf.plugin"]
+
+DURATIONS_FILE = ".test_durations.json"
+GRID_STATE_GROUP = "users_grid"
+# fixtures through which a test creates users that show up in the UI's grid
+USER_CREATING_FIXTURES = ("api_client", "async_api_client", "seeded_user")
+SWEEP_ENV = "API_SWEEP_LEAKED_USERS"
+
+_SAME_ID_CONTRADICTION = "expects GET ?id=1 to both find user 1 (single_user_by_id) and not find it"
+_ERROR_BODY_AS_USER = "validates the 400/422 error body as a user; the stub answers {'detail': ...}"
+_INVALID_SETUP_USER = "creates the invalid user in setup, which the stub rejects before the PUT under test"
+# cases of tests/test_api.py the bundled stub cannot pass; strict, so a stub or test fix shows up as XPASS
+STUB_API_KNOWN_DIFFERENCES = {
+    "test_negative_get_users[tolerated_resource_absence_200_code_but_empty]": _SAME_ID_CONTRADICTION,
+    "test_negative_get_users[user_not_exist]": _SAME_ID_CONTRADICTION,
+    "test_create_api_user[invalid_email]": _ERROR_BODY_AS_USER,
+    "test_create_api_user[empty_username]": _ERROR_BODY_AS_USER,
+    "test_create_api_user[bad_phone_format]": _ERROR_BODY_AS_USER,
+    "test_create_api_user[null_phone]": _ERROR_BODY_AS_USER,
+    "test_create_api_user[empty_name]": _ERROR_BODY_AS_USER,
+    "test_update_user_put[invalid_email]": _INVALID_SETUP_USER,
+    "test_update_user_put[empty_username]": _INVALID_SETUP_USER,
+    "test_update_user_put[empty_name]": _INVALID_SETUP_USER,
+    "test_update_user_put[bad_phone]": _INVALID_SETUP_USER,
+}
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--stub-api",
+        action="store_true",
+        help="run against the bundled in-process Users API stub instead of API_BASE_URL",
+    )
+    parser.addoption(
+        "--sweep-leaked-users",
+        action="store_true",
+        default=os.getenv(SWEEP_ENV, "").lower() in ("1", "true", "yes"),
+        help=f"at session start, delete users earlier runs left in the id journal for API_BASE_URL "
+             f"(default: {SWEEP_ENV} env)",
+    )
+    parser.addoption(
+        "--api-cassettes",
+        choices=CASSETTE_MODES,
+        default=os.getenv("API_CASSETTE_MODE") or "off",
+        help="record API traffic per test, or replay it without network (default: API_CASSETTE_MODE or off)",
+    )
+    parser.addoption(
+        "--cassette-dir",
+        default=DEFAULT_CASSETTE_DIR,
+        help=f"where API cassettes are stored (default: {DEFAULT_CASSETTE_DIR})",
+    )
+
+
+def pytest_configure(config):
+    if not hasattr(config, "workerinput"):
+        # workers are spawned after this and inherit it, so every entry this run journals shares the id
+        os.environ[RUN_ID_ENV] = new_run_id()
+    store = DurationStore(config.rootpath / DURATIONS_FILE)
+    config.pluginmanager.register(DurationSchedulingPlugin(store), "duration_scheduling")
+    if config.getoption("stub_api"):
+        _start_stub_api(config)
+
+
+def _start_stub_api(config):
+    """One stub per process (each xdist worker gets its own); ids it hands out never reach the real journal."""
+    stub = UsersApiStub().start()
+    journal_fd, journal_path = tempfile.mkstemp(prefix="stub_users_", suffix=".journal")
+    os.close(journal_fd)
+    os.environ["API_BASE_URL"] = stub.base_url
+    os.environ["API_ID_JOURNAL"] = journal_path
+    config.add_cleanup(lambda: os.unlink(journal_path) if os.path.exists(journal_path) else None)
+    config.add_cleanup(stub.stop)
+
+
+def _journal_client(session) -> Optional[UserApiClient]:
+    """Client for sweeping the id journal (controller process only), None when there is nothing to sweep."""
+    if hasattr(session.config, "workerinput") or session.config.getoption("stub_api"):
+        return None
+    load_dotenv()
+    if not os.getenv("API_BASE_URL"):
+        log.info("API_BASE_URL is not set, leaked users are not swept")
+        return None
+    return UserApiClient()
+
+
+def _sweep_leaked_users(client: UserApiClient, run_id: Optional[str] = None):
+    summary = client.sweep_journal(run_id)
+    if summary.failed:
+        log.warning(f"Could not sweep leaked users: {summary.failed}")
+
+
+def pytest_sessionstart(session):
+    """Sweep users earlier runs leaked on this API when asked to."""
+    client = _journal_client(session)
+    if client is not None and session.config.getoption("sweep_leaked_users"):
+        _sweep_leaked_users(client)
+
+
+def pytest_sessionfinish(session):
+    """Delete users leaked by crashed workers of this run; other runs' users may still be in use."""
+    client = _journal_client(session)
+    if client is not None:
+        _sweep_leaked_users(client, os.environ[RUN_ID_ENV])
+
+
+def pytest_unconfigure(config):
+    session_registry.close_all()
+
 
 @pytest.fixture(scope="function", autouse=True)
 def run_before_and_after_tests():
@@ -19,24 +141,111 @@ def run_before_and_after_tests():
     """teardown"""
 
 
+@pytest.fixture(scope="session")
+def driver_pool():
+    """One browser per session (per worker under xdist), reset between tests."""
+    pool = WebDriverPool()
+    yield pool
+    pool.shutdown()
+
+
 @pytest.fixture()
-def ui_context():
+def ui_context(request, driver_pool):
     container = AppContainer()
+    if request.node.get_closest_marker("fresh_browser"):
+        log.info("Using an isolated fresh browser for this test")
+        container.driver_wrapper.override(providers.Resource(webdriver_wrapper_resource))
+    else:
+        container.driver_pool.override(providers.Object(driver_pool))
     container.init_resources()
     container.wire(packages=["src.pages", "tests"])
+    wd_wrapper = container.driver_wrapper()
+    # drop page loads left over from the pooled session reset, keep a fresh launch time
+    startup_ms = wd_wrapper.pop_timings()["startup_ms"]
     yield container
+    timings = wd_wrapper.pop_timings()
+    timings["startup_ms"] = startup_ms
+    log.debug(f"Element cache: {wd_wrapper.element_cache_stats}")
+    request.node.user_properties.append(("browser_timings", timings))
     container.unwire()
     container.shutdown_resources()
 
 
-def pytest_collection_modifyitems(items):
+def _creates_users(item) -> bool:
+    return any(name in item.fixturenames for name in USER_CREATING_FIXTURES)
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(config, items):
+    """
+    Runs before xdist's worker hook, which turns xdist_group markers into `@group` nodeid suffixes.
+    -m/-k deselection is applied here first (pytest's own pass then finds nothing left to drop),
+    so only selected grid_state tests pull API tests into their group.
+    """
+    deselect_by_keyword(items, config)
+    deselect_by_mark(items, config)
+    grid_state_selected = any(item.get_closest_marker("grid_state") for item in items)
+    # against the stub, API tests never touch the users the browser's grid shows
+    stub_api = config.getoption("stub_api")
+    shares_grid_users = grid_state_selected and not stub_api
     for item in items:
+        if stub_api and item.name in STUB_API_KNOWN_DIFFERENCES:
+            item.add_marker(pytest.mark.xfail(reason=f"--stub-api: {STUB_API_KNOWN_DIFFERENCES[item.name]}",
+                                              strict=True))
         if item.get_closest_marker("ui"):
             item.fixturenames.append("ui_context")
+        if item.get_closest_marker("grid_state") or (shares_grid_users and _creates_users(item)):
+            # with --dist loadgroup the whole group runs serially on one worker, so no other
+            # worker creates users while a grid_state test asserts on the grid
+            item.add_marker(pytest.mark.xdist_group(GRID_STATE_GROUP))
+
+
+def pytest_terminal_summary(terminalreporter):
+    """Report browser startup and page load latency per browser profile."""
+    per_profile: dict[str, dict[str, list[float]]] = {}
+    for reports in terminalreporter.stats.values():
+        for report in reports:
+            if getattr(report, "when", None) != "teardown":
+                continue
+            for name, timings in report.user_properties:
+                if name != "browser_timings":
+                    continue
+                profile = per_profile.setdefault(timings["profile"], {"startup_ms": [], "page_load_ms": []})
+                if timings["startup_ms"] is not None:
+                    profile["startup_ms"].append(timings["startup_ms"])
+                profile["page_load_ms"].extend(timings["page_load_ms"])
+    if not per_profile:
+        return
+    terminalreporter.section("browser timings")
+    for profile, timings in per_profile.items():
+        for metric, values in timings.items():
+            if values:
+                terminalreporter.write_line(
+                    f"{profile:<8} {metric:<13} n={len(values):<4} "
+                    f"mean={mean(values):.0f} ms median={median(values):.0f} ms max={max(values):.0f} ms"
+                )
+
+
+@pytest.fixture
+def api_cassette(request, seeded_test_data) -> Optional[Cassette]:
+    """
+    Per-test cassette for --api-cassettes record/replay/strict, saved after the client cleanup.
+    Replays re-seed the test data with the recorded seed, so payloads match the recording.
+    """
+    mode = request.config.getoption("api_cassettes")
+    if mode == "off":
+        yield None
+        return
+    path = cassette_path(request.config.rootpath / request.config.getoption("cassette_dir"), request.node.nodeid)
+    cassette = Cassette(path, mode, seed=seeded_test_data)
+    if cassette.replaying and cassette.seed is not None:
+        fake.seed_instance(cassette.seed)
+    yield cassette
+    cassette.save()
 
 
 @pytest.fixture
-def user_payload(request) -> dict:
+def user_payload(request, api_cassette) -> dict:
     """
     Indirect param fixture.
     Returns a ready-to-send JSON payload.
@@ -47,9 +256,42 @@ def user_payload(request) -> dict:
 
 
 @pytest.fixture
-def api_client():
+def api_client(api_cassette):
     log.info("Providing UserApiClient")
-    client = UserApiClient()
+    client = UserApiClient(cassette=api_cassette)
     yield client
     log.info("Running UserApiClient context cleanup")
-    client.cleanup_created_users()
+    summary = client.cleanup_created_users()
+    if summary.failed:
+        log.warning(f"Users left behind after cleanup: {summary.failed}")
+
+
+@pytest.fixture
+def seeded_user(api_client) -> UserModel:
+    """A user created through the API as a precondition, deleted by the api_client cleanup."""
+    return seed_user(api_client)
+
+
+@pytest.fixture(scope="session")
+def users_api_stub():
+    """A Users API stub on an ephemeral port, for hermetic client benchmarks and load scenarios."""
+    stub = UsersApiStub().start()
+    yield stub
+    stub.stop()
+
+
+@pytest.fixture
+def anyio_backend():
+    """Run `@pytest.mark.anyio` tests and async fixtures on asyncio."""
+    return "asyncio"
+
+
+@pytest.fixture
+async def async_api_client(anyio_backend):
+    log.info("Providing AsyncUserApiClient")
+    async with AsyncUserApiClient() as client:
+        yield client
+        log.info("Running AsyncUserApiClient context cleanup")
+        summary = await client.cleanup_created_users()
+        if summary.failed:
+            log.warning(f"Users left behind after cleanup: {summary.failed}")
@@ -1,10 +1,17 @@
+import logging
 from contextlib import contextmanager
+from typing import Optional
 
 from dependency_injector import containers, providers
+from selenium.common.exceptions import WebDriverException
 
 from src.wrappers.scenario_context import ScenarioContext
 from src.wrappers.webdriver_wrapper import WebDriverWrapper
 
+log = logging.getLogger(__name__)
+
+_CLEAR_STORAGE_SCRIPT = "window.localStorage.clear(); window.sessionStorage.clear();"
+
 
 @contextmanager
 def webdriver_wrapper_resource():
@@ -16,11 +23,74 @@ def webdriver_wrapper_resource():
         wd_wrapper.quit()
 
 
+class WebDriverPool:
+    """Keeps one WebDriverWrapper alive per process and hands it out between tests."""
+
+    def __init__(self):
+        self._wrapper: Optional[WebDriverWrapper] = None
+
+    def acquire(self) -> WebDriverWrapper:
+        """Return the pooled wrapper, launching a new browser if none is alive."""
+        if self._wrapper is not None and not self._is_healthy(self._wrapper):
+            log.warning("Pooled WebDriver session is broken, recycling it")
+            self._discard()
+        if self._wrapper is None:
+            self._wrapper = WebDriverWrapper()
+        return self._wrapper
+
+    def release(self, wd_wrapper: WebDriverWrapper):
+        """Reset browser state so the next test starts clean; drop the session if reset fails."""
+        try:
+            wd_wrapper.execute_script(_CLEAR_STORAGE_SCRIPT)
+        except WebDriverException:
+            # Storage is not reachable on some pages (e.g. about:blank), cookies still get cleared
+            pass
+        try:
+            wd_wrapper.delete_all_cookies()
+            wd_wrapper.get_url("about:blank")
+        except WebDriverException as e:
+            log.warning(f"Could not reset pooled WebDriver session: {e}")
+            self._discard()
+
+    def shutdown(self):
+        """Quit the pooled browser, if any."""
+        self._discard()
+
+    @staticmethod
+    def _is_healthy(wd_wrapper: WebDriverWrapper) -> bool:
+        try:
+            wd_wrapper.get_current_url()
+            return True
+        except WebDriverException:
+            return False
+
+    def _discard(self):
+        if self._wrapper is None:
+            return
+        try:
+            self._wrapper.quit()
+        except WebDriverException as e:
+            log.warning(f"Failed to quit WebDriver session: {e}")
+        finally:
+            self._wrapper = None
+
+
+@contextmanager
+def pooled_webdriver_resource(pool: WebDriverPool):
+    """Yield the pooled WebDriverWrapper and reset it afterward instead of quitting."""
+    wd_wrapper = pool.acquire()
+    try:
+        yield wd_wrapper
+    finally:
+        pool.release(wd_wrapper)
+
+
 class AppContainer(containers.DeclarativeContainer):
     """Main DI container wiring Selenium driver and scenario context."""
     wiring_config = containers.WiringConfiguration(packages=["src.pages", "tests"])
     settings = providers.Configuration()
-    driver_wrapper = providers.Resource(webdriver_wrapper_resource)
+    driver_pool = providers.Singleton(WebDriverPool)
+    driver_wrapper = providers.Resource(pooled_webdriver_resource, pool=driver_pool)
 
     scenario_context = providers.Singleton(
         ScenarioContext,
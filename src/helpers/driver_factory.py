@@ -1,25 +1,30 @@
 import logging
 import os
+import time
 
-from src.helpers.driver_managers import ChromeManager, FirefoxManager
+from src.helpers.driver_managers import ChromeManager, FirefoxManager, DEFAULT_PROFILE
 
 log = logging.getLogger(__name__)
 
 
 class DriverFactory:
-    """Factory for creating Selenium WebDriver instances based on BROWSER env var."""
+    """Factory for creating Selenium WebDriver instances based on BROWSER and BROWSER_PROFILE env vars."""
     def __init__(self):
         log.setLevel(logging.INFO)
         self.__browser_type = (os.getenv('BROWSER') or "chrome").lower()
+        self.profile = (os.getenv('BROWSER_PROFILE') or DEFAULT_PROFILE).lower()
+        self.startup_ms: float | None = None
         log.info(f"initiating f{self.__browser_type!r} webdriver")
 
     def make(self, options=None):
         """Return a configured WebDriver instance for the chosen browser."""
+        start = time.perf_counter()
         if self.__browser_type == "chrome":
-            driver = ChromeManager().get_driver(options=options)
-            return driver
+            driver = ChromeManager(self.profile).get_driver(options=options)
         elif self.__browser_type == "firefox":
-            driver = FirefoxManager().get_driver(options=options)
+            driver = FirefoxManager(self.profile).get_driver(options=options)
         else:
             raise ValueError(f"Unsupported browser: {self.__browser_type!r}")
+        self.startup_ms = (time.perf_counter() - start) * 1000
+        log.info(f"{self.__browser_type} [{self.profile} profile] started in {self.startup_ms:.0f} ms")
         return driver
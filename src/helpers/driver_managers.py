@@ -1,12 +1,28 @@
+import os
 from abc import ABC, abstractmethod
 
 from selenium import webdriver
 from selenium.webdriver.remote.webdriver import WebDriver
 
+DEFAULT_PROFILE = "default"
+LEAN_PROFILE = "lean"
+PROFILES = (DEFAULT_PROFILE, LEAN_PROFILE)
+
 
 class DriverManager(ABC):
     """Abstract base for WebDriver managers."""
 
+    def __init__(self, profile: str = DEFAULT_PROFILE):
+        if profile not in PROFILES:
+            raise ValueError(f"Unsupported browser profile: {profile!r}, expected one of {PROFILES}")
+        self.profile = profile
+        width, height = (os.getenv("WINDOW_SIZE") or "1920,1080").split(",")
+        self.window_size = (int(width), int(height))
+
+    @property
+    def is_lean(self) -> bool:
+        return self.profile == LEAN_PROFILE
+
     @abstractmethod
     def _create_driver(self, options=None) -> WebDriver:
         """Subclasses must implement WebDriver creation."""
@@ -25,14 +41,43 @@ class ChromeManager(DriverManager):
             options.add_argument("--disable-web-security")
             options.add_argument("--allow-running-insecure-content")
             options.add_argument("--no-default-browser-check")
+            if self.is_lean:
+                self._apply_lean_profile(options)
         driver = webdriver.Chrome(options=options)
-        driver.maximize_window()
+        if not self.is_lean:
+            driver.maximize_window()
         return driver
 
+    def _apply_lean_profile(self, options: webdriver.ChromeOptions):
+        """Headless, fixed-size window, no images and no background browser services."""
+        options.add_argument("--headless=new")
+        options.add_argument("--window-size={},{}".format(*self.window_size))
+        options.add_argument("--disable-extensions")
+        options.add_argument("--disable-gpu")
+        options.add_argument("--disable-background-networking")
+        options.add_argument("--disable-sync")
+        options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+        options.page_load_strategy = "eager"
+
 
 class FirefoxManager(DriverManager):
     def _create_driver(self, options=None):
         if options is None:
             options = webdriver.FirefoxOptions()
+            if self.is_lean:
+                self._apply_lean_profile(options)
         driver = webdriver.Firefox(options)
         return driver
+
+    def _apply_lean_profile(self, options: webdriver.FirefoxOptions):
+        """Headless, fixed-size window, no images and no background browser services."""
+        options.add_argument("-headless")
+        options.add_argument(f"--width={self.window_size[0]}")
+        options.add_argument(f"--height={self.window_size[1]}")
+        options.set_preference("permissions.default.image", 2)
+        options.set_preference("extensions.update.enabled", False)
+        options.set_preference("app.update.auto", False)
+        options.set_preference("browser.safebrowsing.malware.enabled", False)
+        options.set_preference("datareporting.policy.dataSubmissionEnabled", False)
+        options.set_preference("services.sync.engine.prefs", False)
+        options.page_load_strategy = "eager"
@@ -0,0 +1,75 @@
+"""Pytest plugin making generated test data reproducible.
+
+A session seed comes from `--seed`, the TEST_SEED env variable or, when neither is set, is drawn
+at random; it is shown in the report header and the pytest-html environment table. Each test
+seeds the shared Faker with a seed derived from the session seed and its node id, so a test
+generates the same data whatever runs before it and on whichever xdist worker it lands.
+"""
+import hashlib
+import os
+import random
+from typing import Optional
+
+import pytest
+
+from src.models.factories.users import fake
+
+SEED_ENV = "TEST_SEED"
+SEED_PROPERTY = "test_seed"
+
+seed_key = pytest.StashKey[int]()
+
+
+def derive_seed(session_seed: int, nodeid: str) -> int:
+    """Stable per-test seed; independent of PYTHONHASHSEED, test order and worker."""
+    digest = hashlib.sha256(f"{session_seed}:{nodeid}".encode()).digest()
+    return int.from_bytes(digest[:8], "big")
+
+
+def _session_seed(config) -> int:
+    workerinput = getattr(config, "workerinput", None)
+    if workerinput and SEED_ENV in workerinput:
+        return workerinput[SEED_ENV]
+    seed: Optional[int] = config.getoption("seed")
+    if seed is None and os.getenv(SEED_ENV):
+        seed = int(os.environ[SEED_ENV])
+    return seed if seed is not None else random.SystemRandom().randrange(2 ** 32)
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--seed",
+        type=int,
+        help=f"session seed for generated test data (default: {SEED_ENV} env or random); replays a previous run",
+    )
+
+
+def pytest_configure(config):
+    seed = _session_seed(config)
+    config.stash[seed_key] = seed
+    try:
+        from pytest_metadata.plugin import metadata_key
+    except ImportError:
+        return
+    if metadata_key in config.stash:
+        config.stash[metadata_key]["Test seed"] = seed
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    """Hand the controller's session seed to every xdist worker."""
+    node.workerinput[SEED_ENV] = node.config.stash[seed_key]
+
+
+def pytest_report_header(config):
+    seed = config.stash[seed_key]
+    return f"test data seed: {seed} (replay with --seed {seed})"
+
+
+@pytest.fixture(autouse=True)
+def seeded_test_data(request) -> int:
+    """Seed the shared Faker for this test; the derived seed is kept in the test's report properties."""
+    seed = derive_seed(request.config.stash[seed_key], request.node.nodeid)
+    fake.seed_instance(seed)
+    request.node.user_properties.append((SEED_PROPERTY, seed))
+    return seed
@@ -0,0 +1,66 @@
+import json
+import logging
+from pathlib import Path
+
+import pytest
+
+log = logging.getLogger(__name__)
+
+
+class DurationStore:
+    """Historical per-test durations used to schedule the slowest tests first."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._history: dict[str, float] = self._load()
+        self._current: dict[str, float] = {}
+
+    def _load(self) -> dict[str, float]:
+        try:
+            return json.loads(self.path.read_text())
+        except FileNotFoundError:
+            return {}
+        except ValueError as e:
+            log.warning(f"Ignoring unreadable durations file {self.path}: {e}")
+            return {}
+
+    def add(self, nodeid: str, seconds: float):
+        """Accumulate a phase duration (setup/call/teardown) for a test."""
+        self._current[nodeid] = self._current.get(nodeid, 0.0) + seconds
+
+    def sort_longest_first(self, items: list):
+        """Order items by historical duration, unknown tests get the mean duration."""
+        if not self._history:
+            return
+        default = sum(self._history.values()) / len(self._history)
+        items.sort(key=lambda item: self._history.get(item.nodeid, default), reverse=True)
+
+    def save(self):
+        """Merge this run into the history, smoothing against previous runs."""
+        if not self._current:
+            return
+        merged = dict(self._history)
+        for nodeid, seconds in self._current.items():
+            previous = merged.get(nodeid)
+            merged[nodeid] = seconds if previous is None else (previous + seconds) / 2
+        self.path.write_text(json.dumps(merged, indent=2, sort_keys=True))
+
+
+class DurationSchedulingPlugin:
+    """Records test durations and orders xdist worker collections longest-first."""
+
+    def __init__(self, store: DurationStore):
+        self.store = store
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_collection_modifyitems(self, config, items):
+        if hasattr(config, "workerinput"):
+            # workers hand tests out in collection order, so longest-first approximates LPT scheduling
+            self.store.sort_longest_first(items)
+
+    def pytest_runtest_logreport(self, report):
+        self.store.add(report.nodeid, report.duration)
+
+    def pytest_sessionfinish(self, session):
+        if not hasattr(session.config, "workerinput"):
+            self.store.save()
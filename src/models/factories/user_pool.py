@@ -0,0 +1,156 @@
+"""Pre-generated pool of fake users for scenarios that build many payloads.
+
+Faker providers are costly per call, so records are generated in bulk chunks (optionally in a
+background thread or process), cached on disk per seed/locale and handed out from a buffer.
+Usernames and emails are unique across everything a pool hands out.
+
+    pool = UserDataPool(size=5000, seed=42, background="thread")
+    payload = user_test_data_to_payload(pool.pop())
+"""
+import json
+import logging
+import os
+import threading
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Literal, Optional
+
+from faker import Faker
+
+from src.models.factories.users import UserTestData
+
+log = logging.getLogger(__name__)
+
+DEFAULT_LOCALE = "en_US"
+DEFAULT_CACHE_DIR = ".cache/user_pool"
+
+Record = tuple[str, str, str, str]
+
+
+def generate_chunk(seed: Optional[int], locale: str, index: int, size: int) -> list[Record]:
+    """Generate one chunk of (name, username, email, phone) records; deterministic for a given seed."""
+    faker = Faker(locale)
+    if seed is not None:
+        faker.seed_instance(f"{seed}:{index}")
+    return [(faker.first_name(), faker.user_name(), faker.email(), faker.phone_number()) for _ in range(size)]
+
+
+class UserDataPool:
+    """
+    Buffer of pre-generated UserTestData records.
+    Chunks of `size` records are generated up front and whenever the buffer drops below a quarter;
+    with `background` set, refills run in a thread or process while records are being consumed.
+    Seeded chunks are cached on disk (USER_POOL_CACHE_DIR) and reused by later runs.
+    """
+
+    def __init__(self, size: Optional[int] = None, seed: Optional[int] = None, locale: Optional[str] = None,
+                 background: Optional[Literal["thread", "process"]] = None, cache_dir: Optional[str] = None):
+        self.size = size or int(os.getenv("USER_POOL_SIZE", "1000"))
+        self.seed = seed
+        self.locale = locale or DEFAULT_LOCALE
+        self.cache_dir = Path(cache_dir or os.getenv("USER_POOL_CACHE_DIR", DEFAULT_CACHE_DIR))
+        self._buffer: deque[Record] = deque()
+        self._usernames: set[str] = set()
+        self._emails: set[str] = set()
+        self._lock = threading.Lock()
+        self._next_chunk = 0
+        self._pending: Optional[tuple[int, Future]] = None
+        self._executor: Optional[Executor] = None
+        if background == "thread":
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="user-pool")
+        elif background == "process":
+            self._executor = ProcessPoolExecutor(max_workers=1)
+        elif background is not None:
+            raise ValueError(f"Unsupported background mode: {background!r}")
+        with self._lock:
+            self._refill()
+
+    def __len__(self) -> int:
+        return len(self._buffer)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def pop(self) -> UserTestData:
+        """Hand out the next unique user."""
+        with self._lock:
+            while not self._buffer:
+                self._refill(wait=True)
+            record = self._buffer.popleft()
+            if len(self._buffer) < self.size // 4:
+                self._refill()
+        return UserTestData(*record)
+
+    def take(self, count: int) -> list[UserTestData]:
+        return [self.pop() for _ in range(count)]
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _refill(self, wait: bool = False):
+        """Merge a finished chunk into the buffer, and schedule (or synchronously build) the next one."""
+        if self._pending is not None:
+            index, future = self._pending
+            if not (wait or future.done()):
+                return
+            self._pending = None
+            self._merge(index, future.result())
+            if self._buffer:
+                return
+
+        index = self._next_chunk
+        self._next_chunk += 1
+        cached = self._load_cached(index)
+        if cached is not None:
+            self._merge(index, cached, store=False)
+        elif self._executor is None or wait:
+            self._merge(index, generate_chunk(self.seed, self.locale, index, self.size))
+        else:
+            self._pending = (index, self._executor.submit(generate_chunk, self.seed, self.locale, index, self.size))
+
+    def _merge(self, index: int, records: list[Record], store: bool = True):
+        if store:
+            self._store_cached(index, records)
+        added = 0
+        for record in records:
+            _, username, email, _ = record
+            if username in self._usernames or email in self._emails:
+                continue
+            self._usernames.add(username)
+            self._emails.add(email)
+            self._buffer.append(record)
+            added += 1
+        log.debug("User pool chunk %s: %s of %s records unique", index, added, len(records))
+
+    def _cache_path(self, index: int) -> Optional[Path]:
+        if self.seed is None:
+            return None
+        return self.cache_dir / f"users-{self.locale}-{self.seed}-{self.size}-{index}.json"
+
+    def _load_cached(self, index: int) -> Optional[list[Record]]:
+        path = self._cache_path(index)
+        if path is None or not path.exists():
+            return None
+        try:
+            return [tuple(record) for record in json.loads(path.read_text())]
+        except (OSError, ValueError) as e:
+            log.warning(f"Ignoring unreadable user pool cache {path}: {e}")
+            return None
+
+    def _store_cached(self, index: int, records: list[Record]):
+        path = self._cache_path(index)
+        if path is None:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(".tmp")
+            tmp.write_text(json.dumps(records))
+            tmp.replace(path)
+        except OSError as e:
+            log.warning(f"Could not write user pool cache {path}: {e}")
@@ -1,5 +1,5 @@
-from dataclasses import dataclass, asdict
-from typing import Optional
+from dataclasses import dataclass, asdict, field
+from typing import Optional, Protocol
 
 from faker import Faker
 from selenium.webdriver.remote.webelement import WebElement
@@ -45,7 +45,7 @@ def user_test_data_to_payload(user: UserTestData) -> dict:
     return asdict(user)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UsersColumnHeaderActions:
     """
     Groups elements for a Users column in header :
@@ -58,15 +58,51 @@ class UsersColumnHeaderActions:
     menu_btn: Optional[WebElement]
 
 
-@dataclass(frozen=True)
+class RowButtonsSource(Protocol):
+    """The grid page rows were read from; resolves a row's action buttons by the attribute that keyed it."""
+
+    def row_buttons(self, key_attr: str, key: str) -> list[WebElement]: ...
+
+
+@dataclass(frozen=True, slots=True)
 class UsersRowData:
     """
     Groups values and action buttons for a Users table row.
+    Holds plain values and a reference to the page it was read from (shared by all rows of that page);
+    buttons are resolved through it when `edit`/`remove` is accessed.
+    Hashable and picklable; the page is neither compared nor pickled, copies keep it.
     """
     id: str
     name: str
     username: str
     email: str
     phone: str
-    edit: WebElement
-    remove: WebElement
+    data_id: Optional[str] = None
+    _key_attr: str = field(default="data-id", repr=False, compare=False)
+    _page: Optional[RowButtonsSource] = field(default=None, repr=False, compare=False)
+
+    def _button(self, index: int) -> Optional[WebElement]:
+        if self._page is None:
+            raise RuntimeError(f"Row {self.data_id!r} is not bound to a grid page (e.g. unpickled), "
+                               f"its buttons cannot be resolved")
+        buttons = self._page.row_buttons(self._key_attr, self.data_id)
+        return buttons[index] if len(buttons) > index else None
+
+    def __reduce__(self):
+        return self.__class__, (self.id, self.name, self.username, self.email, self.phone, self.data_id,
+                                self._key_attr)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        # values are immutable strings and the page is shared, so a copy is the row itself
+        return self
+
+    @property
+    def edit(self) -> Optional[WebElement]:
+        return self._button(0)
+
+    @property
+    def remove(self) -> Optional[WebElement]:
+        return self._button(1)
@@ -0,0 +1,10 @@
+from functools import lru_cache
+from typing import Any
+
+from pydantic import TypeAdapter
+
+
+@lru_cache(maxsize=None)
+def get_type_adapter(model: Any, many: bool = False) -> TypeAdapter:
+    """Return the compiled validator for `model` (or `list[model]` when many), built once per process."""
+    return TypeAdapter(list[model] if many else model)
@@ -30,31 +30,42 @@ class AddUserPage(BasePage):
     @property
     def title(self):
         """Return the page title text."""
-        return self._wrapper.find_element(self.__title).text
+        return self._element(self.__title).text
 
     @property
     def __name_input(self):
-        return self._wrapper.find_element(self.__name)
+        return self._element(self.__name)
 
     @property
     def __username_input(self):
-        return self._wrapper.find_element(self.__user_name)
+        return self._element(self.__user_name)
 
     @property
     def __email_input(self):
-        return self._wrapper.find_element(self.__email)
+        return self._element(self.__email)
 
     @property
     def __phone_input(self):
-        return self._wrapper.find_element(self.__phone)
+        return self._element(self.__phone)
 
-    def add_user(self, user: UserTestData):
-        """Fill the user form with data from a UserTestData object."""
+    def add_user(self, user: UserTestData, strict: bool = False):
+        """Fill the user form with data from a UserTestData object.
+        Fields are set in one batch; strict=True types them key by key instead.
+        """
         log.info(f"Filling user form with following details:{user!r}")
-        self.__name_input.send_keys(user.name)
-        self.__username_input.send_keys(user.username)
-        self.__email_input.send_keys(user.email)
-        self.__phone_input.send_keys(user.phone)
+        if strict:
+            self.__name_input.send_keys(user.name)
+            self.__username_input.send_keys(user.username)
+            self.__email_input.send_keys(user.email)
+            self.__phone_input.send_keys(user.phone)
+            return self
+        fields = {
+            self.__name: user.name,
+            self.__user_name: user.username,
+            self.__email: user.email,
+            self.__phone: user.phone,
+        }
+        self._wrapper.fill_inputs({locator: value for locator, value in fields.items() if value is not None})
         return self
 
     def save(self):
@@ -24,9 +24,13 @@ class BasePage:
         self._wrapper = context.wrapper
 
     def _navigate(self, path):
-        """Open a page relative to BASE_URL using the given path."""
+        """Open a page relative to BASE_URL using the given path (drops cached elements)."""
         self._wrapper.get_url(os.environ["BASE_URL"] + path)
 
+    def _element(self, locator):
+        """Find an element once per page load; repeated lookups reuse the cached element."""
+        return self._wrapper.find_element(locator, cached=True)
+
     def cancel(self):
         log.info("...Cancel USER update")
         self._wrapper.find_element(self._cancel_button).click()
@@ -7,6 +7,11 @@ from src.pages.base_page import BasePage
 
 log = logging.getLogger(__name__)
 
+# args: xpath -> true once nothing in the page matches it
+_GONE_SCRIPT = """
+return !document.evaluate(arguments[0], document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+"""
+
 
 class UpdateUserPage(BasePage):
     """Page object for the 'Update User' screen."""
@@ -18,31 +23,50 @@ class UpdateUserPage(BasePage):
     __phone = (By.NAME, "phone")
     __update_user_button = (By.XPATH, "//button[normalize-space(.)='Update User']")
 
+    def navigate(self, user_id: int):
+        """Open the Update User page of the given user directly."""
+        self._navigate(f"{self.__path}/{user_id}")
+        log.info(f'User navigates to Update User Page of user id={user_id}')
+        return self
+
     @property
     def title(self):
-        return self._wrapper.find_element(self.__title).text
+        return self._element(self.__title).text
 
     @property
     def __name_input(self):
-        return self._wrapper.find_element(self.__name)
+        return self._element(self.__name)
 
     @property
     def __username_input(self):
-        return self._wrapper.find_element(self.__user_name)
+        return self._element(self.__user_name)
 
     @property
     def __email_input(self):
-        return self._wrapper.find_element(self.__email)
+        return self._element(self.__email)
 
     @property
     def __phone_input(self):
-        return self._wrapper.find_element(self.__phone)
+        return self._element(self.__phone)
 
-    def edit_user(self, user: UserTestData):
+    def edit_user(self, user: UserTestData, strict: bool = False):
         """Update user form fields with data from a UserTestData object.
         A value of None or '#' means skip updating that field.
+        Fields are replaced in one batch; strict=True clears and types them key by key instead.
         """
         log.info(f"Updating fallowing user details: {user!r}")
+        if not strict:
+            fields = {
+                self.__name: user.name,
+                self.__user_name: user.username,
+                self.__email: user.email,
+                self.__phone: user.phone,
+            }
+            self._wrapper.fill_inputs(
+                {locator: value for locator, value in fields.items() if value not in (None, "#")}
+            )
+            return self
+
         if user.name not in (None, "#"):
             self.__name_input.clear()
             self.__name_input.send_keys(user.name)
@@ -65,3 +89,9 @@ class UpdateUserPage(BasePage):
         """Click the 'Update User' button."""
         log.info("...Update USER")
         self._wrapper.find_element(self.__update_user_button).click()
+
+    def wait_until_closed(self):
+        """Wait until the form is gone, e.g. after cancel() led back to the users grid."""
+        self._wrapper.wait_for_script(
+            _GONE_SCRIPT, self.__update_user_button[1], message="Update User form did not close",
+        )
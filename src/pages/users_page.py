@@ -1,13 +1,73 @@
 import logging
-from typing import Optional, List
+import sys
+from itertools import islice
+from typing import Iterator, Optional, List
 
 from src.models.factories.users import UsersColumnHeaderActions, UsersRowData
 from src.pages.base_page import BasePage
 from selenium.webdriver.common.by import By
-from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.remote.webelement import WebElement
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
 
 log = logging.getLogger(__name__)
 
+# rows are keyed by data-id, or by aria-rowindex on grids that don't render data-id
+_ROW_KEY_JS = """
+const rowKey = row => row.getAttribute("data-id") || row.getAttribute("aria-rowindex");
+"""
+
+_EXTRACT_ROWS_SCRIPT = _ROW_KEY_JS + """
+const cell = (row, field) => {
+    const el = row.querySelector('div[role="cell"][data-field="' + field + '"]');
+    return el ? el.innerText.trim() : "";
+};
+return Array.from(document.querySelectorAll(arguments[0])).map(row => ({
+    keyAttr: row.hasAttribute("data-id") ? "data-id" : "aria-rowindex",
+    dataId: rowKey(row),
+    id: cell(row, "id"),
+    name: cell(row, "name"),
+    username: cell(row, "username"),
+    email: cell(row, "email"),
+    phone: cell(row, "phone"),
+}));
+"""
+
+# args: row selector, data-field, value -> true once the grid shows rows that all contain the value in that
+# cell, or the settled "no rows" overlay (a grid that is only empty while re-rendering does not count)
+_ROWS_MATCH_FILTER_SCRIPT = """
+const [rowSelector, field, value] = arguments;
+const rows = Array.from(document.querySelectorAll(rowSelector));
+if (!rows.length) {
+    const overlay = document.querySelector(".MuiDataGrid-overlay");
+    return !!overlay && !overlay.querySelector('[role="progressbar"]');
+}
+return rows.every(row => {
+    const cell = row.querySelector('div[role="cell"][data-field="' + field + '"]');
+    return !!cell && cell.innerText.toLowerCase().includes(value.toLowerCase());
+});
+"""
+
+# args: row selector -> key of the current first row once the next page was requested, false on the last page
+_REQUEST_NEXT_PAGE_SCRIPT = _ROW_KEY_JS + """
+const button = document.querySelector('button[aria-label="Go to next page"], button[aria-label="Next page"]');
+if (!button || button.disabled) { return false; }
+const first = document.querySelector(arguments[0]);
+button.click();
+return first ? rowKey(first) : "";
+"""
+
+# args: row selector, key of the previous first row -> true once the grid shows another page
+_PAGE_CHANGED_SCRIPT = _ROW_KEY_JS + """
+const first = document.querySelector(arguments[0]);
+return !!first && rowKey(first) !== arguments[1];
+"""
+
+# args: row selector -> scrolls the last rendered row into view
+_SCROLL_TO_LAST_ROW_SCRIPT = """
+const rows = document.querySelectorAll(arguments[0]);
+if (rows.length) { rows[rows.length - 1].scrollIntoView({block: "end"}); }
+"""
+
 
 class UsersPage(BasePage):
     """Page object for the Users table (grid)."""
@@ -24,11 +84,7 @@ class UsersPage(BasePage):
     __users_grid = (By.CSS_SELECTOR, '[role="row"].MuiDataGrid-row')
     __edit_button = (By.XPATH, "//button[normalize-space(.)='Edit']")
     __remove_button = (By.XPATH, "//button[normalize-space(.)='Remove']")
-
-    @property
-    def _rows_on_grid(self):
-        """Return all currently visible rows in the grid."""
-        return self._wrapper.find_elements(self.__users_grid)
+    __filter_value_input = (By.CSS_SELECTOR, 'input[placeholder="Filter value"]')
 
     def navigate(self):
         """Navigate to the Users page."""
@@ -94,50 +150,111 @@ class UsersPage(BasePage):
         else:
             menu_choice[0].click()
 
-    def get_user_with_username(self, username: str):
-        """Return list of users in grid with matching username."""
+    def filter_by_column(self, column_name: str, field: str, value: str):
+        """Narrow the grid in the browser with the DataGrid filter panel of a column."""
+        log.info(f'User filters [{column_name}] column by [{value}]')
+        self.pick_menu_option_for_column(column_name, "Filter")
+        self._wrapper.fill_inputs({self.__filter_value_input: value})
+        self._wrapper.wait_for_script(
+            _ROWS_MATCH_FILTER_SCRIPT, self.__users_grid[1], field, value,
+            message=f"Grid rows were not filtered by {field}={value!r}",
+        )
+
+    def __iter_filtered(self, column_name: str, field: str, value: str) -> Iterator[UsersRowData]:
+        """Rows matching the column filter; scans the whole grid when filtering is unavailable."""
+        try:
+            self.filter_by_column(column_name, field, value)
+        except (TimeoutException, NoSuchElementException, RuntimeError) as e:
+            log.warning(f"Grid filter unavailable ({e!r}), scanning the whole grid")
+            return self.iter_users()
+        # the filter wait already saw the grid settle, possibly on "no rows"; waiting for rows would time out
+        return self.iter_users(wait_for_rows=False)
+
+    def get_user_with_username(self, username: str, limit: Optional[int] = None):
+        """Return list of users in grid with matching username, stopping after `limit` matches."""
         log.info(f'Filter grid by username: [{username}] if present')
-        users_grid = self.get_users_from_page_grid()
-        lis_users = [user for user in users_grid if user.username == username]
-        return lis_users
+        matches = (user for user in self.__iter_filtered("Username", "username", username)
+                   if user.username == username)
+        return list(islice(matches, limit))
+
+    def iter_users(self, rows_per_page: Optional[str] = None, prefetch: bool = False,
+                   wait_for_rows: bool = True) -> Iterator[UsersRowData]:
+        """Lazily yield users page by page across the grid's pagination and virtualized scroll.
+        The browser is only driven while the caller keeps iterating. With prefetch=True the next page is
+        requested before the current page's rows are handed out, so the grid loads it while the caller works;
+        edit/remove buttons of a page can no longer be resolved once the grid moved past it.
+        wait_for_rows=False reads the grid as it is, for callers that already waited for it to settle
+        (an empty grid then yields nothing instead of timing out).
+        """
+        if rows_per_page:
+            self.select_rows_per_page(rows_per_page)
+        while True:
+            if prefetch:
+                page_rows = list(self.__iter_page_rows(wait_for_rows))
+                previous_first = self.__request_next_page()
+                yield from page_rows
+            else:
+                yield from self.__iter_page_rows(wait_for_rows)
+                previous_first = self.__request_next_page()
+            if previous_first is False:
+                return
+            self._wrapper.wait_for_script(
+                _PAGE_CHANGED_SCRIPT, self.__users_grid[1], previous_first,
+                message="Grid did not move to the next page",
+            )
+
+    def __iter_page_rows(self, wait_for_rows: bool = True) -> Iterator[UsersRowData]:
+        """Yield the rows of the current page, scrolling the virtualized grid as rows are consumed."""
+        seen_ids = set()
+        if wait_for_rows:
+            self._wrapper.presence_of_element(self.__users_grid)
+        rows = self._extract_rows()
+        while rows:
+            new_rows = [row for row in rows if row.data_id not in seen_ids]
+            if not new_rows:
+                return
+            seen_ids.update(row.data_id for row in new_rows)
+            yield from new_rows
+            self._scroll_to_last_row()
+            rows = self._extract_rows()
+
+    def __request_next_page(self):
+        """Click 'next page' without waiting; returns the previous first row's key, or False on the last page."""
+        return self._wrapper.execute_script(_REQUEST_NEXT_PAGE_SCRIPT, self.__users_grid[1])
+
+    def _extract_rows(self) -> List[UsersRowData]:
+        """Read every rendered row in a single script call; buttons stay unresolved until used."""
+        rows = self._wrapper.execute_script(_EXTRACT_ROWS_SCRIPT, self.__users_grid[1])
+        return [
+            UsersRowData(
+                id=row["id"],
+                name=row["name"],
+                username=row["username"],
+                email=row["email"],
+                phone=row["phone"],
+                data_id=row["dataId"],
+                # interned, so every row shares one of the two attribute names
+                _key_attr=sys.intern(row["keyAttr"]),
+                _page=self,
+            )
+            for row in rows or []
+        ]
+
+    def row_buttons(self, key_attr: str, key: str) -> List[WebElement]:
+        """Resolve the action buttons of the row keyed by `key_attr` (data-id, or aria-rowindex as fallback)."""
+        return self._wrapper.driver.find_elements(
+            By.CSS_SELECTOR,
+            f'{self.__users_grid[1]}[{key_attr}="{key}"] div[role="cell"][data-field="actions"] > button'
+        )
+
+    def _scroll_to_last_row(self):
+        """Scroll the grid so its last rendered row is in view and the next rows render."""
+        self._wrapper.execute_script(_SCROLL_TO_LAST_ROW_SCRIPT, self.__users_grid[1])
 
     def get_users_from_page_grid(self, rows_per_page: str = "25")->List[UsersRowData]:
         """Extract all users currently loaded in the grid based on rows_per_page option."""
         self.select_rows_per_page(rows_per_page)
-        seen_ids = set()
-        results = []
-        while True:
-            rows = self._rows_on_grid
-            if not rows:
-                break
-            for row in rows:
-                row_id = row.get_attribute("data-id") or row.get_attribute("aria-rowindex")
-                if row_id in seen_ids:
-                    continue
-                id_val = row.find_element(By.CSS_SELECTOR, 'div[role="cell"][data-field="id"]').text.strip()
-                name = row.find_element(By.CSS_SELECTOR, 'div[role="cell"][data-field="name"]').text.strip()
-                username = row.find_element(By.CSS_SELECTOR, 'div[role="cell"][data-field="username"]').text.strip()
-                email = row.find_element(By.CSS_SELECTOR, 'div[role="cell"][data-field="email"]').text.strip()
-                phone = row.find_element(By.CSS_SELECTOR, 'div[role="cell"][data-field="phone"]').text.strip()
-                buttons = row.find_elements(By.CSS_SELECTOR, 'div[role="cell"][data-field="actions"] > button')
-
-                results.append(UsersRowData(
-                    id=id_val,
-                    name=name,
-                    username=username,
-                    email=email,
-                    phone=phone,
-                    edit=buttons[0] if len(buttons) > 0 else None,
-                    remove=buttons[1] if len(buttons) > 1 else None
-                ))
-                seen_ids.add(row_id)
-            last_row = rows[-1]
-            self._wrapper.scroll_to_elm(last_row)
-            new_rows = self._rows_on_grid
-            new_last = new_rows[-1].get_attribute("data-id") if new_rows else None
-            if new_last in seen_ids:
-                break
-        return results
+        return list(self.__iter_page_rows())
 
     def select_rows_per_page(self, rows_per_page: str):
         """Change the 'rows per page' setting in the grid."""
@@ -154,24 +271,5 @@ class UsersPage(BasePage):
 
     def get_first_user_in_grid(self) -> UsersRowData:
         """Return first user row currently visible in the grid."""
-        rows = self._rows_on_grid
-        results = []
-        for element in rows:
-            id_val = element.find_element(By.CSS_SELECTOR, 'div[role="cell"][data-field="id"]')
-            name = element.find_element(By.CSS_SELECTOR, 'div[role="cell"][data-field="name"]')
-            username = element.find_element(By.CSS_SELECTOR, 'div[role="cell"][data-field="username"]')
-            email = element.find_element(By.CSS_SELECTOR, 'div[role="cell"][data-field="email"]')
-            phone = element.find_element(By.CSS_SELECTOR, 'div[role="cell"][data-field="phone"]')
-            buttons = element.find_elements(By.CSS_SELECTOR, 'div[role="cell"][data-field="actions"] > button')
-            results.append(
-                UsersRowData(
-                    id=id_val.text.strip(),
-                    name=name.text.strip(),
-                    username=username.text.strip(),
-                    email=email.text.strip(),
-                    phone=phone.text.strip(),
-                    edit=buttons[0] if len(buttons) > 0 else None,
-                    remove=buttons[1] if len(buttons) > 1 else None
-                )
-            )
-        return results[0]
+        self._wrapper.presence_of_element(self.__users_grid)
+        return self._extract_rows()[0]
@@ -0,0 +1,281 @@
+"""Historical performance baseline store with regression detection.
+
+Each test session records per-test call durations and raw per-endpoint API latency samples
+into a local SQLite database, keyed by the selection of tests that ran. A run is compared with a
+rolling baseline of the previous runs of the same selection:
+
+* tests: one-sided z-test of the new duration against the per-run baseline durations,
+* endpoints: one-sided Mann-Whitney U test of the new samples against the baseline samples,
+
+and a regression is flagged when the slowdown is significant and larger than a minimum ratio and
+delta, even when absolute thresholds in the tests still pass.
+
+    python -m src.perf.baseline trend test_create_api_user
+    python -m src.perf.baseline compare
+"""
+import argparse
+import hashlib
+import math
+import sqlite3
+import sys
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from statistics import fmean, median, stdev
+from typing import Iterable, Optional
+
+DEFAULT_BASELINE_DB = ".perf/baseline.sqlite"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    started_at TEXT NOT NULL,
+    selection TEXT
+);
+CREATE TABLE IF NOT EXISTS test_durations (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    test_id TEXT NOT NULL,
+    duration_ms REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS endpoint_samples (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    endpoint TEXT NOT NULL,
+    elapsed_ms REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS test_durations_by_test ON test_durations (test_id, run_id);
+CREATE INDEX IF NOT EXISTS endpoint_samples_by_endpoint ON endpoint_samples (endpoint, run_id);
+"""
+
+
+def selection_key(test_ids: Iterable[str]) -> str:
+    """Identifies the set of tests a run executed, so -k/-m subsets only compare with like runs."""
+    return hashlib.sha256("\n".join(sorted(set(test_ids))).encode()).hexdigest()[:16]
+
+
+def _normal_sf(z: float) -> float:
+    """Survival function of the standard normal distribution."""
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def z_test_p_value(value: float, baseline: list[float]) -> float:
+    """One-sided p-value that `value` is larger than the baseline distribution."""
+    spread = stdev(baseline)
+    if spread == 0:
+        return 0.0 if value > baseline[0] else 1.0
+    return _normal_sf((value - fmean(baseline)) / spread)
+
+
+def mann_whitney_p_value(current: list[float], baseline: list[float]) -> float:
+    """One-sided Mann-Whitney U p-value (normal approximation) that `current` is stochastically larger."""
+    ranked = sorted([(v, 0) for v in current] + [(v, 1) for v in baseline])
+    ranks = [0.0] * len(ranked)
+    i = 0
+    while i < len(ranked):
+        j = i
+        while j + 1 < len(ranked) and ranked[j + 1][0] == ranked[i][0]:
+            j += 1
+        for k in range(i, j + 1):
+            ranks[k] = (i + j) / 2 + 1
+        i = j + 1
+    n1, n2 = len(current), len(baseline)
+    rank_sum = sum(rank for rank, (_, group) in zip(ranks, ranked) if group == 0)
+    u = rank_sum - n1 * (n1 + 1) / 2
+    sigma = math.sqrt(n1 * n2 * (n1 + n2 + 1) / 12)
+    if sigma == 0:
+        return 1.0
+    return _normal_sf((u - n1 * n2 / 2) / sigma)
+
+
+@dataclass(frozen=True)
+class Regression:
+    kind: str
+    key: str
+    baseline_ms: float
+    current_ms: float
+    p_value: float
+
+    def __str__(self):
+        ratio = f"x{self.current_ms / self.baseline_ms:.2f}" if self.baseline_ms else "from 0"
+        return (f"{self.kind} {self.key}: median {self.baseline_ms:.1f} -> {self.current_ms:.1f} ms "
+                f"({ratio}, p={self.p_value:.4f})")
+
+
+class BaselineStore:
+    """SQLite-backed history of per-test and per-endpoint latency."""
+
+    def __init__(self, path: str | Path = DEFAULT_BASELINE_DB):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(self.path)
+        self._db.executescript(_SCHEMA)
+        if "selection" not in {row[1] for row in self._db.execute("PRAGMA table_info(runs)")}:
+            # stores created before runs were keyed by selection; their runs never form a baseline
+            self._db.execute("ALTER TABLE runs ADD COLUMN selection TEXT")
+
+    def close(self):
+        self._db.close()
+
+    def record_run(self, test_durations: dict[str, float], endpoint_samples: dict[str, list[float]],
+                   selection: Optional[str] = None) -> int:
+        """Store one session's measurements and return the new run id.
+        `selection` (see `selection_key`) defaults to the key of the tests in `test_durations`.
+        """
+        if selection is None:
+            selection = selection_key(test_durations)
+        with self._db:
+            run_id = self._db.execute(
+                "INSERT INTO runs (started_at, selection) VALUES (?, ?)",
+                (datetime.now(timezone.utc).isoformat(), selection),
+            ).lastrowid
+            self._db.executemany(
+                "INSERT INTO test_durations VALUES (?, ?, ?)",
+                ((run_id, test_id, ms) for test_id, ms in test_durations.items()),
+            )
+            self._db.executemany(
+                "INSERT INTO endpoint_samples VALUES (?, ?, ?)",
+                ((run_id, endpoint, ms) for endpoint, samples in endpoint_samples.items() for ms in samples),
+            )
+        return run_id
+
+    def latest_run_id(self) -> Optional[int]:
+        return self._db.execute("SELECT MAX(id) FROM runs").fetchone()[0]
+
+    def _baseline_run_ids(self, run_id: int, window: int) -> list[int]:
+        rows = self._db.execute(
+            """
+            SELECT id FROM runs WHERE id < ? AND selection = (SELECT selection FROM runs WHERE id = ?)
+            ORDER BY id DESC LIMIT ?
+            """,
+            (run_id, run_id, window),
+        ).fetchall()
+        return [row[0] for row in rows]
+
+    def _test_durations(self, run_ids: list[int]) -> dict[str, list[float]]:
+        durations = defaultdict(list)
+        query = f"SELECT test_id, duration_ms FROM test_durations WHERE run_id IN ({','.join('?' * len(run_ids))})"
+        for test_id, ms in self._db.execute(query, run_ids):
+            durations[test_id].append(ms)
+        return durations
+
+    def _endpoint_samples(self, run_ids: list[int]) -> dict[str, list[float]]:
+        samples = defaultdict(list)
+        query = f"SELECT endpoint, elapsed_ms FROM endpoint_samples WHERE run_id IN ({','.join('?' * len(run_ids))})"
+        for endpoint, ms in self._db.execute(query, run_ids):
+            samples[endpoint].append(ms)
+        return samples
+
+    def compare(
+            self,
+            run_id: int,
+            window: int = 10,
+            alpha: float = 0.01,
+            min_ratio: float = 1.2,
+            min_delta_ms: float = 5.0,
+            min_runs: int = 3,
+    ) -> list[Regression]:
+        """Flag tests and endpoints of `run_id` that are significantly slower than the rolling baseline.
+        A slowdown also has to exceed both `min_ratio` and `min_delta_ms` to count as a regression.
+        """
+
+        def slower(current_ms: float, baseline_ms: float) -> bool:
+            return current_ms > baseline_ms * min_ratio and current_ms - baseline_ms > min_delta_ms
+
+        baseline_ids = self._baseline_run_ids(run_id, window)
+        if len(baseline_ids) < min_runs:
+            return []
+        regressions = []
+        baseline_tests = self._test_durations(baseline_ids)
+        for test_id, (current,) in self._test_durations([run_id]).items():
+            history = baseline_tests.get(test_id, [])
+            if len(history) < min_runs:
+                continue
+            p_value = z_test_p_value(current, history)
+            if p_value < alpha and slower(current, median(history)):
+                regressions.append(Regression("test", test_id, median(history), current, p_value))
+        baseline_endpoints = self._endpoint_samples(baseline_ids)
+        for endpoint, current in self._endpoint_samples([run_id]).items():
+            history = baseline_endpoints.get(endpoint, [])
+            if len(history) < min_runs or len(current) < 2:
+                continue
+            p_value = mann_whitney_p_value(current, history)
+            if p_value < alpha and slower(median(current), median(history)):
+                regressions.append(Regression("endpoint", endpoint, median(history), median(current), p_value))
+        return regressions
+
+    def trend(self, pattern: str, limit: int = 20) -> dict[str, list[tuple[int, str, float]]]:
+        """Per-run duration of tests (and median latency of endpoints) whose id contains `pattern`."""
+        like = f"%{pattern}%"
+        rows = self._db.execute(
+            """
+            SELECT test_id, run_id, started_at, duration_ms FROM test_durations JOIN runs ON runs.id = run_id
+            WHERE test_id LIKE ? AND run_id IN (SELECT id FROM runs ORDER BY id DESC LIMIT ?)
+            """,
+            (like, limit),
+        ).fetchall()
+        trends = defaultdict(list)
+        for key, run_id, started_at, ms in rows:
+            trends[key].append((run_id, started_at, ms))
+        rows = self._db.execute(
+            """
+            SELECT endpoint, run_id, started_at, elapsed_ms FROM endpoint_samples JOIN runs ON runs.id = run_id
+            WHERE endpoint LIKE ? AND run_id IN (SELECT id FROM runs ORDER BY id DESC LIMIT ?)
+            """,
+            (like, limit),
+        ).fetchall()
+        per_run = defaultdict(list)
+        for key, run_id, started_at, ms in rows:
+            per_run[(key, run_id, started_at)].append(ms)
+        for (key, run_id, started_at), samples in per_run.items():
+            trends[key].append((run_id, started_at, median(samples)))
+        return {key: sorted(points) for key, points in sorted(trends.items())}
+
+
+_SPARK = "▁▂▃▄▅▆▇█"
+
+
+def _sparkline(values: list[float]) -> str:
+    low, high = min(values), max(values)
+    span = (high - low) or 1
+    return "".join(_SPARK[int((v - low) / span * (len(_SPARK) - 1))] for v in values)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Inspect the performance baseline store.")
+    parser.add_argument("--db", default=DEFAULT_BASELINE_DB, help=f"baseline database (default: {DEFAULT_BASELINE_DB})")
+    commands = parser.add_subparsers(dest="command", required=True)
+    trend = commands.add_parser("trend", help="per-run latency of tests/endpoints whose id contains PATTERN")
+    trend.add_argument("pattern", nargs="?", default="")
+    trend.add_argument("--limit", type=int, default=20, help="number of most recent runs")
+    compare = commands.add_parser("compare", help="compare a run (default: latest) with the rolling baseline")
+    compare.add_argument("--run", type=int)
+    compare.add_argument("--window", type=int, default=10)
+    compare.add_argument("--alpha", type=float, default=0.01)
+    args = parser.parse_args(argv)
+
+    store = BaselineStore(args.db)
+    try:
+        if args.command == "trend":
+            for key, points in store.trend(args.pattern, args.limit).items():
+                values = [ms for _, _, ms in points]
+                print(f"{key}\n  {_sparkline(values)}  last {values[-1]:.1f} ms, "
+                      f"median {median(values):.1f} ms over {len(values)} runs")
+                for run_id, started_at, ms in points:
+                    print(f"    run {run_id:<5} {started_at}  {ms:9.1f} ms")
+            return 0
+        run_id = args.run or store.latest_run_id()
+        if run_id is None:
+            print("No runs recorded yet")
+            return 0
+        regressions = store.compare(run_id, window=args.window, alpha=args.alpha)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if not regressions:
+            print(f"No regressions in run {run_id}")
+        return 1 if regressions else 0
+    finally:
+        store.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
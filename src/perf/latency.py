@@ -0,0 +1,65 @@
+import re
+import threading
+from collections import defaultdict
+from typing import Iterable, NamedTuple
+
+from src.perf.stats import LatencySummary
+
+_ID_SEGMENT = re.compile(r"/\d+(?=/|$)")
+
+
+def path_template(path: str) -> str:
+    """Collapse numeric path segments so '/user/42' and '/user/7' share the '/user/{id}' template."""
+    path = "/" + path.split("?", 1)[0].lstrip("/")
+    return _ID_SEGMENT.sub("/{id}", path)
+
+
+class RequestSample(NamedTuple):
+    method: str
+    path: str
+    status: int
+    elapsed_ms: float
+
+
+class LatencyRecorder:
+    """Thread-safe, process-wide buffer of API request timings.
+    Disabled until enabled (the pytest plugin does), so standalone tools don't buffer samples.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self._samples: list[RequestSample] = []
+        self._lock = threading.Lock()
+
+    def record(self, method: str, path: str, status: int, elapsed_ms: float):
+        if not self.enabled:
+            return
+        sample = RequestSample(method, path_template(path), status, elapsed_ms)
+        with self._lock:
+            self._samples.append(sample)
+
+    def drain(self) -> list[RequestSample]:
+        """Return and forget everything recorded so far."""
+        with self._lock:
+            samples, self._samples = self._samples, []
+        return samples
+
+
+latency_recorder = LatencyRecorder()
+
+
+def aggregate(samples: Iterable[RequestSample]) -> dict[str, dict]:
+    """Per-endpoint ('GET /user/') latency statistics plus a count per status code."""
+    latencies: dict[str, list[float]] = defaultdict(list)
+    statuses: dict[str, dict[int, int]] = defaultdict(lambda: defaultdict(int))
+    for method, path, status, elapsed_ms in samples:
+        endpoint = f"{method} {path}"
+        latencies[endpoint].append(elapsed_ms)
+        statuses[endpoint][status] += 1
+    return {
+        endpoint: {
+            **LatencySummary.from_samples(values).as_dict(),
+            "statuses": {str(code): count for code, count in sorted(statuses[endpoint].items())},
+        }
+        for endpoint, values in sorted(latencies.items())
+    }
@@ -0,0 +1,229 @@
+"""Load/throughput mode for the /user/ endpoints.
+
+Drives the POST/GET/PUT/PATCH/DELETE mix of test_end_2_end_api through UserApiClient,
+either as fast as N workers allow or at a fixed iteration rate, for a fixed duration.
+
+    python -m src.perf.load --duration 30 --concurrency 8 --p95-ms 200
+    python -m src.perf.load --duration 30 --rate 20 --base-url http://localhost:3003/
+
+Exits with status 1 when the p95 latency or error rate thresholds are exceeded.
+"""
+import argparse
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+from dotenv import load_dotenv
+
+from src.models.factories.user_pool import UserDataPool
+from src.models.factories.users import user_test_data_to_payload
+from src.perf.stats import LatencySummary, histogram
+from src.wrappers.http_transport import PoolStats, pool_stats, session_registry
+from src.wrappers.user_api_client import UserApiClient
+
+log = logging.getLogger(__name__)
+
+
+@dataclass
+class LoadResult:
+    """Raw samples of a load run, per operation."""
+    duration_s: float = 0.0
+    iterations: int = 0
+    failed_iterations: int = 0
+    latencies_ms: dict[str, list[float]] = field(default_factory=lambda: defaultdict(list))
+    errors: dict[str, int] = field(default_factory=lambda: defaultdict(int))
+    pool: dict = field(default_factory=lambda: PoolStats.summarize(0, 0))
+
+    @property
+    def requests(self) -> int:
+        return sum(len(samples) for samples in self.latencies_ms.values())
+
+    @property
+    def error_rate(self) -> float:
+        return sum(self.errors.values()) / self.requests if self.requests else 0.0
+
+    def summary(self, op: Optional[str] = None) -> LatencySummary:
+        if op is not None:
+            return LatencySummary.from_samples(self.latencies_ms[op])
+        return LatencySummary.from_samples(v for samples in self.latencies_ms.values() for v in samples)
+
+    def as_dict(self) -> dict:
+        return {
+            "duration_s": round(self.duration_s, 2),
+            "iterations": self.iterations,
+            "failed_iterations": self.failed_iterations,
+            "requests": self.requests,
+            "throughput_rps": round(self.requests / self.duration_s, 2) if self.duration_s else 0.0,
+            "error_rate": round(self.error_rate, 4),
+            "overall": self.summary().as_dict(),
+            "pool": self.pool,
+            "operations": {
+                op: {
+                    **self.summary(op).as_dict(),
+                    "errors": self.errors[op],
+                    "histogram_ms": histogram(samples),
+                }
+                for op, samples in self.latencies_ms.items()
+            },
+        }
+
+
+class LoadRunner:
+    """Runs the end-to-end user scenario repeatedly and collects per-operation latency."""
+
+    def __init__(self, client: UserApiClient, concurrency: int = 4, rate: Optional[float] = None,
+                 users: Optional[UserDataPool] = None):
+        self.client = client
+        self.concurrency = concurrency
+        self.rate = rate
+        self.users = users or UserDataPool(background="thread")
+        self.result = LoadResult()
+        self._lock = threading.Lock()
+        self._next_slot = 0
+
+    def _timed(self, op: str, call: Callable, expected: int):
+        start = time.perf_counter()
+        try:
+            resp = call()
+        except Exception as e:
+            log.debug("%s raised %r", op, e)
+            resp = None
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        with self._lock:
+            self.result.latencies_ms[op].append(elapsed_ms)
+            if resp is None or resp.status_code != expected:
+                self.result.errors[op] += 1
+        return resp
+
+    def _iteration(self):
+        """One pass of the test_end_2_end_api request mix."""
+        payload = user_test_data_to_payload(self.users.pop())
+        created = self._timed("POST /user/", lambda: self.client.post("/user/", json=payload), 201)
+        if created is None or created.status_code != 201:
+            self._fail_iteration()
+            return
+        try:
+            uid = created.json()["id"]
+        except (ValueError, KeyError, TypeError) as e:
+            log.debug("POST /user/ returned no usable id: %r", e)
+            self._fail_iteration("POST /user/")
+            return
+        params = {"id": uid}
+        self._timed("GET /user/?id", lambda: self.client.get("/user/", params=params), 200)
+        self._timed("PUT /user/{id}", lambda: self.client.put(f"/user/{uid}", json=payload), 200)
+        patch = {**payload, "email": f"updated{uid}@email.com"}
+        self._timed("PATCH /user/{id}", lambda: self.client.patch(f"/user/{uid}", json=patch), 200)
+        self._timed("DELETE /user/{id}", lambda: self.client.delete_user(uid), 200)
+
+    def _fail_iteration(self, op: Optional[str] = None):
+        """Count an iteration that could not go on; `op` also counts as an error for a bad response body."""
+        with self._lock:
+            self.result.failed_iterations += 1
+            if op is not None:
+                self.result.errors[op] += 1
+
+    def _wait_for_slot(self, started: float):
+        """With a target rate, hand out evenly spaced start times across all workers."""
+        if not self.rate:
+            return
+        with self._lock:
+            slot = started + self._next_slot / self.rate
+            self._next_slot += 1
+        delay = slot - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+
+    def _worker(self, started: float, deadline: float):
+        while True:
+            self._wait_for_slot(started)
+            if time.perf_counter() >= deadline:
+                return
+            self._iteration()
+            with self._lock:
+                self.result.iterations += 1
+
+    def run(self, duration_s: float) -> LoadResult:
+        pool_stats.drain()
+        started = time.perf_counter()
+        deadline = started + duration_s
+        with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="load") as executor:
+            for future in [executor.submit(self._worker, started, deadline) for _ in range(self.concurrency)]:
+                future.result()
+        self.result.duration_s = time.perf_counter() - started
+        self.result.pool = PoolStats.summarize(*pool_stats.drain())
+        self.users.close()
+        self.client.cleanup_created_users()
+        return self.result
+
+
+def print_report(result: LoadResult, out=sys.stdout):
+    report = result.as_dict()
+    out.write(f"duration {report['duration_s']} s, {report['iterations']} iterations "
+              f"({report['failed_iterations']} failed), "
+              f"{report['requests']} requests, {report['throughput_rps']} req/s, "
+              f"error rate {report['error_rate']:.2%}\n")
+    out.write(f"{'operation':<20}{'count':>7}{'errors':>7}{'p50':>9}{'p95':>9}{'p99':>9}{'max':>9}\n")
+    for op, stats in report["operations"].items():
+        out.write(f"{op:<20}{stats['count']:>7}{stats['errors']:>7}"
+                  f"{stats['p50']:>9.1f}{stats['p95']:>9.1f}{stats['p99']:>9.1f}{stats['max']:>9.1f}\n")
+    overall = report["overall"]
+    out.write(f"{'overall':<20}{overall['count']:>7}{'':>7}"
+              f"{overall['p50']:>9.1f}{overall['p95']:>9.1f}{overall['p99']:>9.1f}{overall['max']:>9.1f}\n")
+    pool = report["pool"]
+    out.write(f"connections: {pool['new_connections']} opened for {pool['requests']} requests, "
+              f"reuse rate {pool['reuse_rate']:.1%}\n")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Load/throughput run against the /user/ endpoints.")
+    parser.add_argument("--duration", type=float, default=30, help="run length in seconds")
+    parser.add_argument("--concurrency", type=int, default=4, help="parallel workers")
+    parser.add_argument("--rate", type=float, help="target scenario iterations per second (default: unthrottled)")
+    parser.add_argument("--base-url", help="API base URL (default: API_BASE_URL)")
+    parser.add_argument("--p95-ms", type=float, help="fail when overall p95 latency exceeds this")
+    parser.add_argument("--max-error-rate", type=float, default=0.0, help="fail above this error ratio (0-1)")
+    parser.add_argument("--seed", type=int, help="seed for generated user payloads (default: TEST_SEED env or random)")
+    parser.add_argument("--events-file", help="write JSON-lines request events to this path")
+    parser.add_argument("--log-sample-rate", type=float, help="share of requests written as events (default: 1.0)")
+    parser.add_argument("--json", dest="json_path", help="also write the report as JSON to this path")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING)
+    load_dotenv()
+    if args.base_url:
+        os.environ["API_BASE_URL"] = args.base_url
+    if args.events_file:
+        os.environ["API_EVENTS_FILE"] = args.events_file
+    if args.log_sample_rate is not None:
+        os.environ["API_LOG_SAMPLE_RATE"] = str(args.log_sample_rate)
+    os.environ["API_POOL_MAXSIZE"] = str(max(int(os.getenv("API_POOL_MAXSIZE", "10")), args.concurrency))
+
+    seed = args.seed if args.seed is not None else (int(os.environ["TEST_SEED"]) if os.getenv("TEST_SEED") else None)
+    users = UserDataPool(seed=seed, background="thread")
+    result = LoadRunner(UserApiClient(), concurrency=args.concurrency, rate=args.rate, users=users).run(args.duration)
+    session_registry.close_all()
+    print_report(result)
+    if args.json_path:
+        with open(args.json_path, "w") as report_file:
+            json.dump(result.as_dict(), report_file, indent=2)
+
+    failed = False
+    p95 = result.summary().p95
+    if args.p95_ms is not None and p95 > args.p95_ms:
+        print(f"FAIL: p95 {p95:.1f} ms exceeds threshold {args.p95_ms} ms")
+        failed = True
+    if result.error_rate > args.max_error_rate:
+        print(f"FAIL: error rate {result.error_rate:.2%} exceeds threshold {args.max_error_rate:.2%}")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,168 @@
+"""Pytest plugin aggregating API latency across the whole test session.
+
+Requests recorded by the API clients are attached to each test's teardown report, so the
+numbers survive xdist workers, and are aggregated in the controller at session end into
+the pytest-html report, the terminal summary and a JSON file. The session's test durations and
+latency samples are also added to the baseline store and compared with previous runs.
+"""
+import json
+import logging
+from pathlib import Path
+
+import pytest
+
+from src.perf.baseline import DEFAULT_BASELINE_DB, BaselineStore, Regression, selection_key
+from src.perf.latency import RequestSample, aggregate, latency_recorder
+from src.wrappers.http_transport import PoolStats, pool_stats
+
+log = logging.getLogger(__name__)
+
+LATENCY_PROPERTY = "api_latency"
+POOL_PROPERTY = "api_pool"
+DEFAULT_LATENCY_JSON = ".perf/api_latency.json"
+
+# samples gathered from test reports; filled in the controller (or the only process without xdist)
+_collected: list[RequestSample] = []
+_test_durations_ms: dict[str, float] = {}
+# every test that ran, whatever its outcome: keys the baseline run
+_ran_test_ids: set[str] = set()
+_regressions: list[Regression] = []
+# requests sent and connections opened by the API clients' shared transport
+_pool_counts = [0, 0]
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("api latency")
+    group.addoption(
+        "--latency-json",
+        default=DEFAULT_LATENCY_JSON,
+        help=f"where to write per-endpoint API latency statistics (default: {DEFAULT_LATENCY_JSON})",
+    )
+    group.addoption(
+        "--perf-baseline",
+        default=DEFAULT_BASELINE_DB,
+        help=f"SQLite baseline store for regression detection (default: {DEFAULT_BASELINE_DB})",
+    )
+    group.addoption("--no-perf-baseline", action="store_true", help="do not record or compare against the baseline")
+    group.addoption("--perf-window", type=int, default=10, help="number of previous runs forming the baseline")
+    group.addoption(
+        "--perf-fail-on-regression",
+        action="store_true",
+        help="fail the session when a latency regression against the baseline is detected",
+    )
+
+
+def pytest_configure(config):
+    latency_recorder.enabled = True
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    if call.when == "teardown":
+        samples = latency_recorder.drain()
+        if samples:
+            item.user_properties.append((LATENCY_PROPERTY, [tuple(sample) for sample in samples]))
+        requests_sent, new_connections = pool_stats.drain()
+        if requests_sent:
+            item.user_properties.append((POOL_PROPERTY, (requests_sent, new_connections)))
+    yield
+
+
+def pytest_runtest_logreport(report):
+    _ran_test_ids.add(report.nodeid)
+    if report.when == "call" and report.passed:
+        _test_durations_ms[report.nodeid] = report.duration * 1000
+    if report.when != "teardown":
+        return
+    for name, value in report.user_properties:
+        if name == LATENCY_PROPERTY:
+            _collected.extend(RequestSample(*sample) for sample in value)
+        elif name == POOL_PROPERTY:
+            _pool_counts[0] += value[0]
+            _pool_counts[1] += value[1]
+
+
+def _endpoint_stats() -> dict[str, dict]:
+    return aggregate(_collected)
+
+
+def pytest_sessionfinish(session):
+    if hasattr(session.config, "workerinput"):
+        return
+    if _collected:
+        path = Path(session.config.getoption("latency_json"))
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({"endpoints": _endpoint_stats(), "pool": PoolStats.summarize(*_pool_counts)},
+                                   indent=2))
+        log.info(f"API latency statistics written to {path}")
+    _compare_with_baseline(session)
+
+
+def _compare_with_baseline(session):
+    config = session.config
+    if config.getoption("no_perf_baseline") or not _test_durations_ms:
+        return
+    if config.getoption("api_cassettes", default="off") in ("replay", "strict"):
+        log.info("Replayed API traffic is not recorded in the perf baseline")
+        return
+    if config.getoption("stub_api", default=False):
+        log.info("Traffic to the Users API stub is not recorded in the perf baseline")
+        return
+    endpoint_samples: dict[str, list[float]] = {}
+    for sample in _collected:
+        endpoint_samples.setdefault(f"{sample.method} {sample.path}", []).append(sample.elapsed_ms)
+    store = BaselineStore(config.getoption("perf_baseline"))
+    try:
+        run_id = store.record_run(_test_durations_ms, endpoint_samples, selection_key(_ran_test_ids))
+        _regressions.extend(store.compare(run_id, window=config.getoption("perf_window")))
+    finally:
+        store.close()
+    # never mask an interrupted or otherwise failed session
+    if _regressions and config.getoption("perf_fail_on_regression") and session.exitstatus == pytest.ExitCode.OK:
+        session.exitstatus = pytest.ExitCode.TESTS_FAILED
+
+
+def pytest_terminal_summary(terminalreporter):
+    if _regressions:
+        terminalreporter.section("performance regressions against baseline", red=True)
+        for regression in _regressions:
+            terminalreporter.write_line(str(regression))
+    if not _collected:
+        return
+    terminalreporter.section("api latency (ms)")
+    terminalreporter.write_line(
+        f"{'endpoint':<28}{'count':>7}{'min':>9}{'mean':>9}{'p50':>9}{'p95':>9}{'p99':>9}{'max':>9}"
+    )
+    for endpoint, stats in _endpoint_stats().items():
+        terminalreporter.write_line(
+            f"{endpoint:<28}{stats['count']:>7}{stats['min']:>9.1f}{stats['mean']:>9.1f}{stats['p50']:>9.1f}"
+            f"{stats['p95']:>9.1f}{stats['p99']:>9.1f}{stats['max']:>9.1f}"
+        )
+    if _pool_counts[0]:
+        pool = PoolStats.summarize(*_pool_counts)
+        terminalreporter.write_line(
+            f"connections (UserApiClient only): {pool['requests']} requests, {pool['new_connections']} new connections, "
+            f"reuse rate {pool['reuse_rate']:.1%}"
+        )
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_html_results_summary(prefix, summary, postfix):
+    if not _collected:
+        return
+    rows = "".join(
+        f"<tr><td>{endpoint}</td><td>{stats['count']}</td><td>{stats['min']}</td><td>{stats['mean']}</td>"
+        f"<td>{stats['p50']}</td><td>{stats['p95']}</td><td>{stats['p99']}</td><td>{stats['max']}</td>"
+        f"<td>{', '.join(f'{code}: {n}' for code, n in stats['statuses'].items())}</td></tr>"
+        for endpoint, stats in _endpoint_stats().items()
+    )
+    prefix.append(
+        "<h2>API latency (ms)</h2><table><tr><th>Endpoint</th><th>Count</th><th>Min</th><th>Mean</th>"
+        f"<th>p50</th><th>p95</th><th>p99</th><th>Max</th><th>Statuses</th></tr>{rows}</table>"
+    )
+    if _pool_counts[0]:
+        pool = PoolStats.summarize(*_pool_counts)
+        prefix.append(
+            f"<p>Connections (UserApiClient only): {pool['requests']} requests, {pool['new_connections']} new connections, "
+            f"reuse rate {pool['reuse_rate']:.1%}</p>"
+        )
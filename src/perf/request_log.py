@@ -0,0 +1,84 @@
+"""JSON-lines request events from the API clients, for log shippers and ad-hoc analysis.
+
+Events go to the `api.events` logger, which does not propagate to the test log; nothing is built
+or formatted until a handler is attached (API_EVENTS_FILE or `log_events_to`). A share of requests
+(API_LOG_SAMPLE_RATE, default 1.0) is emitted, which keeps high-volume load runs cheap:
+
+    {"ts": 1718000000.123, "method": "GET", "path": "/user/", "status": 200, "bytes": 512, "elapsed_ms": 4.2}
+
+With the logger at DEBUG, sampled events also carry a short decoded preview of the body.
+"""
+import json
+import logging
+import os
+import random
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+from src.perf.latency import path_template
+
+event_log = logging.getLogger("api.events")
+event_log.propagate = False
+
+BODY_PREVIEW_BYTES = 300
+
+_files: dict[Path, logging.Handler] = {}
+_files_lock = threading.Lock()
+
+
+class _JsonEvent:
+    """Serialized only when a handler formats the record."""
+    __slots__ = ("fields",)
+
+    def __init__(self, fields: dict):
+        self.fields = fields
+
+    def __str__(self) -> str:
+        return json.dumps(self.fields, separators=(",", ":"))
+
+
+def log_events_to(path: str | os.PathLike) -> logging.Handler:
+    """Append events as JSON lines to a file; attaching the same file twice is a no-op."""
+    path = Path(path).resolve()
+    with _files_lock:
+        handler = _files.get(path)
+        if handler is None:
+            handler = logging.FileHandler(path, encoding="utf-8")
+            handler.setFormatter(logging.Formatter("%(message)s"))
+            event_log.addHandler(handler)
+            if event_log.level == logging.NOTSET or event_log.level > logging.INFO:
+                event_log.setLevel(logging.INFO)
+            _files[path] = handler
+    return handler
+
+
+class RequestEventLog:
+    """Per-client sampler and emitter of request events."""
+
+    def __init__(self, sample_rate: Optional[float] = None):
+        self.sample_rate = float(os.getenv("API_LOG_SAMPLE_RATE", "1.0")) if sample_rate is None else sample_rate
+        self._random = random.Random()
+        events_file = os.getenv("API_EVENTS_FILE")
+        if events_file:
+            log_events_to(events_file)
+
+    def sampled(self) -> bool:
+        """Cheap gate checked before an event is built."""
+        if not (event_log.handlers and event_log.isEnabledFor(logging.INFO)):
+            return False
+        return self.sample_rate >= 1 or self._random.random() < self.sample_rate
+
+    def emit(self, method: str, path: str, status: int, content: bytes, elapsed_ms: float):
+        fields = {
+            "ts": round(time.time(), 3),
+            "method": method,
+            "path": path_template(path),
+            "status": status,
+            "bytes": len(content),
+            "elapsed_ms": round(elapsed_ms, 3),
+        }
+        if event_log.isEnabledFor(logging.DEBUG):
+            fields["body"] = content[:BODY_PREVIEW_BYTES].decode("utf-8", errors="replace")
+        event_log.info("%s", _JsonEvent(fields))
@@ -0,0 +1,39 @@
+import logging
+import os
+import time
+from typing import Optional
+
+from src.models.factories.users import build_user, user_test_data_to_payload
+from src.models.user_model import UserModel
+from src.models.validators import get_type_adapter
+
+log = logging.getLogger(__name__)
+
+
+def seed_user(api_client, overrides: dict | None = None) -> UserModel:
+    """Create a user through the API as a test precondition; api_client cleanup deletes it."""
+    payload = user_test_data_to_payload(build_user(overrides))
+    created = api_client.create_user_for_test(payload)
+    log.info(f"..Seeded user id={created['id']} through the API")
+    return UserModel.model_validate(created)
+
+
+def fetch_user(api_client, uid: int) -> Optional[UserModel]:
+    """Return the current state of a user from the API, or None if it does not exist."""
+    resp = api_client.get("/user/", params={"id": uid})
+    if resp.status_code == 404:
+        return None
+    users = get_type_adapter(UserModel, many=True).validate_json(resp.content)
+    return users[0] if users else None
+
+
+def wait_for_user_change(api_client, before: UserModel, timeout: Optional[float] = None) -> Optional[UserModel]:
+    """Poll the API until the user differs from `before` (e.g. a UI save landed) and return its latest state.
+    Returns the unchanged state once the timeout passes.
+    """
+    deadline = time.monotonic() + (timeout or int(os.getenv("DEFAULT_TIMEOUT") or 10))
+    while True:
+        current = fetch_user(api_client, before.id)
+        if current != before or time.monotonic() >= deadline:
+            return current
+        time.sleep(0.2)
@@ -0,0 +1,293 @@
+"""In-process stand-in for the Users API (`/user/`), for hermetic load runs and client benchmarks.
+
+Endpoints:
+    GET    /user/[?id=1&id=2]   200, list of users (all users without `id`, [] when none match),
+                                400 with an empty list on a malformed id; with `missing_status=404`,
+                                404 when any requested id does not exist
+    POST   /user/               201 with the created user (including its new id)
+    PUT    /user/{id}           200 full replace, PATCH /user/{id} 200 partial update, 404 unknown id
+    DELETE /user/{id}           200 with the deleted user, 404 unknown id
+Payloads with wrong types get 422, invalid values (blank name/username, bad email/phone) get 400,
+other errors a `{"detail": ...}` body. Latency, jitter and an error rate (503 responses) can be injected.
+
+This is not the full contract of tests/test_api.py: a few of its cases contradict each other or
+validate error bodies as users. `pytest --stub-api` marks those as expected failures
+(STUB_API_KNOWN_DIFFERENCES in conftest.py).
+
+    python -m src.stubs.users_api_stub --port 3003 --latency-ms 5 --jitter-ms 2 --error-rate 0.01
+"""
+import argparse
+import json
+import logging
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Optional
+from urllib.parse import parse_qs, urlsplit
+
+log = logging.getLogger(__name__)
+
+USER_FIELDS = ("name", "username", "email", "phone")
+EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+PHONE_RE = re.compile(r"^\+?[0-9 ().\-]{7,}(x[0-9]+)?$")
+
+
+class StubValidationError(Exception):
+    def __init__(self, status: int, detail: str):
+        super().__init__(detail)
+        self.status = status
+        self.detail = detail
+
+
+def validate_user(payload: Any, partial: bool = False) -> dict:
+    """Return the user fields of a payload, or raise StubValidationError (422 types, 400 values)."""
+    if not isinstance(payload, dict):
+        raise StubValidationError(422, "Body must be a JSON object")
+    fields = {key: payload[key] for key in USER_FIELDS if key in payload}
+    missing = [key for key in USER_FIELDS if key not in fields]
+    if missing and not partial:
+        raise StubValidationError(422, f"Missing fields: {', '.join(missing)}")
+    for key, value in fields.items():
+        if not isinstance(value, str):
+            raise StubValidationError(422, f"{key!r} must be a string")
+    if not fields.get("name", "x").strip():
+        raise StubValidationError(400, "'name' must not be blank")
+    if not fields.get("username", "x").strip():
+        raise StubValidationError(400, "'username' must not be blank")
+    if "email" in fields and not EMAIL_RE.match(fields["email"]):
+        raise StubValidationError(400, "'email' is not a valid email address")
+    if "phone" in fields and not PHONE_RE.match(fields["phone"]):
+        raise StubValidationError(400, "'phone' is not a valid phone number")
+    return fields
+
+
+def parse_id(raw: str) -> int:
+    raw = raw.strip()
+    if not raw.isdigit() or int(raw) < 1:
+        raise StubValidationError(400, f"Invalid user id: {raw!r}")
+    return int(raw)
+
+
+class UserStore:
+    """Thread-safe in-memory users, indexed by id (ids are never reused)."""
+
+    def __init__(self):
+        self._users: dict[int, dict] = {}
+        self._next_id = 1
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._users)
+
+    def all(self) -> list[dict]:
+        with self._lock:
+            return list(self._users.values())
+
+    def get_many(self, ids: list[int]) -> list[dict]:
+        with self._lock:
+            users = self._users
+            return [users[uid] for uid in dict.fromkeys(ids) if uid in users]
+
+    def create(self, fields: dict) -> dict:
+        with self._lock:
+            user = {"id": self._next_id, **fields}
+            self._users[self._next_id] = user
+            self._next_id += 1
+        return user
+
+    def update(self, uid: int, fields: dict) -> Optional[dict]:
+        with self._lock:
+            current = self._users.get(uid)
+            if current is None:
+                return None
+            user = {**current, **fields, "id": uid}
+            self._users[uid] = user
+        return user
+
+    def delete(self, uid: int) -> Optional[dict]:
+        with self._lock:
+            return self._users.pop(uid, None)
+
+
+class UsersApiHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # buffer the status line, headers and body into one write, without Nagle delays on keep-alive
+    wbufsize = 64 * 1024
+    disable_nagle_algorithm = True
+    server: "UsersApiStub"
+
+    def log_message(self, format, *args):
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("%s - %s", self.address_string(), format % args)
+
+    def _send_json(self, status: int, body: Any):
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _read_body(self) -> bytes:
+        """Read the whole request body, so an early reply leaves no bytes for the next keep-alive request."""
+        length = int(self.headers.get("Content-Length") or 0)
+        return self.rfile.read(length) if length > 0 else b""
+
+    def _read_json(self) -> Any:
+        try:
+            return json.loads(self._body or b"null")
+        except ValueError:
+            raise StubValidationError(422, "Body is not valid JSON")
+
+    def _user_id(self) -> int:
+        path = urlsplit(self.path).path.rstrip("/")
+        prefix, _, raw = path.rpartition("/")
+        if prefix != "/user":
+            raise StubValidationError(404, f"Not found: {self.path}")
+        return parse_id(raw)
+
+    def _dispatch(self, handler):
+        self._body = self._read_body()
+        if not self.server.inject():
+            self._send_json(503, {"detail": "Injected error"})
+            return
+        try:
+            status, body = handler()
+        except StubValidationError as e:
+            status, body = e.status, {"detail": e.detail}
+        self._send_json(status, body)
+
+    def do_GET(self):
+        def handle():
+            url = urlsplit(self.path)
+            if url.path.rstrip("/") != "/user":
+                raise StubValidationError(404, f"Not found: {self.path}")
+            raw_ids = parse_qs(url.query, keep_blank_values=True).get("id")
+            if raw_ids is None:
+                return 200, self.server.store.all()
+            try:
+                ids = [parse_id(raw) for raw in raw_ids]
+            except StubValidationError as e:
+                # the list endpoint answers in its own shape, with nothing in it
+                return e.status, []
+            users = self.server.store.get_many(ids)
+            if self.server.missing_status == 404 and len(users) < len(set(ids)):
+                return 404, {"detail": "User not found"}
+            return 200, users
+        self._dispatch(handle)
+
+    def do_POST(self):
+        def handle():
+            if urlsplit(self.path).path.rstrip("/") != "/user":
+                raise StubValidationError(404, f"Not found: {self.path}")
+            return 201, self.server.store.create(validate_user(self._read_json()))
+        self._dispatch(handle)
+
+    def _update(self, partial: bool):
+        def handle():
+            uid = self._user_id()
+            user = self.server.store.update(uid, validate_user(self._read_json(), partial=partial))
+            return (200, user) if user else (404, {"detail": f"User {uid} not found"})
+        self._dispatch(handle)
+
+    def do_PUT(self):
+        self._update(partial=False)
+
+    def do_PATCH(self):
+        self._update(partial=True)
+
+    def do_DELETE(self):
+        def handle():
+            uid = self._user_id()
+            user = self.server.store.delete(uid)
+            return (200, user) if user else (404, {"detail": f"User {uid} not found"})
+        self._dispatch(handle)
+
+
+class UsersApiStub(ThreadingHTTPServer):
+    """
+    Threaded HTTP server backed by a UserStore; port 0 picks an ephemeral port.
+    Each request is delayed by `latency_ms` ± `jitter_ms` and fails with 503 at `error_rate`.
+    `missing_status` is the status of a GET by ids of which some do not exist (200 or 404).
+    """
+    daemon_threads = True
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, latency_ms: float = 0.0, jitter_ms: float = 0.0,
+                 error_rate: float = 0.0, initial_users: int = 5, seed: Optional[int] = None,
+                 missing_status: int = 200):
+        if missing_status not in (200, 404):
+            raise ValueError(f"missing_status must be 200 or 404, got {missing_status}")
+        super().__init__((host, port), UsersApiHandler)
+        self.missing_status = missing_status
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.store = UserStore()
+        self._random = random.Random(seed)
+        self._random_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        for i in range(1, initial_users + 1):
+            self.store.create({"name": f"Stub{i}", "username": f"stub_user{i}",
+                               "email": f"stub_user{i}@example.com", "phone": f"555-010-{i:04d}"})
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def inject(self) -> bool:
+        """Apply the configured delay; False when this request should fail."""
+        if not (self.latency_ms or self.jitter_ms or self.error_rate):
+            return True
+        with self._random_lock:
+            jitter = self._random.uniform(-self.jitter_ms, self.jitter_ms)
+            fail = self._random.random() < self.error_rate
+        delay_ms = max(0.0, self.latency_ms + jitter)
+        if delay_ms:
+            time.sleep(delay_ms / 1000)
+        return not fail
+
+    def start(self) -> "UsersApiStub":
+        """Serve from a daemon thread."""
+        self._thread = threading.Thread(target=self.serve_forever, name="users-api-stub", daemon=True)
+        self._thread.start()
+        log.info(f"Users API stub listening on {self.base_url}")
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Local stand-in for the Users API.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=3003, help="0 picks an ephemeral port")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="delay added to every request")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="random +/- variation of the delay")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of requests answered with 503 (0-1)")
+    parser.add_argument("--initial-users", type=int, default=5, help="users present at startup")
+    parser.add_argument("--seed", type=int, help="seed for injected jitter and errors")
+    parser.add_argument("--missing-status", type=int, choices=(200, 404), default=200,
+                        help="status of a GET by ids when some of them do not exist")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    server = UsersApiStub(args.host, args.port, args.latency_ms, args.jitter_ms, args.error_rate,
+                          args.initial_users, args.seed, args.missing_status)
+    log.info(f"Users API stub listening on {server.base_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
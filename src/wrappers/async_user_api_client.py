@@ -0,0 +1,170 @@
+import asyncio
+import logging
+import os
+from typing import Optional, Dict, Any, Iterable
+
+import httpx
+
+from src.perf.latency import latency_recorder
+from src.perf.request_log import RequestEventLog
+from src.wrappers.created_users import CleanupSummary, CreatedUsers
+from src.wrappers.id_journal import CreatedIdJournal
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncUserApiClient:
+    """Asyncio API client for User endpoints, mirroring UserApiClient on a pooled httpx.AsyncClient."""
+    def __init__(
+            self,
+            journal: Optional[CreatedIdJournal] = None,
+            *,
+            max_connections: Optional[int] = None,
+            max_keepalive_connections: Optional[int] = None,
+            keepalive_expiry: Optional[float] = None,
+    ):
+        self.base_url = (os.getenv('API_BASE_URL') or "").lower()
+        if not self.base_url:
+            raise ValueError("API_BASE_URL environment variable must be set")
+        self.base_url = self.base_url.rstrip("/")
+        self._timeout = int(os.getenv("API_TIMEOUT", "10"))
+        if max_connections is None:
+            max_connections = int(os.getenv("API_MAX_CONNECTIONS", "100"))
+        if max_keepalive_connections is None:
+            max_keepalive_connections = int(os.getenv("API_MAX_KEEPALIVE", "20"))
+        if keepalive_expiry is None:
+            keepalive_expiry = float(os.getenv("API_KEEPALIVE_EXPIRY", "5"))
+        self._max_connections = max_connections
+        limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.session = httpx.AsyncClient(
+            headers={"Content-Type": "application/json"},
+            limits=limits,
+            timeout=self._timeout,
+        )
+        self._created = CreatedUsers(self.base_url, journal)
+        self._events = RequestEventLog()
+
+    async def __aenter__(self) -> "AsyncUserApiClient":
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    async def aclose(self):
+        """Close pooled connections."""
+        await self.session.aclose()
+
+    def _url(self, path: str) -> str:
+        """Builds a full URL from base URL and relative path."""
+        return f"{self.base_url}/{path.lstrip('/')}"
+
+    async def get(self, path: str, params: Optional[Dict[str, Any]] = None) -> httpx.Response:
+        """Send a GET request with optional query parameters."""
+        url = self._url(path)
+        logger.info("GET %r params: %r", url, params)
+        resp = await self.session.get(url, params=params)
+        self._after_request("GET", path, resp)
+        return resp
+
+    async def post(self, path: str, json: Optional[Dict[str, Any]] = None) -> httpx.Response:
+        """Send a POST request with optional JSON body."""
+        url = self._url(path)
+        logger.info("POST %r json: %r", url, json)
+        resp = await self.session.post(url, json=json)
+        self._after_request("POST", path, resp)
+        self._track_created_id(resp)
+        return resp
+
+    async def put(self, path: str, json: Optional[Dict[str, Any]] = None) -> httpx.Response:
+        """Send a PUT request with optional JSON body."""
+        url = self._url(path)
+        logger.info("PUT %r json: %r", url, json)
+        resp = await self.session.put(url, json=json)
+        self._after_request("PUT", path, resp)
+        return resp
+
+    async def patch(self, path: str, json: Optional[Dict[str, Any]] = None) -> httpx.Response:
+        """Send a PATCH request with optional JSON body."""
+        url = self._url(path)
+        logger.info("PATCH %r json: %r", url, json)
+        resp = await self.session.patch(url, json=json)
+        self._after_request("PATCH", path, resp)
+        return resp
+
+    async def delete(self, path: str, id_resource: int) -> httpx.Response:
+        """Send a DELETE request for a resource ID."""
+        url = self._url(path + str(id_resource))
+        logger.info("DELETE %r", url)
+        resp = await self.session.delete(url)
+        self._after_request("DELETE", path + str(id_resource), resp)
+        return resp
+
+    def _after_request(self, method: str, path: str, resp: httpx.Response):
+        """Record latency and emit a (sampled) request event; the body is only decoded for DEBUG output."""
+        elapsed_ms = resp.elapsed.total_seconds() * 1000
+        self._record(method, path, resp.status_code, elapsed_ms)
+        if self._events.sampled():
+            self._events.emit(method, path, resp.status_code, resp.content, elapsed_ms)
+        logger.debug("Response %s for %s %s in %.1f ms", resp.status_code, method, path, elapsed_ms)
+
+    @staticmethod
+    def _record(method: str, path: str, status: int, elapsed_ms: float):
+        """Feed the session latency report, tagged by method, path template and status."""
+        latency_recorder.record(method, path, status, elapsed_ms)
+
+    async def create_user_for_test(self, payload):
+        resp = await self.post("/user/", json=payload)
+        assert resp.status_code == 201, f"Setup create failed: {resp.text}"
+        return resp.json()
+
+    async def create_users(self, payloads: Iterable[Dict[str, Any]], concurrency: Optional[int] = None) -> list[dict]:
+        """Create many users concurrently, returning the created bodies in input order."""
+        semaphore = asyncio.Semaphore(min(concurrency or self._max_connections, self._max_connections))
+
+        async def create(payload):
+            async with semaphore:
+                return await self.create_user_for_test(payload)
+
+        return list(await asyncio.gather(*(create(payload) for payload in payloads)))
+
+    async def cleanup_created_users(self, workers: Optional[int] = None) -> CleanupSummary:
+        """Delete all tracked created resources concurrently and report what happened to each id."""
+        logger.info("Context cleaning...")
+        ids = self._created.take()
+        if not ids:
+            return CleanupSummary()
+        semaphore = asyncio.Semaphore(min(workers or self._created.workers, self._max_connections))
+
+        async def delete(uid):
+            async with semaphore:
+                return await self._delete_with_retry(uid)
+
+        summary = self._created.summarize(ids, await asyncio.gather(*(delete(uid) for uid in ids)))
+        logger.info("Cleanup finished: %r", summary)
+        return summary
+
+    async def _delete_with_retry(self, uid: int) -> str:
+        """Delete one user, retrying transient failures with exponential backoff.
+        Returns the CleanupSummary field the id belongs to.
+        """
+        for attempt in range(self._created.retries + 1):
+            try:
+                resp = await self.delete("/user/", id_resource=uid)
+            except httpx.HTTPError as e:
+                logger.warning("Failed to delete %s (attempt %d): %s", uid, attempt + 1, e)
+            else:
+                outcome = self._created.delete_outcome(uid, resp.status_code, attempt)
+                if outcome:
+                    return outcome
+            delay = self._created.retry_delay(attempt)
+            if delay is not None:
+                await asyncio.sleep(delay)
+        return "failed"
+
+    def _track_created_id(self, resp: httpx.Response):
+        """Extract and store the id if response is 201 Created."""
+        self._created.track_response(resp.status_code, resp.json)
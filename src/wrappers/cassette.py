@@ -0,0 +1,219 @@
+"""Record/replay of UserApiClient HTTP traffic in gzip JSON cassettes (one per test).
+
+Modes:
+    off     - live requests, nothing recorded
+    record  - live requests; request/response pairs (with elapsed) are saved at the end of the test
+    replay  - served from the cassette without network; requests missing from it go to the live API
+    strict  - served from the cassette only; the body must match too, and unmatched requests fail
+
+Requests match on method and canonical URL (path and sorted query, so the host/port may differ
+between recording and replay). Replayed responses keep the recorded `elapsed`.
+"""
+import base64
+import gzip
+import json
+import logging
+import re
+import threading
+from datetime import timedelta
+from pathlib import Path
+from typing import Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+import requests
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from src.wrappers.http_transport import TransportAdapter
+
+logger = logging.getLogger(__name__)
+
+CASSETTE_MODES = ("off", "record", "replay", "strict")
+DEFAULT_CASSETTE_DIR = "tests/cassettes"
+CASSETTE_VERSION = 1
+
+
+class CassetteMissError(requests.RequestException):
+    """Raised in strict mode when a request has no recorded counterpart."""
+
+
+def canonical_url(url: str) -> str:
+    parts = urlsplit(url)
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return f"{parts.path}?{query}" if query else parts.path
+
+
+def canonical_body(body) -> Optional[str]:
+    if body is None:
+        return None
+    if isinstance(body, bytes):
+        body = body.decode("utf-8", errors="replace")
+    try:
+        return json.dumps(json.loads(body), sort_keys=True, separators=(",", ":"))
+    except ValueError:
+        return body
+
+
+def cassette_path(cassette_dir: str | Path, nodeid: str) -> Path:
+    """tests/test_api.py::test_x[param] -> <dir>/test_api/test_x[param].json.gz"""
+    module, _, name = nodeid.partition("::")
+    name = re.sub(r"[^\w.\-\[\]]+", "_", name.replace("::", "."))
+    return Path(cassette_dir) / Path(module).stem / f"{name}.json.gz"
+
+
+class Cassette:
+    """Interactions of one test; thread-safe so concurrent client calls can share it."""
+
+    def __init__(self, path: str | Path, mode: str = "replay", seed: Optional[int] = None):
+        if mode not in CASSETTE_MODES:
+            raise ValueError(f"Unsupported cassette mode: {mode!r}")
+        self.path = Path(path)
+        self.mode = mode
+        self.seed = seed
+        self.interactions: list[dict] = []
+        self._used: set[int] = set()
+        self._lock = threading.Lock()
+        if self.replaying:
+            self._load()
+
+    @property
+    def recording(self) -> bool:
+        return self.mode == "record"
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode in ("replay", "strict")
+
+    def _load(self):
+        try:
+            with gzip.open(self.path, "rt", encoding="utf-8") as cassette_file:
+                data = json.load(cassette_file)
+        except FileNotFoundError:
+            if self.mode == "strict":
+                raise CassetteMissError(f"No cassette recorded at {self.path}")
+            logger.warning(f"No cassette at {self.path}; requests will go to the live API")
+            return
+        self.seed = data.get("seed")
+        self.interactions = data["interactions"]
+
+    def save(self):
+        if not self.recording:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            data = {"version": CASSETTE_VERSION, "seed": self.seed, "interactions": self.interactions}
+        with gzip.open(self.path, "wt", encoding="utf-8") as cassette_file:
+            json.dump(data, cassette_file, separators=(",", ":"))
+        logger.info(f"Recorded {len(data['interactions'])} requests to {self.path}")
+
+    def record(self, response: requests.Response, *args, **kwargs) -> requests.Response:
+        """Response hook: store the exchange once requests has set the final `elapsed`."""
+        request = response.request
+        content = response.content
+        try:
+            body, encoding = content.decode("utf-8"), "utf-8"
+        except UnicodeDecodeError:
+            body, encoding = base64.b64encode(content).decode("ascii"), "base64"
+        interaction = {
+            "request": {
+                "method": request.method,
+                "url": canonical_url(request.url),
+                "body": canonical_body(request.body),
+            },
+            "response": {
+                "status": response.status_code,
+                "reason": response.reason,
+                "headers": dict(response.headers),
+                "body": body,
+                "encoding": encoding,
+                "elapsed_ms": response.elapsed.total_seconds() * 1000,
+            },
+        }
+        with self._lock:
+            self.interactions.append(interaction)
+        return response
+
+    def match(self, request: requests.PreparedRequest) -> Optional[dict]:
+        """
+        Next unused interaction with the same method, URL and body; outside strict mode falls back
+        to one with a different body, then to reusing the last match for repeated requests.
+        """
+        method, url, body = request.method, canonical_url(request.url), canonical_body(request.body)
+        with self._lock:
+            same_url = [i for i, recorded in enumerate(self.interactions)
+                        if recorded["request"]["method"] == method and recorded["request"]["url"] == url]
+            unused = [i for i in same_url if i not in self._used]
+            exact = [i for i in unused if self.interactions[i]["request"]["body"] == body]
+            if exact:
+                index = exact[0]
+            elif self.mode == "strict":
+                return None
+            elif unused:
+                index = unused[0]
+            elif same_url:
+                index = same_url[-1]
+            else:
+                return None
+            self._used.add(index)
+            return self.interactions[index]
+
+
+class CassetteAdapter(TransportAdapter):
+    """Transport adapter answering from a Cassette while replaying, otherwise sending live."""
+
+    def __init__(self, cassette: Cassette, **kwargs):
+        self.cassette = cassette
+        super().__init__(**kwargs)
+
+    def send(self, request: requests.PreparedRequest, **kwargs) -> requests.Response:
+        if self.cassette.replaying:
+            interaction = self.cassette.match(request)
+            if interaction is not None:
+                return self._build_response(request, interaction["response"])
+            if self.cassette.mode == "strict":
+                raise CassetteMissError(
+                    f"No recorded {request.method} {canonical_url(request.url)} in {self.cassette.path}",
+                    request=request,
+                )
+            logger.warning(f"No recorded {request.method} {request.url}; sending it live")
+        return super().send(request, **kwargs)
+
+    def _build_response(self, request: requests.PreparedRequest, recorded: dict) -> requests.Response:
+        response = requests.Response()
+        response.status_code = recorded["status"]
+        response.reason = recorded["reason"]
+        response.headers = CaseInsensitiveDict(recorded["headers"])
+        response.encoding = get_encoding_from_headers(response.headers)
+        body = recorded["body"]
+        response._content = base64.b64decode(body) if recorded["encoding"] == "base64" else body.encode("utf-8")
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        response.cassette_elapsed = timedelta(milliseconds=recorded["elapsed_ms"])
+        return response
+
+
+def is_replayed(response: requests.Response) -> bool:
+    """True when the response was served from a cassette rather than the live API."""
+    return getattr(response, "cassette_elapsed", None) is not None
+
+
+def restore_elapsed(response: requests.Response, *args, **kwargs) -> requests.Response:
+    """Response hook: requests overwrites `elapsed` after the adapter returns; put the recorded one back."""
+    recorded = getattr(response, "cassette_elapsed", None)
+    if recorded is not None:
+        response.elapsed = recorded
+    return response
+
+
+def use_cassette(session: requests.Session, cassette: Cassette, **adapter_kwargs):
+    """Route a session through a cassette."""
+    if cassette.mode == "off":
+        return
+    adapter = CassetteAdapter(cassette, **adapter_kwargs)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    if cassette.recording:
+        session.hooks["response"].append(cassette.record)
+    else:
+        session.hooks["response"].append(restore_elapsed)
@@ -0,0 +1,94 @@
+import logging
+import os
+import threading
+from dataclasses import dataclass, field
+from typing import Callable, Iterable, Optional
+
+from src.wrappers.id_journal import CreatedIdJournal
+
+logger = logging.getLogger(__name__)
+
+TRANSIENT_STATUSES = frozenset({429, 500, 502, 503, 504})
+DELETED_STATUSES = frozenset({200, 202, 204})
+
+
+@dataclass
+class CleanupSummary:
+    """Outcome of deleting tracked users, grouped by result."""
+    deleted: list[int] = field(default_factory=list)
+    already_gone: list[int] = field(default_factory=list)
+    failed: list[int] = field(default_factory=list)
+
+
+class CreatedUsers:
+    """Ids of the users an API client created, mirrored to the id journal, and the cleanup policy
+    (API_CLEANUP_WORKERS, API_CLEANUP_RETRIES, API_CLEANUP_BACKOFF) shared by the sync and async clients.
+    Thread-safe; the clients only differ in how they send a DELETE and sleep between attempts.
+    """
+
+    def __init__(self, base_url: str, journal: Optional[CreatedIdJournal] = None):
+        self.base_url = base_url
+        self.journal = journal or CreatedIdJournal()
+        self.workers = int(os.getenv("API_CLEANUP_WORKERS", "8"))
+        self.retries = int(os.getenv("API_CLEANUP_RETRIES", "3"))
+        self.backoff = float(os.getenv("API_CLEANUP_BACKOFF", "0.2"))
+        self._ids: list[int] = []
+        self._lock = threading.Lock()
+
+    def add(self, uid: int, journal: bool = True):
+        with self._lock:
+            self._ids.append(uid)
+        if journal:
+            self.journal.created(uid, self.base_url)
+        logger.info("Tracked created id=%s", uid)
+
+    def extend(self, ids: Iterable[int]):
+        """Track ids that are already in the journal, e.g. leaked ones picked up by a sweep."""
+        with self._lock:
+            self._ids.extend(ids)
+
+    def discard(self, uid: int, journal: bool = True):
+        """Stop tracking a user that is gone from the API."""
+        with self._lock:
+            if uid in self._ids:
+                self._ids.remove(uid)
+        if journal:
+            self.journal.deleted(uid, self.base_url)
+
+    def take(self) -> list[int]:
+        """Hand over all tracked ids for cleanup."""
+        with self._lock:
+            ids, self._ids = self._ids, []
+        return ids
+
+    def track_response(self, status_code: int, read_json: Callable[[], object], journal: bool = True):
+        """Track the id of a 201 Created response body."""
+        if status_code != 201:
+            return
+        try:
+            body = read_json()
+        except Exception as e:
+            logger.warning("Could not parse id from response: %s", e)
+            return
+        if isinstance(body, dict) and "id" in body:
+            self.add(body["id"], journal)
+
+    def delete_outcome(self, uid: int, status_code: int, attempt: int, journal: bool = True) -> Optional[str]:
+        """The CleanupSummary field a DELETE response puts `uid` in, or None when it is worth retrying."""
+        if status_code in DELETED_STATUSES or status_code == 404:
+            if journal:
+                self.journal.deleted(uid, self.base_url)
+            return "deleted" if status_code in DELETED_STATUSES else "already_gone"
+        logger.warning("Delete of %s returned %s (attempt %d)", uid, status_code, attempt + 1)
+        return None if status_code in TRANSIENT_STATUSES else "failed"
+
+    def retry_delay(self, attempt: int) -> Optional[float]:
+        """Exponential backoff before the next attempt, or None when attempts are used up."""
+        return self.backoff * 2 ** attempt if attempt < self.retries else None
+
+    @staticmethod
+    def summarize(ids: list[int], outcomes: Iterable[str]) -> CleanupSummary:
+        summary = CleanupSummary()
+        for uid, outcome in zip(ids, outcomes):
+            getattr(summary, outcome).append(uid)
+        return summary
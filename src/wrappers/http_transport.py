@@ -0,0 +1,169 @@
+"""Tuned requests transport for the API clients: pool sizes, keep-alive, retries, gzip and pool stats.
+
+Clients pointed at the same API share one session (and its connection pools) through
+`session_registry`; every adapter counts requests and newly opened connections in `pool_stats`,
+which the perf report and the load runner turn into a connection reuse rate. Only these requests
+sessions are counted; AsyncUserApiClient's httpx pool is not.
+
+Settings (env): API_POOL_CONNECTIONS, API_POOL_MAXSIZE, API_RETRIES, API_RETRY_BACKOFF, API_GZIP.
+"""
+import logging
+import os
+import socket
+import threading
+from dataclasses import dataclass
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+# idempotent verbs except DELETE: cleanup retries its DELETEs itself (CreatedUsers), so retrying them here
+# too would send one failing DELETE (1 + API_RETRIES) * API_CLEANUP_RETRIES times
+RETRIED_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT"})
+RETRY_STATUSES = frozenset({502, 503, 504})
+KEEPALIVE_SOCKET_OPTIONS = HTTPConnection.default_socket_options + [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+
+
+class PoolStats:
+    """Thread-safe, process-wide counters of requests sent and connections opened."""
+
+    def __init__(self):
+        self._requests = 0
+        self._new_connections = 0
+        self._lock = threading.Lock()
+
+    def request_sent(self):
+        with self._lock:
+            self._requests += 1
+
+    def connection_opened(self):
+        with self._lock:
+            self._new_connections += 1
+
+    @staticmethod
+    def summarize(requests_sent: int, new_connections: int) -> dict:
+        reused = max(requests_sent - new_connections, 0)
+        return {
+            "requests": requests_sent,
+            "new_connections": new_connections,
+            "reused": reused,
+            "reuse_rate": round(reused / requests_sent, 4) if requests_sent else 0.0,
+        }
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return self.summarize(self._requests, self._new_connections)
+
+    def drain(self) -> tuple[int, int]:
+        """Return and reset (requests, new_connections)."""
+        with self._lock:
+            counts = self._requests, self._new_connections
+            self._requests = self._new_connections = 0
+        return counts
+
+
+pool_stats = PoolStats()
+
+
+class _CountingHTTPConnectionPool(HTTPConnectionPool):
+    def _new_conn(self):
+        pool_stats.connection_opened()
+        return super()._new_conn()
+
+
+class _CountingHTTPSConnectionPool(HTTPSConnectionPool):
+    def _new_conn(self):
+        pool_stats.connection_opened()
+        return super()._new_conn()
+
+
+@dataclass(frozen=True)
+class TransportSettings:
+    pool_connections: int = 10
+    pool_maxsize: int = 10
+    retries: int = 2
+    retry_backoff: float = 0.1
+    gzip: bool = True
+
+    @classmethod
+    def from_env(cls) -> "TransportSettings":
+        return cls(
+            pool_connections=int(os.getenv("API_POOL_CONNECTIONS", "10")),
+            pool_maxsize=int(os.getenv("API_POOL_MAXSIZE", "10")),
+            retries=int(os.getenv("API_RETRIES", "2")),
+            retry_backoff=float(os.getenv("API_RETRY_BACKOFF", "0.1")),
+            gzip=os.getenv("API_GZIP", "1").lower() not in ("0", "false", "no"),
+        )
+
+    def retry(self) -> Retry:
+        """Retry connection errors and gateway statuses, for idempotent verbs other than DELETE."""
+        return Retry(
+            total=self.retries,
+            backoff_factor=self.retry_backoff,
+            allowed_methods=RETRIED_METHODS,
+            status_forcelist=RETRY_STATUSES,
+            raise_on_status=False,
+        )
+
+
+class TransportAdapter(HTTPAdapter):
+    """HTTPAdapter with TCP keep-alive sockets and request/connection counting."""
+
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        pool_kwargs.setdefault("socket_options", KEEPALIVE_SOCKET_OPTIONS)
+        super().init_poolmanager(connections, maxsize, block, **pool_kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _CountingHTTPConnectionPool,
+            "https": _CountingHTTPSConnectionPool,
+        }
+
+    def send(self, request, **kwargs):
+        pool_stats.request_sent()
+        return super().send(request, **kwargs)
+
+
+def build_session(settings: TransportSettings, adapter: Optional[HTTPAdapter] = None) -> requests.Session:
+    """A session with the tuned adapter mounted (or `adapter`, e.g. a cassette) and JSON/keep-alive headers."""
+    session = requests.Session()
+    session.headers.update({"Content-Type": "application/json", "Connection": "keep-alive"})
+    if not settings.gzip:
+        session.headers["Accept-Encoding"] = "identity"
+    adapter = adapter or TransportAdapter(
+        pool_connections=settings.pool_connections,
+        pool_maxsize=settings.pool_maxsize,
+        max_retries=settings.retry(),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+class SessionRegistry:
+    """Thread-safe sessions shared by all clients of the same base URL and transport settings."""
+
+    def __init__(self):
+        self._sessions: dict[tuple[str, TransportSettings], requests.Session] = {}
+        self._lock = threading.Lock()
+
+    def get(self, base_url: str, settings: TransportSettings) -> requests.Session:
+        key = (base_url, settings)
+        with self._lock:
+            session = self._sessions.get(key)
+            if session is None:
+                logger.debug("Opening shared session for %s with %r", base_url, settings)
+                session = self._sessions[key] = build_session(settings)
+        return session
+
+    def close_all(self):
+        with self._lock:
+            sessions, self._sessions = list(self._sessions.values()), {}
+        for session in sessions:
+            session.close()
+
+
+session_registry = SessionRegistry()
@@ -0,0 +1,101 @@
+import logging
+import os
+import threading
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows: no flock, appends and compaction are only serialized within a process
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_JOURNAL_PATH = ".created_users.journal"
+# set once per test run by the controller; xdist workers inherit it, so all of a run's entries share it
+RUN_ID_ENV = "API_JOURNAL_RUN_ID"
+
+
+def new_run_id() -> str:
+    return uuid.uuid4().hex[:12]
+
+
+class CreatedIdJournal:
+    """Append-only record of created and deleted user ids, per API base URL and test run
+    (`+42 http://host:3003 3f9c0e1a2b4d`).
+    Survives crashed test workers, so a later sweep can delete the users they leaked.
+    Appends and compaction hold an exclusive lock on `<journal>.lock`, so a compaction in one process
+    never drops lines another process appends meanwhile.
+    """
+
+    def __init__(self, path: str | os.PathLike = None, run_id: str = None):
+        self.path = Path(path or os.getenv("API_ID_JOURNAL") or DEFAULT_JOURNAL_PATH)
+        self.run_id = run_id or os.getenv(RUN_ID_ENV) or "-"
+        self._lock = threading.Lock()
+
+    @property
+    def lock_path(self) -> Path:
+        return self.path.with_name(self.path.name + ".lock")
+
+    @contextmanager
+    def _locked(self):
+        with self._lock:
+            if fcntl is None:
+                yield
+                return
+            with open(self.lock_path, "a") as lock:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def created(self, uid: int, base_url: str):
+        self._append(f"+{uid} {base_url} {self.run_id}")
+
+    def deleted(self, uid: int, base_url: str):
+        self._append(f"-{uid} {base_url} {self.run_id}")
+
+    def _append(self, line: str):
+        with self._locked(), open(self.path, "a") as journal:
+            journal.write(line + "\n")
+
+    def _alive(self) -> dict[tuple[str, int], str]:
+        """(base_url, id) -> run of users created but never recorded as deleted, in creation order."""
+        try:
+            lines = self.path.read_text().splitlines()
+        except FileNotFoundError:
+            return {}
+        alive: dict[tuple[str, int], str] = {}
+        for line in lines:
+            entry, _, rest = line.partition(" ")
+            base_url, _, run_id = rest.partition(" ")
+            try:
+                key = (base_url, int(entry[1:]))
+            except ValueError:
+                logger.warning(f"Skipping malformed journal line {line!r}")
+                continue
+            if entry[0] == "+":
+                alive[key] = run_id or "-"
+            else:
+                alive.pop(key, None)
+        return alive
+
+    def pending(self, base_url: str, run_id: str = None) -> list[int]:
+        """Ids created on `base_url` (by run `run_id` only, when given) but never recorded as deleted,
+        in creation order.
+        """
+        return [uid for (url, uid), run in self._alive().items()
+                if url == base_url and (run_id is None or run == run_id)]
+
+    def compact(self):
+        """Rewrite the journal keeping only pending ids (of every API and run); remove it when nothing is pending."""
+        with self._locked():
+            alive = self._alive()
+            if not alive:
+                self.path.unlink(missing_ok=True)
+                return
+            staged = self.path.with_name(self.path.name + ".tmp")
+            staged.write_text("".join(f"+{uid} {base_url} {run}\n" for (base_url, uid), run in alive.items()))
+            os.replace(staged, self.path)
@@ -1,25 +1,54 @@
 import logging
 import os
-from typing import Optional, Dict, Any
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Optional, Dict, Any, Iterable
 
 import requests
 
 from src.models.factories.users import user_test_data_to_payload, build_user
+from src.models.user_model import UserModel
+from src.models.validators import get_type_adapter
+from src.perf.latency import latency_recorder
+from src.perf.request_log import RequestEventLog
+from src.wrappers.cassette import Cassette, is_replayed, use_cassette
+from src.wrappers.created_users import DELETED_STATUSES, CleanupSummary, CreatedUsers
+from src.wrappers.http_transport import TransportSettings, build_session, session_registry
+from src.wrappers.id_journal import CreatedIdJournal
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_MAX_URL_LENGTH = 2000
+
+
+@dataclass
+class BulkUsersResult:
+    """Users found by a bulk id lookup (ascending id order) and the requested ids that do not exist."""
+    users: list[UserModel] = field(default_factory=list)
+    missing: list[int] = field(default_factory=list)
+
 
 class UserApiClient:
     """Simple API client for User endpoints (GET, POST, PUT, DELETE)."""
-    def __init__(self):
-        self.base_url = os.getenv('API_BASE_URL').lower()
+    def __init__(self, journal: Optional[CreatedIdJournal] = None, cassette: Optional[Cassette] = None):
+        self.base_url = (os.getenv('API_BASE_URL') or "").lower()
         if not self.base_url:
             raise ValueError("API_BASE_URL environment variable must be set")
         self.base_url = self.base_url.rstrip("/").lower()
-        self.session = requests.Session()
-        self.session.headers.update({"Content-Type": "application/json"})
+        settings = TransportSettings.from_env()
+        self._pool_maxsize = settings.pool_maxsize
+        if cassette is None:
+            self.session = session_registry.get(self.base_url, settings)
+        else:
+            # cassette adapters and hooks are per test, so keep them off the shared session
+            self.session = build_session(settings)
+            use_cassette(self.session, cassette, pool_connections=settings.pool_connections,
+                         pool_maxsize=settings.pool_maxsize, max_retries=settings.retry())
         self._timeout = int(os.getenv("API_TIMEOUT", "10"))
-        self._created_ids: list[int] = []
+        self._created = CreatedUsers(self.base_url, journal)
+        self._max_url_length = int(os.getenv("API_MAX_URL_LENGTH", str(DEFAULT_MAX_URL_LENGTH)))
+        self._events = RequestEventLog()
 
     def _url(self, path: str) -> str:
         """Builds a full URL from base URL and relative path."""
@@ -28,70 +57,180 @@ class UserApiClient:
     def get(self, path: str, params: Optional[Dict[str, Any]] = None) -> requests.Response:
         """Send a GET request with optional query parameters."""
         url = self._url(path)
-        logger.info(f"GET {url!r} params: {params!r}")
+        logger.info("GET %r params: %r", url, params)
         resp = self.session.get(url, params=params, timeout=self._timeout)
-        logger.debug(f"Response {resp.status_code!r} having response like {resp.text[:300]!r}")
+        self._after_request("GET", path, resp)
         return resp
 
     def post(self, path: str, json: Optional[Dict[str, Any]] = None) -> requests.Response:
         """Send a POST request with optional JSON body."""
         url = self._url(path)
-        logger.info(f"POST {url!r} json: {json!r}")
+        logger.info("POST %r json: %r", url, json)
         resp = self.session.post(url, json=json, timeout=self._timeout)
+        self._after_request("POST", path, resp)
         self._track_created_id(resp)
-        logger.debug(f"Response {resp.status_code!r} having response like {resp.text[:300]!r}")
         return resp
 
     def put(self, path: str, json: Optional[Dict[str, Any]] = None) -> requests.Response:
         """Send a PUT request with optional JSON body."""
         url = self._url(path)
-        logger.info(f"PUT {url!r} json: {json!r}")
+        logger.info("PUT %r json: %r", url, json)
         resp = self.session.put(url, json=json, timeout=self._timeout)
-        logger.debug(f"Response {resp.status_code!r} having response like {resp.text[:300]!r}")
+        self._after_request("PUT", path, resp)
         return resp
 
     def patch(self, path: str, json: Optional[Dict[str, Any]] = None) -> requests.Response:
         """Send a PATCH request with optional JSON body."""
         url = self._url(path)
-        logger.info(f"PATCH {url!r} json: {json!r}")
+        logger.info("PATCH %r json: %r", url, json)
         resp = self.session.patch(url, json=json, timeout=self._timeout)
-        logger.debug(f"Response {resp.status_code!r} having response like {resp.text[:300]!r}")
+        self._after_request("PATCH", path, resp)
         return resp
 
     def delete(self, path: str,  id_resource: int) -> requests.Response:
         """Send a DELETE request for a resource ID."""
         url = self._url(path+str(id_resource))
-        logger.info(f"DELETE {url!r}")
+        logger.info("DELETE %r", url)
         resp = self.session.delete(url, timeout=self._timeout)
-        logger.debug(f"Response {resp.status_code!r} having response like {resp.text[:300]!r}")
+        self._after_request("DELETE", path + str(id_resource), resp)
         return resp
 
+    def delete_user(self, uid: int) -> requests.Response:
+        """DELETE /user/{id}; a user that is gone afterwards is no longer tracked for cleanup."""
+        resp = self.delete("/user/", id_resource=uid)
+        if resp.status_code in DELETED_STATUSES or resp.status_code == 404:
+            self._created.discard(uid, journal=not is_replayed(resp))
+        return resp
+
+    def _after_request(self, method: str, path: str, resp: requests.Response):
+        """Record latency and emit a (sampled) request event; the body is only decoded for DEBUG output."""
+        elapsed_ms = resp.elapsed.total_seconds() * 1000
+        self._record(method, path, resp.status_code, elapsed_ms)
+        if self._events.sampled():
+            self._events.emit(method, path, resp.status_code, resp.content, elapsed_ms)
+        logger.debug("Response %s for %s %s in %.1f ms", resp.status_code, method, path, elapsed_ms)
+
+    @staticmethod
+    def _record(method: str, path: str, status: int, elapsed_ms: float):
+        """Feed the session latency report, tagged by method, path template and status."""
+        latency_recorder.record(method, path, status, elapsed_ms)
+
     def create_user_for_test(self, payload):
         # payload = user_test_data_to_payload(build_user({}))
         resp = self.post("/user/", json=payload)
         assert resp.status_code == 201, f"Setup create failed: {resp.text}"
         return resp.json()
 
-    def cleanup_created_users(self):
-        """Delete all tracked created resources."""
-        logger.info(f"Context cleaning...")
-        while self._created_ids:
-            uid = self._created_ids.pop()
+    def track_created_user(self, uid: int):
+        """Track a user created outside this client (e.g. through the UI) so cleanup deletes it too."""
+        self._created.add(int(uid))
+
+    def create_users(self, payloads: Iterable[Dict[str, Any]], concurrency: Optional[int] = None) -> list[dict]:
+        """Create many users concurrently, returning the created bodies in input order.
+        Concurrency is capped by the connection pool size (API_POOL_MAXSIZE).
+        """
+        payloads = list(payloads)
+        if not payloads:
+            return []
+        workers = min(concurrency or self._pool_maxsize, self._pool_maxsize, len(payloads))
+        logger.info("Creating %d users with %d workers", len(payloads), workers)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="create-user") as executor:
+            return list(executor.map(self.create_user_for_test, payloads))
+
+    def get_users_by_ids(self, ids: Iterable[int], concurrency: Optional[int] = None,
+                         max_url_length: Optional[int] = None) -> BulkUsersResult:
+        """Fetch many users with `GET /user/?id=..&id=..`, split into requests that fit the URL length limit
+        (API_MAX_URL_LENGTH) and sent concurrently. Ids are deduplicated; all bodies are validated in one pass.
+        """
+        ids = sorted(set(int(uid) for uid in ids))
+        if not ids:
+            return BulkUsersResult()
+        chunks = self._id_chunks(ids, max_url_length or self._max_url_length)
+        workers = min(concurrency or self._pool_maxsize, self._pool_maxsize, len(chunks))
+        logger.info("Fetching %d users in %d requests with %d workers", len(ids), len(chunks), workers)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="get-users") as executor:
+            bodies = [body for chunk_bodies in executor.map(self._fetch_id_chunk, chunks) for body in chunk_bodies]
+        users = get_type_adapter(UserModel, many=True).validate_json(b"[" + b",".join(bodies) + b"]")
+        by_id = {user.id: user for user in users}
+        return BulkUsersResult(
+            users=[by_id[uid] for uid in ids if uid in by_id],
+            missing=[uid for uid in ids if uid not in by_id],
+        )
+
+    def _fetch_id_chunk(self, chunk: list[int]) -> list[bytes]:
+        """Inner JSON of the user arrays returned for `chunk`. A 404 only says some id is missing, so a
+        multi-id chunk is bisected until the ids that exist are fetched and the missing ones are isolated.
+        """
+        resp = self.get("/user/", params={"id": chunk})
+        if resp.status_code == 404:
+            if len(chunk) == 1:
+                return []
+            middle = len(chunk) // 2
+            return self._fetch_id_chunk(chunk[:middle]) + self._fetch_id_chunk(chunk[middle:])
+        resp.raise_for_status()
+        body = resp.content.strip()[1:-1].strip()
+        return [body] if body else []
+
+    def _id_chunks(self, ids: list[int], max_url_length: int) -> list[list[int]]:
+        """Greedily pack ids into chunks whose `<base>/user/?id=1&id=2` URL stays within max_url_length."""
+        budget = max_url_length - len(self._url("/user/")) - 1
+        chunks, chunk, length = [], [], 0
+        for uid in ids:
+            cost = len(f"id={uid}") + (1 if chunk else 0)
+            if chunk and length + cost > budget:
+                chunks.append(chunk)
+                chunk, length, cost = [], 0, cost - 1
+            chunk.append(uid)
+            length += cost
+        chunks.append(chunk)
+        return chunks
+
+    def cleanup_created_users(self, workers: Optional[int] = None) -> CleanupSummary:
+        """Delete all tracked created resources concurrently and report what happened to each id."""
+        logger.info("Context cleaning...")
+        ids = self._created.take()
+        if not ids:
+            return CleanupSummary()
+        workers = min(workers or self._created.workers, self._pool_maxsize, len(ids))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="cleanup-user") as executor:
+            summary = self._created.summarize(ids, executor.map(self._delete_with_retry, ids))
+        logger.info("Cleanup finished: %r", summary)
+        return summary
+
+    def sweep_journal(self, run_id: Optional[str] = None) -> CleanupSummary:
+        """Delete users this API has left in the id journal (e.g. by a crashed worker or an aborted run),
+        only those of test run `run_id` when given.
+        """
+        journal = self._created.journal
+        leaked = journal.pending(self.base_url, run_id)
+        if not leaked:
+            journal.compact()
+            return CleanupSummary()
+        logger.info("Sweeping %d leaked users from %s", len(leaked), journal.path)
+        self._created.extend(leaked)
+        summary = self.cleanup_created_users()
+        journal.compact()
+        return summary
+
+    def _delete_with_retry(self, uid: int) -> str:
+        """Delete one user, retrying transient failures with exponential backoff.
+        Returns the CleanupSummary field the id belongs to.
+        """
+        for attempt in range(self._created.retries + 1):
             try:
-                resp = self.delete("/user/",id_resource=uid)
-                if resp.status_code not in (200, 202, 204, 404):
-                    logger.warning(f"Delete of {uid} returned {resp.status_code}")
-            except Exception as e:
-                logger.warning(f"Failed to delete {uid}: {e}")
+                resp = self.delete("/user/", id_resource=uid)
+            except requests.RequestException as e:
+                logger.warning("Failed to delete %s (attempt %d): %s", uid, attempt + 1, e)
+            else:
+                outcome = self._created.delete_outcome(uid, resp.status_code, attempt, journal=not is_replayed(resp))
+                if outcome:
+                    return outcome
+            delay = self._created.retry_delay(attempt)
+            if delay is not None:
+                time.sleep(delay)
+        return "failed"
 
     def _track_created_id(self, resp: requests.Response):
         """Extract and store the id if response is 201 Created."""
-        if resp.status_code != 201:
-            return
-        try:
-            body = resp.json()
-            if isinstance(body, dict) and "id" in body:
-                self._created_ids.append(body["id"])
-                logger.info(f"Tracked created id={body['id']}")
-        except Exception as e:
-            logger.warning(f"Could not parse id from response: {e}")
+        # a replayed user never existed on the API, so there is nothing a sweep could delete
+        self._created.track_response(resp.status_code, resp.json, journal=not is_replayed(resp))
@@ -1,8 +1,11 @@
 import logging
 import os
+import time
 from typing import Optional
 
+from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException, TimeoutException
 from selenium.webdriver import ActionChains, Keys
+from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.support import expected_conditions as ec
@@ -11,6 +14,94 @@ from src.helpers.driver_factory import DriverFactory
 
 log = logging.getLogger(__name__)
 
+PRESENT = "present"
+VISIBLE = "visible"
+CLICKABLE = "clickable"
+
+# Locator strategies the injected scripts resolve in the page; anything else falls back to Selenium waits
+_SCRIPT_STRATEGIES = {By.CSS_SELECTOR, By.XPATH, By.NAME, By.ID, By.LINK_TEXT, By.PARTIAL_LINK_TEXT}
+
+_FALLBACK_CONDITIONS = {
+    PRESENT: ec.presence_of_element_located,
+    VISIBLE: ec.visibility_of_element_located,
+    CLICKABLE: ec.element_to_be_clickable,
+}
+
+_LOCATE_JS = """
+const locate = (by, value) => {
+    switch (by) {
+        case "css selector": return document.querySelector(value);
+        case "name": return document.querySelector('[name="' + CSS.escape(value) + '"]');
+        case "id": return document.getElementById(value);
+        case "xpath":
+            return document.evaluate(value, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+        case "link text":
+            return Array.from(document.querySelectorAll("a")).find(a => a.innerText.trim() === value) || null;
+        case "partial link text":
+            return Array.from(document.querySelectorAll("a")).find(a => a.innerText.includes(value)) || null;
+    }
+    return null;
+};
+"""
+
+_READY_JS = """
+const isVisible = el => {
+    if (!el.isConnected) return false;
+    const style = window.getComputedStyle(el);
+    return style.visibility !== "hidden" && style.display !== "none" && el.getClientRects().length > 0;
+};
+const ready = (el, condition) =>
+    !!el && (condition === "present" || (isVisible(el) && (condition === "visible" || !el.disabled)));
+"""
+
+# args: [[by, value, text], ...] -> values of the locators that were not found.
+# Uses the native value setter so React-controlled inputs see the change, then fires the events MUI forms listen to
+_FILL_INPUTS_SCRIPT = _LOCATE_JS + """
+const missing = [];
+for (const [by, value, text] of arguments[0]) {
+    const el = locate(by, value);
+    if (!el) { missing.push(value); continue; }
+    const proto = el instanceof HTMLTextAreaElement ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+    el.focus();
+    Object.getOwnPropertyDescriptor(proto, "value").set.call(el, text);
+    el.dispatchEvent(new Event("input", {bubbles: true}));
+    el.dispatchEvent(new Event("change", {bubbles: true}));
+    el.blur();
+}
+return missing;
+"""
+
+# args: by, value, element, condition -> the element once it meets the condition, else null
+_WAIT_POLL_SCRIPT = _LOCATE_JS + _READY_JS + """
+const el = arguments[2] || locate(arguments[0], arguments[1]);
+return ready(el, arguments[3]) ? el : null;
+"""
+
+# args: by, value, element, condition, timeout ms, recheck ms, callback.
+# Re-checks on DOM mutations, with a periodic recheck for changes that don't mutate the DOM (e.g. transitions)
+_WAIT_EVENT_SCRIPT = _LOCATE_JS + _READY_JS + """
+const [by, value, element, condition, timeout, recheck] = arguments;
+const done = arguments[arguments.length - 1];
+const check = () => {
+    const el = element || locate(by, value);
+    return ready(el, condition) ? el : null;
+};
+const found = check();
+if (found) { return done(found); }
+let observer, interval, timer;
+const finish = result => {
+    observer.disconnect();
+    clearInterval(interval);
+    clearTimeout(timer);
+    done(result);
+};
+const onChange = () => { const el = check(); if (el) { finish(el); } };
+observer = new MutationObserver(onChange);
+observer.observe(document, {subtree: true, childList: true, attributes: true});
+interval = setInterval(onChange, recheck);
+timer = setTimeout(() => finish(null), timeout);
+"""
+
 
 class ActionWrapper:
     """Convenience actions around ActionChains."""
@@ -26,62 +117,160 @@ class ActionWrapper:
 
 
 class ElementWrapper:
-    """Element find/wait helpers for chaining."""
+    """Element find/wait helpers for chaining.
+    Waits run presence/visibility/clickability checks in one injected script per check, either polled
+    every WAIT_POLL_INTERVAL seconds or, with WAIT_STRATEGY=event, driven by a MutationObserver.
+    Elements found with cached=True are reused while the page URL stays the same (in-app routes included)
+    and until the cache is invalidated (navigation) or they go stale.
+    """
 
     def __init__(self, driver):
         self.__driver = driver
         self.__timeout = int(os.getenv("DEFAULT_TIMEOUT"), 10)
+        self.__poll_interval = float(os.getenv("WAIT_POLL_INTERVAL") or 0.1)
+        self.__wait_strategy = (os.getenv("WAIT_STRATEGY") or "poll").lower()
         self.__element: Optional[WebElement] = None
+        self.__locator = None
+        self.__cached = False
+        self.__element_cache: dict[tuple, WebElement] = {}
+        self.__cache_url: Optional[str] = None
+        self.cache_hits = 0
+        self.cache_misses = 0
+        if self.__wait_strategy == "event":
+            self.__driver.set_script_timeout(self.__timeout + 5)
+
+    def _wait_until(self, condition: str, locator=None, element: Optional[WebElement] = None) -> WebElement:
+        """Wait until the located (or given) element meets condition and return it."""
+        if locator is not None and locator[0] not in _SCRIPT_STRATEGIES:
+            return WebDriverWait(self.__driver, self.__timeout, poll_frequency=self.__poll_interval).until(
+                _FALLBACK_CONDITIONS[condition](locator)
+            )
+        by, value = locator or (None, None)
+        message = f"Element {locator or element} is not {condition} after {self.__timeout}s"
+        if self.__wait_strategy == "event":
+            found = self.__driver.execute_async_script(
+                _WAIT_EVENT_SCRIPT, by, value, element, condition,
+                self.__timeout * 1000, self.__poll_interval * 1000,
+            )
+            if found is None:
+                raise TimeoutException(message)
+            return found
+        return WebDriverWait(self.__driver, self.__timeout, poll_frequency=self.__poll_interval).until(
+            lambda driver: driver.execute_script(_WAIT_POLL_SCRIPT, by, value, element, condition),
+            message,
+        )
 
-    def find_element(self, locator):
-        """Wait for presence, set current element, and return self for chaining."""
-        self.presence_of_element(locator)
-        self.__element = self.__driver.find_element(*locator)
+    def find_element(self, locator, cached: bool = False):
+        """Wait for presence, set current element, and return self for chaining.
+        With cached=True an element already resolved for this locator on the current page is reused.
+        """
+        if cached:
+            self.__drop_cache_of_other_page()
+        if cached and locator in self.__element_cache:
+            self.cache_hits += 1
+            self.__element = self.__element_cache[locator]
+        else:
+            self.__element = self._wait_until(PRESENT, locator=locator)
+            if cached:
+                self.cache_misses += 1
+                self.__element_cache[locator] = self.__element
+        self.__locator = locator
+        self.__cached = cached
         return self
 
+    def __drop_cache_of_other_page(self):
+        """Clicks and form submits change routes without get_url, so cached elements belong to the URL they
+        were found on and are dropped once the browser is elsewhere."""
+        url = self.__driver.current_url
+        if url != self.__cache_url:
+            self.__element_cache.clear()
+            self.__cache_url = url
+
+    def invalidate_element_cache(self):
+        """Forget cached elements, e.g. after navigating to another page."""
+        self.__element_cache.clear()
+        self.__cache_url = None
+
+    @property
+    def element_cache_stats(self) -> dict:
+        return {"hits": self.cache_hits, "misses": self.cache_misses, "size": len(self.__element_cache)}
+
+    def _with_stale_retry(self, action):
+        """Run an action on the current element, re-resolving its locator once if the element went stale."""
+        try:
+            return action()
+        except StaleElementReferenceException:
+            if self.__locator is None:
+                raise
+            log.debug(f"...element for {self.__locator!r} went stale, locating it again")
+            self.__element_cache.pop(self.__locator, None)
+            self.find_element(self.__locator, cached=self.__cached)
+            return action()
+
     def find_elements(self, locator) -> list[WebElement]:
         """Return all matching elements (no current-element side effect)."""
-        WebDriverWait(self.__driver, self.__timeout).until(
+        return WebDriverWait(self.__driver, self.__timeout, poll_frequency=self.__poll_interval).until(
             ec.presence_of_all_elements_located(locator)
         )
-        return self.__driver.find_elements(*locator)
 
-    def wait_for_element_to_load(self, element):
-        element_present = WebDriverWait(self.__driver, self.__timeout).until(ec.visibility_of(element))
-        if not element_present:
-            raise Exception("Element not found: {}".format(element))
+    def fill_inputs(self, values: dict):
+        """Set {locator: text} input values in a single script call (after waiting for the first input).
+        Replaces existing values; no key events are sent, use send_keys to exercise keyboard behaviour.
+        """
+        if not values:
+            return
+        if any(by not in _SCRIPT_STRATEGIES for by, _ in values):
+            for locator, text in values.items():
+                self.find_element(locator)
+                self.clear()
+                self.send_keys(text)
+            return
+        self._wait_until(VISIBLE, locator=next(iter(values)))
+        missing = self.__driver.execute_script(
+            _FILL_INPUTS_SCRIPT, [[by, value, text] for (by, value), text in values.items()]
+        )
+        if missing:
+            raise NoSuchElementException(f"Inputs not found while filling form: {missing}")
 
-    def presence_of_element(self, locator):
-        WebDriverWait(self.__driver, self.__timeout).until(
-            ec.presence_of_element_located(locator)
+    def wait_for_script(self, script, *args, message: str = ""):
+        """Poll a script until it returns a truthy value and return that value."""
+        return WebDriverWait(self.__driver, self.__timeout, poll_frequency=self.__poll_interval).until(
+            lambda driver: driver.execute_script(script, *args), message
         )
 
+    def wait_for_element_to_load(self, element):
+        self._wait_until(VISIBLE, element=element)
+
+    def presence_of_element(self, locator) -> WebElement:
+        return self._wait_until(PRESENT, locator=locator)
+
     def click(self):
-        # element = self.__driver.find_element(*locator)
-        WebDriverWait(self.__driver, self.__timeout).until(
-            ec.element_to_be_clickable(self.__element)
-        )
-        log.debug("...clicking element: <%s>", self.__element.text)
+        self._with_stale_retry(self.__click)
+
+    def __click(self):
+        self._wait_until(CLICKABLE, element=self.__element)
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("...clicking element: <%s>", self.__element.text)
         self.__element.click()
 
     def send_keys(self, *value):
-        # element = self.__driver.find_element(*locator)
-        WebDriverWait(self.__driver, self.__timeout).until(
-            ec.visibility_of(self.__element)
-        )
+        self._with_stale_retry(lambda: self.__send_keys(*value))
+
+    def __send_keys(self, *value):
+        self._wait_until(VISIBLE, element=self.__element)
         self.__element.send_keys(*value)
 
     def is_displayed(self) -> bool:
-        WebDriverWait(self.__driver, self.__timeout).until(
-            ec.visibility_of(self.__element)
-        )
-        return self.__element.is_displayed()
+        self._with_stale_retry(lambda: self._wait_until(VISIBLE, element=self.__element))
+        return True
 
     def clear(self):
-        WebDriverWait(self.__driver, self.__timeout).until(
-            ec.visibility_of(self.__element)
-        )
-        log.debug(f"...clear <{self.__element.tag_name!r}> element")
+        self._with_stale_retry(self.__clear)
+
+    def __clear(self):
+        self._wait_until(VISIBLE, element=self.__element)
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(f"...clear <{self.__element.tag_name!r}> element")
         select_key = Keys.CONTROL
         self.__element.click()
         self.__element.send_keys(select_key, "a")
@@ -89,9 +278,10 @@ class ElementWrapper:
 
     @property
     def text(self):
-        WebDriverWait(self.__driver, self.__timeout).until(
-            ec.visibility_of(self.__element)
-        )
+        return self._with_stale_retry(self.__text)
+
+    def __text(self):
+        self._wait_until(VISIBLE, element=self.__element)
         return self.__element.text
 
 
@@ -99,10 +289,13 @@ class NavigationWrapper:
     """Navigation and context switching helpers."""
     def __init__(self, driver):
         self.__driver = driver
+        self._page_loads_ms: list[float] = []
 
     def get_url(self, url):
         log.debug(f"...navigating to: <{url!r}> page")
+        start = time.perf_counter()
         self.__driver.get(url)
+        self._page_loads_ms.append((time.perf_counter() - start) * 1000)
 
 
 class SeleniumDriverWrapper:
@@ -122,12 +315,18 @@ class SeleniumDriverWrapper:
     def execute_script(self, script, *args):
         return self.__driver.execute_script(script, *args)
 
+    def delete_all_cookies(self):
+        self.__driver.delete_all_cookies()
+
 
 class WebDriverWrapper(SeleniumDriverWrapper, ElementWrapper, NavigationWrapper, ActionWrapper):
     """Unified wrapper exposing element/nav/actions on a single object."""
 
     def __init__(self):
-        self._driver = DriverFactory().make()
+        factory = DriverFactory()
+        self._driver = factory.make()
+        self.profile = factory.profile
+        self._startup_ms = factory.startup_ms
         ElementWrapper.__init__(self, self._driver)
         NavigationWrapper.__init__(self, self._driver)
         ActionWrapper.__init__(self, self._driver)
@@ -137,5 +336,20 @@ class WebDriverWrapper(SeleniumDriverWrapper, ElementWrapper, NavigationWrapper,
     def driver(self):
         return self._driver
 
+    def get_url(self, url):
+        self.invalidate_element_cache()
+        NavigationWrapper.get_url(self, url)
+
+    def pop_timings(self) -> dict:
+        """Return browser startup (first call only) and page load timings collected since last call."""
+        timings = {
+            "profile": self.profile,
+            "startup_ms": self._startup_ms,
+            "page_load_ms": self._page_loads_ms[:],
+        }
+        self._startup_ms = None
+        self._page_loads_ms.clear()
+        return timings
+
     def quit(self):
         self._driver.quit()
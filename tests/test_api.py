@@ -2,7 +2,7 @@ import logging
 
 import pytest
 
-from src.models.factories.users import user_test_data_to_payload, UserTestData
+from src.models.factories.users import user_test_data_to_payload, UserTestData, build_user
 from src.models.user_model import UserModel
 from src.steps.validation_steps import validate_response, validate_status_and_time, validate_user_update
 
@@ -196,3 +196,51 @@ def test_end_2_end_api(api_client, user_payload, expected_status):
                       expected_status=expected_status,
                       max_response_ms=500,
                       expect_empty=True)
+
+
+def test_bulk_create_users(api_client):
+    payloads = [user_test_data_to_payload(build_user()) for _ in range(10)]
+    created = api_client.create_users(payloads, concurrency=5)
+
+    assert [user["username"] for user in created] == [payload["username"] for payload in payloads], \
+        "Created users are not returned in input order"
+    ids = [user["id"] for user in created]
+    assert len(set(ids)) == len(ids), f"Expected unique ids, got {ids}"
+
+
+def test_cleanup_reports_deleted_and_already_gone_users(api_client):
+    payloads = [user_test_data_to_payload(build_user()) for _ in range(2)]
+    kept, removed = api_client.create_users(payloads)
+    api_client.delete("/user/", id_resource=removed["id"])
+
+    summary = api_client.cleanup_created_users()
+
+    assert summary.deleted == [kept["id"]], f"Unexpected deleted ids: {summary!r}"
+    assert summary.already_gone == [removed["id"]], f"Unexpected already gone ids: {summary!r}"
+    assert not summary.failed, f"Unexpected failed ids: {summary!r}"
+
+
+@pytest.mark.anyio
+async def test_async_bulk_create_and_get_users(async_api_client):
+    payloads = [user_test_data_to_payload(build_user()) for _ in range(5)]
+    created = await async_api_client.create_users(payloads, concurrency=5)
+    ids = [user["id"] for user in created]
+
+    resp = await async_api_client.get("/user/", params={"id": ids})
+    users = validate_response(response=resp, expected_model=UserModel, expected_status=200, max_response_ms=500)
+
+    assert sorted(user.id for user in users) == sorted(ids), f"Expected ids {ids}, got {users!r}"
+
+
+def test_get_users_by_ids_chunks_dedupes_and_reports_missing(api_client):
+    payloads = [user_test_data_to_payload(build_user()) for _ in range(3)]
+    created = {user["id"]: user for user in api_client.create_users(payloads)}
+    ids = list(created)
+    missing_id = max(ids) + 1_000_000
+
+    # a URL budget too small for two ids forces one request per id
+    result = api_client.get_users_by_ids([ids[2], ids[0], ids[0], missing_id, ids[1]], max_url_length=1)
+
+    assert [user.id for user in result.users] == sorted(ids), f"Unexpected users: {result.users!r}"
+    assert [user.username for user in result.users] == [created[uid]["username"] for uid in sorted(ids)]
+    assert result.missing == [missing_id], f"Unexpected missing ids: {result.missing!r}"
@@ -0,0 +1,75 @@
+import sqlite3
+
+import pytest
+
+from src.perf.baseline import BaselineStore, Regression, mann_whitney_p_value, selection_key, z_test_p_value
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = BaselineStore(tmp_path / "baseline.sqlite")
+    yield store
+    store.close()
+
+
+def test_z_test_p_value():
+    assert z_test_p_value(10.0, [9.0, 10.0, 11.0]) == pytest.approx(0.5)
+    assert z_test_p_value(20.0, [9.0, 10.0, 11.0]) < 0.001
+    assert z_test_p_value(11.0, [10.0, 10.0, 10.0]) == 0.0, "Any slowdown over a constant baseline is significant"
+    assert z_test_p_value(10.0, [10.0, 10.0, 10.0]) == 1.0
+
+
+def test_mann_whitney_p_value():
+    baseline = [float(v) for v in range(1, 21)]
+
+    assert mann_whitney_p_value([v + 100 for v in baseline], baseline) < 0.001
+    assert mann_whitney_p_value(baseline, baseline) == pytest.approx(0.5)
+    assert mann_whitney_p_value([v - 100 for v in baseline], baseline) > 0.999
+    assert mann_whitney_p_value([5.0], [5.0, 5.0]) == pytest.approx(0.5), "Ties did not share their rank"
+
+
+def test_regression_str_with_zero_baseline():
+    assert "from 0" in str(Regression("test", "t", 0.0, 5.0, 0.001))
+    assert "x2.00" in str(Regression("test", "t", 5.0, 10.0, 0.001))
+
+
+def test_selection_key_ignores_order_and_duplicates():
+    assert selection_key(["b", "a", "a"]) == selection_key(["a", "b"])
+    assert selection_key(["a"]) != selection_key(["a", "b"])
+
+
+def test_compare_flags_significant_slowdowns_only(store):
+    for _ in range(3):
+        store.record_run({"t::slow": 10.0, "t::steady": 10.0}, {"GET /user/": [2.0, 2.1, 2.2, 2.3]})
+    run_id = store.record_run({"t::slow": 100.0, "t::steady": 10.0}, {"GET /user/": [20.0, 21.0, 22.0, 23.0]})
+
+    regressions = store.compare(run_id)
+
+    assert [(r.kind, r.key) for r in regressions] == [("test", "t::slow"), ("endpoint", "GET /user/")]
+
+
+def test_compare_needs_enough_runs_of_the_same_selection(store):
+    for _ in range(3):
+        store.record_run({"t::a": 10.0, "t::b": 10.0}, {})
+    for _ in range(2):
+        store.record_run({"t::a": 10.0}, {})
+
+    run_id = store.record_run({"t::a": 100.0}, {})
+
+    assert store.compare(run_id) == [], "A -k subset was compared with runs of the full selection"
+
+
+def test_store_created_before_selection_keys_is_migrated(tmp_path):
+    path = tmp_path / "baseline.sqlite"
+    db = sqlite3.connect(path)
+    db.executescript("CREATE TABLE runs (id INTEGER PRIMARY KEY AUTOINCREMENT, started_at TEXT NOT NULL);"
+                     "INSERT INTO runs (started_at) VALUES ('2024-01-01T00:00:00+00:00');")
+    db.commit()
+    db.close()
+
+    store = BaselineStore(path)
+    try:
+        run_id = store.record_run({"t::a": 10.0}, {})
+        assert store._baseline_run_ids(run_id, window=10) == [], "An unkeyed run was used as baseline"
+    finally:
+        store.close()
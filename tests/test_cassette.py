@@ -0,0 +1,128 @@
+from types import SimpleNamespace
+
+import pytest
+
+from src.wrappers.cassette import (
+    Cassette,
+    CassetteMissError,
+    canonical_body,
+    canonical_url,
+    cassette_path,
+)
+from src.wrappers.user_api_client import UserApiClient
+
+PAYLOAD = {"name": "Ann", "username": "ann_cassette", "email": "ann@example.com", "phone": "555-010-9999"}
+
+
+def _request(method: str, url: str, body=None):
+    return SimpleNamespace(method=method, url=url, body=body)
+
+
+def _interaction(method: str, url: str, body=None, status: int = 200) -> dict:
+    return {
+        "request": {"method": method, "url": url, "body": body},
+        "response": {"status": status, "reason": "OK", "headers": {}, "body": "[]", "encoding": "utf-8",
+                     "elapsed_ms": 1.0},
+    }
+
+
+@pytest.fixture
+def journal_path(monkeypatch, tmp_path):
+    path = tmp_path / "created_users.journal"
+    monkeypatch.setenv("API_ID_JOURNAL", str(path))
+    return path
+
+
+@pytest.fixture
+def client_for(monkeypatch, journal_path, users_api_stub):
+    """UserApiClient against the stub through a cassette."""
+    monkeypatch.setenv("API_BASE_URL", users_api_stub.base_url)
+    return lambda cassette: UserApiClient(cassette=cassette)
+
+
+def test_canonical_url_ignores_host_and_query_order():
+    assert canonical_url("http://a:1/user/?id=2&id=1&b=") == canonical_url("http://b:2/user/?b=&id=1&id=2")
+    assert canonical_url("http://a:1/user/") == "/user/"
+
+
+def test_canonical_body_ignores_key_order_and_spacing():
+    assert canonical_body(b'{"b": 1, "a": 2}') == canonical_body('{"a":2,"b":1}') == '{"a":2,"b":1}'
+    assert canonical_body(b"not json") == "not json"
+    assert canonical_body(None) is None
+
+
+def test_cassette_path_per_test():
+    path = cassette_path("tests/cassettes", "tests/test_api.py::test_create_api_user[invalid email]")
+
+    assert path.as_posix() == "tests/cassettes/test_api/test_create_api_user[invalid_email].json.gz"
+
+
+def test_match_prefers_unused_exact_body_then_falls_back(tmp_path):
+    cassette = Cassette(tmp_path / "c.json.gz", mode="record")
+    cassette.interactions = [
+        _interaction("POST", "/user/", '{"a":1}'),
+        _interaction("POST", "/user/", '{"a":2}'),
+    ]
+    cassette.mode = "replay"
+
+    assert cassette.match(_request("POST", "http://x/user/", b'{"a": 2}')) is cassette.interactions[1]
+    assert cassette.match(_request("POST", "http://x/user/", b'{"a": 3}')) is cassette.interactions[0]
+    assert cassette.match(_request("POST", "http://x/user/", b'{"a": 3}')) is cassette.interactions[1], \
+        "Repeated requests should reuse the last recorded match"
+    assert cassette.match(_request("GET", "http://x/user/")) is None
+
+
+def test_strict_match_requires_the_same_body(tmp_path):
+    cassette = Cassette(tmp_path / "c.json.gz", mode="record")
+    cassette.interactions = [_interaction("POST", "/user/", '{"a":1}')]
+    cassette.mode = "strict"
+
+    assert cassette.match(_request("POST", "http://x/user/", b'{"a": 2}')) is None
+
+
+def test_strict_mode_without_a_recording_fails(tmp_path):
+    with pytest.raises(CassetteMissError):
+        Cassette(tmp_path / "missing.json.gz", mode="strict")
+
+
+def test_unsupported_mode_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        Cassette(tmp_path / "c.json.gz", mode="rewind")
+
+
+def test_record_then_replay_without_the_api(client_for, journal_path, users_api_stub, tmp_path):
+    path = tmp_path / "test_api" / "test_x.json.gz"
+    recording = Cassette(path, mode="record", seed=7)
+    client = client_for(recording)
+    created = client.post("/user/", json=PAYLOAD).json()
+    fetched = client.get("/user/", params={"id": created["id"]})
+    client.cleanup_created_users()
+    recording.save()
+    journal_after_recording = journal_path.read_text()
+    journal_path.unlink()
+
+    replay = Cassette(path, mode="strict")
+    replay_client = client_for(replay)
+    users_before = len(users_api_stub.store)
+    replayed = replay_client.post("/user/", json=PAYLOAD)
+    replayed_get = replay_client.get("/user/", params={"id": created["id"]})
+    summary = replay_client.cleanup_created_users()
+
+    assert replay.seed == 7, "The recorded data seed was not restored"
+    assert replayed.json() == created
+    assert replayed_get.content == fetched.content
+    assert replayed_get.elapsed == fetched.elapsed, "Replayed responses should keep the recorded elapsed"
+    assert summary.deleted == [created["id"]]
+    assert len(users_api_stub.store) == users_before, "Replay reached the API"
+    assert f"+{created['id']} " in journal_after_recording, "Recorded users were not journaled"
+    assert not journal_path.exists(), "Replayed users were journaled"
+
+
+def test_strict_replay_of_an_unrecorded_request_fails(client_for, tmp_path):
+    path = tmp_path / "c.json.gz"
+    recording = Cassette(path, mode="record")
+    client_for(recording).get("/user/")
+    recording.save()
+
+    with pytest.raises(CassetteMissError):
+        client_for(Cassette(path, mode="strict")).get("/user/", params={"id": 1})
@@ -0,0 +1,61 @@
+import json
+from types import SimpleNamespace
+
+from src.helpers.test_durations import DurationStore
+
+
+def _items(*nodeids: str) -> list:
+    return [SimpleNamespace(nodeid=nodeid) for nodeid in nodeids]
+
+
+def _nodeids(items: list) -> list[str]:
+    return [item.nodeid for item in items]
+
+
+def test_sorts_longest_first_with_unknown_tests_at_the_mean(tmp_path):
+    path = tmp_path / "durations.json"
+    path.write_text(json.dumps({"t::slow": 9.0, "t::mid": 3.0, "t::fast": 0.0}))
+    items = _items("t::fast", "t::new", "t::slow", "t::mid")
+
+    DurationStore(path).sort_longest_first(items)
+
+    assert _nodeids(items) == ["t::slow", "t::new", "t::mid", "t::fast"]
+
+
+def test_keeps_collection_order_without_history(tmp_path):
+    items = _items("t::b", "t::a")
+
+    DurationStore(tmp_path / "missing.json").sort_longest_first(items)
+
+    assert _nodeids(items) == ["t::b", "t::a"]
+
+
+def test_ignores_an_unreadable_history(tmp_path):
+    path = tmp_path / "durations.json"
+    path.write_text("{not json")
+    items = _items("t::b", "t::a")
+
+    DurationStore(path).sort_longest_first(items)
+
+    assert _nodeids(items) == ["t::b", "t::a"]
+
+
+def test_save_adds_up_phases_and_smooths_against_history(tmp_path):
+    path = tmp_path / "durations.json"
+    path.write_text(json.dumps({"t::a": 4.0, "t::old": 1.0}))
+    store = DurationStore(path)
+    for seconds in (0.5, 1.5, 0.0):
+        store.add("t::a", seconds)
+    store.add("t::b", 2.0)
+
+    store.save()
+
+    assert json.loads(path.read_text()) == {"t::a": 3.0, "t::b": 2.0, "t::old": 1.0}
+
+
+def test_save_without_results_writes_nothing(tmp_path):
+    path = tmp_path / "durations.json"
+
+    DurationStore(path).save()
+
+    assert not path.exists()
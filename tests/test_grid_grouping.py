@@ -0,0 +1,76 @@
+import re
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+
+CONFTEST = f"""
+import importlib.util
+import sys
+
+import pytest
+
+sys.path.insert(0, {str(ROOT)!r})
+_spec = importlib.util.spec_from_file_location("repo_conftest", {str(ROOT / "conftest.py")!r})
+_repo = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(_repo)
+
+pytest_addoption = _repo.pytest_addoption
+pytest_collection_modifyitems = _repo.pytest_collection_modifyitems
+
+
+@pytest.fixture
+def api_client():
+    return None
+"""
+
+TESTS = """
+import pytest
+
+
+@pytest.mark.grid_state
+@pytest.mark.parametrize("n", range(4))
+def test_grid(n):
+    pass
+
+
+def test_api(api_client):
+    pass
+
+
+@pytest.mark.parametrize("n", range(4))
+def test_other(n):
+    pass
+"""
+
+
+@pytest.fixture
+def grid_project(pytester):
+    pytester.makeconftest(CONFTEST)
+    pytester.makeini("[pytest]\nmarkers =\n    grid_state: asserts on the shared grid\n")
+    pytester.makepyfile(test_grid=TESTS)
+    return pytester
+
+
+def _grouped(result) -> dict[str, str]:
+    """Grouped test name -> the xdist worker that ran it, from `-v` output."""
+    passed = re.findall(r"\[(gw\d)\](?: \[ *\d+%\])? PASSED \S+::(test_\w+(?:\[\d\])?)@users_grid",
+                        result.stdout.str())
+    return {name: worker for worker, name in passed}
+
+
+def test_grid_state_tests_share_one_xdist_group(grid_project):
+    result = grid_project.runpytest_subprocess("-n", "2", "--dist", "loadgroup", "-v")
+
+    grouped = _grouped(result)
+    result.assert_outcomes(passed=9)
+    assert set(grouped) == {"test_grid[0]", "test_grid[1]", "test_grid[2]", "test_grid[3]", "test_api"}
+    assert len(set(grouped.values())) == 1, f"The group ran on several workers: {grouped}"
+
+
+def test_deselected_grid_state_tests_leave_api_tests_ungrouped(grid_project):
+    result = grid_project.runpytest_subprocess("-n", "2", "--dist", "loadgroup", "-v", "-m", "not grid_state")
+
+    result.assert_outcomes(passed=5)
+    assert _grouped(result) == {}
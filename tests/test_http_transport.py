@@ -0,0 +1,81 @@
+import pytest
+
+from src.wrappers.http_transport import (
+    RETRIED_METHODS,
+    RETRY_STATUSES,
+    PoolStats,
+    SessionRegistry,
+    TransportSettings,
+    build_session,
+    pool_stats,
+)
+
+
+def test_pool_stats_summary():
+    assert PoolStats.summarize(10, 2) == {"requests": 10, "new_connections": 2, "reused": 8, "reuse_rate": 0.8}
+    assert PoolStats.summarize(0, 0)["reuse_rate"] == 0.0
+    assert PoolStats.summarize(1, 3)["reused"] == 0, "Connections opened by retries must not go negative"
+
+
+def test_pool_stats_drain_resets_counts():
+    stats = PoolStats()
+    for _ in range(3):
+        stats.request_sent()
+    stats.connection_opened()
+
+    assert stats.snapshot()["reused"] == 2
+    assert stats.drain() == (3, 1)
+    assert stats.drain() == (0, 0)
+
+
+def test_settings_from_env(monkeypatch):
+    monkeypatch.setenv("API_POOL_CONNECTIONS", "3")
+    monkeypatch.setenv("API_POOL_MAXSIZE", "30")
+    monkeypatch.setenv("API_RETRIES", "5")
+    monkeypatch.setenv("API_RETRY_BACKOFF", "0.5")
+    monkeypatch.setenv("API_GZIP", "false")
+
+    assert TransportSettings.from_env() == TransportSettings(3, 30, 5, 0.5, gzip=False)
+
+
+def test_retries_only_idempotent_methods_on_gateway_statuses():
+    retry = TransportSettings(retries=4, retry_backoff=0.25).retry()
+
+    assert (retry.total, retry.backoff_factor) == (4, 0.25)
+    assert "POST" not in retry.allowed_methods and "PATCH" not in retry.allowed_methods
+    assert "DELETE" not in retry.allowed_methods, "Cleanup already retries DELETEs"
+    assert set(retry.allowed_methods) == RETRIED_METHODS
+    assert set(retry.status_forcelist) == RETRY_STATUSES
+
+
+@pytest.mark.parametrize("gzip, accept_encoding", [(True, "gzip"), (False, "identity")])
+def test_session_headers(gzip, accept_encoding):
+    session = build_session(TransportSettings(gzip=gzip))
+
+    assert accept_encoding in session.headers["Accept-Encoding"]
+    assert session.headers["Connection"] == "keep-alive"
+
+
+def test_keep_alive_session_reuses_its_connection(users_api_stub):
+    session = build_session(TransportSettings())
+    pool_stats.drain()
+    try:
+        for _ in range(5):
+            session.get(users_api_stub.base_url + "user/").raise_for_status()
+    finally:
+        session.close()
+
+    assert pool_stats.drain() == (5, 1), "Keep-alive requests to the stub opened more than one connection"
+
+
+def test_registry_shares_sessions_per_base_url_and_settings():
+    registry = SessionRegistry()
+    settings = TransportSettings()
+
+    session = registry.get("http://a", settings)
+
+    assert registry.get("http://a", TransportSettings()) is session
+    assert registry.get("http://b", settings) is not session
+    assert registry.get("http://a", TransportSettings(pool_maxsize=1)) is not session
+    registry.close_all()
+    assert registry.get("http://a", settings) is not session, "Closed sessions were handed out again"
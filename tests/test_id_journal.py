@@ -0,0 +1,102 @@
+import multiprocessing
+
+from src.wrappers.id_journal import RUN_ID_ENV, CreatedIdJournal
+
+API = "http://api.test"
+OTHER_API = "http://other.test"
+
+
+def _append_many(path, run_id: str, ids: range):
+    journal = CreatedIdJournal(path, run_id)
+    for uid in ids:
+        journal.created(uid, API)
+
+
+def _compact_many(path, times: int):
+    journal = CreatedIdJournal(path)
+    for _ in range(times):
+        journal.compact()
+
+
+def test_pending_is_per_base_url_in_creation_order(tmp_path):
+    journal = CreatedIdJournal(tmp_path / "ids.journal")
+    for uid in (3, 1, 2):
+        journal.created(uid, API)
+    journal.created(1, OTHER_API)
+    journal.deleted(1, API)
+
+    assert journal.pending(API) == [3, 2]
+    assert journal.pending(OTHER_API) == [1]
+    assert journal.pending("http://unknown.test") == []
+
+
+def test_pending_without_journal_file(tmp_path):
+    assert CreatedIdJournal(tmp_path / "missing.journal").pending(API) == []
+
+
+def test_pending_per_run(tmp_path):
+    path = tmp_path / "ids.journal"
+    CreatedIdJournal(path, run_id="run1").created(1, API)
+    CreatedIdJournal(path, run_id="run2").created(2, API)
+    CreatedIdJournal(path, run_id="run2").deleted(1, API)
+
+    assert CreatedIdJournal(path).pending(API) == [2]
+    assert CreatedIdJournal(path).pending(API, "run1") == []
+    assert CreatedIdJournal(path).pending(API, "run2") == [2]
+
+
+def test_pending_skips_malformed_lines(tmp_path):
+    path = tmp_path / "ids.journal"
+    path.write_text(f"+1 {API}\n+x {API}\n\n+2 {API} run1\n")
+
+    assert CreatedIdJournal(path).pending(API) == [1, 2]
+    assert CreatedIdJournal(path).pending(API, "-") == [1], "Lines without a run belong to no run"
+
+
+def test_compact_keeps_pending_ids_of_every_api(tmp_path):
+    path = tmp_path / "ids.journal"
+    journal = CreatedIdJournal(path, run_id="run1")
+    journal.created(1, API)
+    journal.created(2, API)
+    journal.created(5, OTHER_API)
+    journal.deleted(1, API)
+
+    journal.compact()
+
+    assert path.read_text() == f"+2 {API} run1\n+5 {OTHER_API} run1\n"
+
+
+def test_compact_removes_a_journal_with_nothing_pending(tmp_path):
+    path = tmp_path / "ids.journal"
+    journal = CreatedIdJournal(path)
+    journal.created(1, API)
+    journal.deleted(1, API)
+
+    journal.compact()
+
+    assert not path.exists()
+
+
+def test_journal_path_and_run_from_env(tmp_path, monkeypatch):
+    monkeypatch.setenv("API_ID_JOURNAL", str(tmp_path / "env.journal"))
+    monkeypatch.setenv(RUN_ID_ENV, "run9")
+
+    assert CreatedIdJournal().path == tmp_path / "env.journal"
+    assert CreatedIdJournal().run_id == "run9"
+
+
+def test_appends_from_other_processes_survive_compaction(tmp_path):
+    path = tmp_path / "ids.journal"
+    context = multiprocessing.get_context("spawn")
+    ids = {"run0": range(300), "run1": range(1000, 1300)}
+    processes = [context.Process(target=_append_many, args=(path, run_id, run_ids)) for run_id, run_ids in ids.items()]
+    processes.append(context.Process(target=_compact_many, args=(path, 200)))
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join(timeout=60)
+
+    assert [process.exitcode for process in processes] == [0, 0, 0]
+    journal = CreatedIdJournal(path)
+    for run_id, run_ids in ids.items():
+        assert journal.pending(API, run_id) == list(run_ids), "Appends were lost while compacting"
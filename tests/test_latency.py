@@ -0,0 +1,45 @@
+import pytest
+
+from src.perf.latency import LatencyRecorder, RequestSample, aggregate, path_template
+
+
+@pytest.mark.parametrize(
+    "path, expected",
+    [
+        ("/user/", "/user/"),
+        ("user/42", "/user/{id}"),
+        ("/user/42?id=1", "/user/{id}"),
+        ("/user/42/posts/7", "/user/{id}/posts/{id}"),
+        ("/user/v2", "/user/v2"),
+    ],
+)
+def test_path_template_collapses_numeric_segments(path, expected):
+    assert path_template(path) == expected
+
+
+def test_recorder_only_buffers_when_enabled_and_drains():
+    recorder = LatencyRecorder()
+    recorder.record("GET", "/user/1", 200, 1.0)
+    assert recorder.drain() == [], "A disabled recorder buffered samples"
+
+    recorder.enabled = True
+    recorder.record("GET", "/user/1", 200, 1.0)
+
+    assert recorder.drain() == [RequestSample("GET", "/user/{id}", 200, 1.0)]
+    assert recorder.drain() == [], "Drain did not forget the samples"
+
+
+def test_aggregate_per_endpoint_with_status_counts():
+    samples = [
+        RequestSample("GET", "/user/", 200, 2.0),
+        RequestSample("GET", "/user/", 200, 4.0),
+        RequestSample("GET", "/user/", 404, 6.0),
+        RequestSample("DELETE", "/user/{id}", 200, 1.0),
+    ]
+
+    stats = aggregate(samples)
+
+    assert list(stats) == ["DELETE /user/{id}", "GET /user/"]
+    assert stats["GET /user/"]["count"] == 3
+    assert stats["GET /user/"]["p50"] == 4.0
+    assert stats["GET /user/"]["statuses"] == {"200": 2, "404": 1}
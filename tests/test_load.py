@@ -0,0 +1,79 @@
+import pytest
+
+from src.models.factories.user_pool import UserDataPool
+from src.perf.load import LoadRunner
+from src.perf.stats import LatencySummary, histogram, percentile
+from src.wrappers.user_api_client import CleanupSummary, UserApiClient
+
+
+@pytest.mark.parametrize(
+    "values, pct, expected",
+    [
+        ([7.0], 95, 7.0),
+        ([1.0, 2.0, 3.0, 4.0], 0, 1.0),
+        ([1.0, 2.0, 3.0, 4.0], 50, 2.5),
+        ([1.0, 2.0, 3.0, 4.0], 100, 4.0),
+        ([10.0, 20.0], 95, 19.5),
+    ],
+)
+def test_percentile_interpolates_linearly(values, pct, expected):
+    assert percentile(values, pct) == pytest.approx(expected)
+
+
+def test_histogram_counts_values_by_upper_bound():
+    counts = histogram([1, 5, 5.1, 10, 600, 6000], buckets=(5, 10, 1000))
+
+    assert counts == {"<=5": 2, "<=10": 2, "<=1000": 1, ">1000": 1}
+
+
+def test_latency_summary_of_samples_and_of_nothing():
+    summary = LatencySummary.from_samples([4.0, 1.0, 3.0, 2.0])
+
+    assert (summary.count, summary.min, summary.max, summary.mean) == (4, 1.0, 4.0, 2.5)
+    assert summary.p50 == pytest.approx(2.5)
+    assert LatencySummary.from_samples([]).as_dict() == {
+        "count": 0, "min": 0.0, "mean": 0.0, "p50": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0,
+    }
+
+
+class _NoIdResponse:
+    status_code = 201
+
+    @staticmethod
+    def json():
+        raise ValueError("no JSON body")
+
+
+@pytest.fixture
+def stub_client(monkeypatch, tmp_path, users_api_stub) -> UserApiClient:
+    monkeypatch.setenv("API_BASE_URL", users_api_stub.base_url)
+    monkeypatch.setenv("API_ID_JOURNAL", str(tmp_path / "created_users.journal"))
+    return UserApiClient()
+
+
+def test_load_run_deletes_each_user_once(stub_client, users_api_stub, monkeypatch, tmp_path):
+    users_before = len(users_api_stub.store)
+    cleanups = []
+    cleanup = stub_client.cleanup_created_users
+    monkeypatch.setattr(stub_client, "cleanup_created_users", lambda: cleanups.append(cleanup()))
+    runner = LoadRunner(stub_client, concurrency=2, users=UserDataPool(size=50, seed=1, cache_dir=tmp_path))
+
+    result = runner.run(0.3)
+
+    assert result.iterations > 0 and not result.failed_iterations, f"Unexpected result: {result.as_dict()}"
+    assert not result.errors, f"Unexpected errors: {dict(result.errors)}"
+    deletes = len(result.latencies_ms["DELETE /user/{id}"])
+    assert deletes == result.iterations, f"{result.iterations} iterations sent {deletes} deletes"
+    assert cleanups == [CleanupSummary()], f"Users deleted by the scenario were still tracked: {cleanups}"
+    assert len(users_api_stub.store) == users_before, "Load run left users behind"
+
+
+def test_load_iteration_with_unusable_post_body_fails_without_aborting(stub_client, monkeypatch, tmp_path):
+    monkeypatch.setattr(stub_client, "post", lambda path, json=None: _NoIdResponse())
+    runner = LoadRunner(stub_client, concurrency=1, users=UserDataPool(size=10, seed=1, cache_dir=tmp_path))
+
+    runner._iteration()
+
+    assert runner.result.failed_iterations == 1
+    assert runner.result.errors == {"POST /user/": 1}
+    assert runner.result.as_dict()["failed_iterations"] == 1
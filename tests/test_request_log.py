@@ -0,0 +1,79 @@
+import json
+import logging
+
+import pytest
+
+from src.perf.request_log import BODY_PREVIEW_BYTES, RequestEventLog, _files, event_log, log_events_to
+
+
+@pytest.fixture
+def captured_events():
+    """Attach a list-collecting handler to the events logger for one test."""
+    records: list[logging.LogRecord] = []
+    handler = logging.Handler()
+    handler.emit = records.append
+    level = event_log.level
+    event_log.addHandler(handler)
+    event_log.setLevel(logging.INFO)
+    yield records
+    event_log.removeHandler(handler)
+    event_log.setLevel(level)
+
+
+def test_nothing_is_sampled_without_a_handler(monkeypatch):
+    monkeypatch.delenv("API_EVENTS_FILE", raising=False)
+    monkeypatch.setattr(event_log, "handlers", [])
+
+    assert not RequestEventLog(sample_rate=1.0).sampled()
+
+
+@pytest.mark.parametrize("rate, expected_share", [(1.0, 1.0), (0.0, 0.0), (0.25, 0.25)])
+def test_sampling_rate(captured_events, rate, expected_share):
+    events = RequestEventLog(sample_rate=rate)
+    events._random.seed(1)
+
+    share = sum(events.sampled() for _ in range(4000)) / 4000
+
+    assert share == pytest.approx(expected_share, abs=0.03)
+
+
+def test_sample_rate_from_env(monkeypatch):
+    monkeypatch.setenv("API_LOG_SAMPLE_RATE", "0.05")
+
+    assert RequestEventLog().sample_rate == 0.05
+
+
+def test_emit_writes_one_json_line_per_request(captured_events):
+    RequestEventLog().emit("GET", "/user/42?id=1", 200, b'[{"id": 42}]', 4.23456)
+
+    (record,) = captured_events
+    event = json.loads(record.getMessage())
+    assert {key: event[key] for key in ("method", "path", "status", "bytes", "elapsed_ms")} == {
+        "method": "GET", "path": "/user/{id}", "status": 200, "bytes": 12, "elapsed_ms": 4.235,
+    }
+    assert "body" not in event, "The body preview is only added at DEBUG"
+
+
+def test_emit_adds_a_body_preview_at_debug(captured_events):
+    event_log.setLevel(logging.DEBUG)
+
+    RequestEventLog().emit("POST", "/user/", 201, b"x" * (BODY_PREVIEW_BYTES + 50), 1.0)
+
+    event = json.loads(captured_events[0].getMessage())
+    assert event["body"] == "x" * BODY_PREVIEW_BYTES
+
+
+def test_log_events_to_a_file_once(tmp_path):
+    path = tmp_path / "events.jsonl"
+    handler = log_events_to(path)
+    try:
+        assert log_events_to(path) is handler, "The same file was attached twice"
+        RequestEventLog(sample_rate=1.0).emit("DELETE", "/user/7", 200, b"{}", 2.0)
+        handler.flush()
+    finally:
+        event_log.removeHandler(handler)
+        _files.pop(path.resolve(), None)
+        handler.close()
+
+    (line,) = path.read_text().splitlines()
+    assert json.loads(line)["path"] == "/user/{id}"
@@ -0,0 +1,24 @@
+from src.helpers.seeding import SEED_PROPERTY, derive_seed, seed_key
+from src.models.factories.users import fake
+
+
+def test_derive_seed_is_stable_and_distinct_per_test():
+    nodeid = "tests/test_api.py::test_create_api_user[valid_random_user]"
+
+    assert derive_seed(1234, nodeid) == derive_seed(1234, nodeid)
+    assert derive_seed(1234, nodeid) != derive_seed(1235, nodeid), "Session seed is ignored"
+    assert derive_seed(1234, nodeid) != derive_seed(1234, nodeid + "x"), "Node id is ignored"
+    assert 0 <= derive_seed(1234, nodeid) < 2 ** 64
+
+
+def test_derive_seed_does_not_depend_on_the_hash_seed():
+    # sha256-based, so the value is the same in every interpreter and on every xdist worker
+    assert derive_seed(0, "tests/test_x.py::test_y") == 9065179282926606922
+
+
+def test_each_test_is_seeded_from_its_node_id(request, seeded_test_data):
+    assert seeded_test_data == derive_seed(request.config.stash[seed_key], request.node.nodeid)
+    assert (SEED_PROPERTY, seeded_test_data) in request.node.user_properties
+    first = fake.user_name()
+    fake.seed_instance(seeded_test_data)
+    assert fake.user_name() == first, "Faker was not seeded with the test's seed"
@@ -6,13 +6,14 @@ from src.models.factories.users import UserTestData, get_fake_user, user_test_da
 from src.pages.add_user_page import AddUserPage
 from src.pages.update_user_page import UpdateUserPage
 from src.pages.users_page import UsersPage
+from src.steps.seeding_steps import fetch_user, seed_user, wait_for_user_change
 from src.steps.validation_steps import validate_user_update, validate_users_are_matching, validate_users_not_matching
 
 log = logging.getLogger(__name__)
 
-
 @pytest.mark.ui
-def test_create_new_user():
+@pytest.mark.grid_state
+def test_create_new_user(api_client):
     add_user_page = AddUserPage()
     add_user_page.navigate()
     test_user = get_fake_user()
@@ -20,11 +21,14 @@ def test_create_new_user():
     users_page = UsersPage()
     users_page.navigate()
     users_page.pick_menu_option_for_column("ID", "Sort by DESC")
-    last_created_user = users_page.get_user_with_username(test_user.username)
+    last_created_user = users_page.get_user_with_username(test_user.username, limit=1)
+    assert last_created_user, f"User {test_user.username!r} created through the UI is missing from the grid"
+    api_client.track_created_user(last_created_user[0].id)
     validate_users_are_matching(test_user, last_created_user[0])
 
 
 @pytest.mark.ui
+@pytest.mark.grid_state
 def test_cancel_user_creation():
     users_page = UsersPage()
     users_page.navigate()
@@ -52,52 +56,45 @@ def test_user_can_pick_rows_per_page(rows_per_page):
 
 
 @pytest.mark.ui
-def test_user_can_be_updated():
-    users_page = UsersPage()
-    users_page.navigate()
-    users_page.pick_menu_option_for_column("ID", "Sort by DESC")
-    get_user_before = users_page.get_first_user_in_grid()
-    get_user_before.edit.click()
-    test_user_data = UserTestData(name="John", email="wick@wick.com")
+def test_user_can_be_updated(api_client, seeded_user):
     update_page = UpdateUserPage()
+    update_page.navigate(seeded_user.id)
+    test_user_data = UserTestData(name="John", email="wick@wick.com")
     update_page.edit_user(test_user_data).update()
-    users_page.navigate()
-    users_page.pick_menu_option_for_column("ID", "Sort by DESC")
-    get_user_after = users_page.get_first_user_in_grid()
-    validate_user_update(get_user_before, get_user_after, expected_changes=user_test_data_to_payload(test_user_data))
+    get_user_after = wait_for_user_change(api_client, seeded_user)
+    validate_user_update(seeded_user, get_user_after, expected_changes=user_test_data_to_payload(test_user_data))
 
 
 @pytest.mark.ui
-def test_user_cancel_update():
-    users_page = UsersPage()
-    users_page.navigate()
-    users_page.pick_menu_option_for_column("ID", "Sort by DESC")
-    user_to_be_updated = users_page.get_first_user_in_grid()
-    user_to_be_updated.edit.click()
-    test_user_data = UserTestData(name="John", email="wick@wick.com")
+def test_user_cancel_update(api_client, seeded_user):
     update_page = UpdateUserPage()
+    update_page.navigate(seeded_user.id)
+    test_user_data = UserTestData(name="John", email="wick@wick.com")
     update_page.edit_user(test_user_data).cancel()
+    update_page.wait_until_closed()
+    users_page = UsersPage()
     users_page.navigate()
-    users_page.pick_menu_option_for_column("ID", "Sort by DESC")
-    get_user_again = users_page.get_first_user_in_grid()
-    validate_user_update(user_to_be_updated, get_user_again, expected_changes={})
+    grid_user = users_page.get_user_with_username(seeded_user.username, limit=1)
+    assert grid_user, f"User {seeded_user.username!r} is missing from the grid after cancelling the update"
+    validate_users_are_matching(seeded_user, grid_user[0])
+    # the form closed and the grid reloaded after it, so a save cancel failed to prevent has landed by now
+    get_user_again = fetch_user(api_client, seeded_user.id)
+    validate_user_update(seeded_user, get_user_again, expected_changes={})
 
 
 @pytest.mark.ui
-def test_user_are_unique_by_details():
+@pytest.mark.grid_state
+def test_user_are_unique_by_details(api_client):
     test_user = UserTestData(name="John1", email="wick1@wick.com", phone="12345678", username="jw")
+    first_created_user = seed_user(api_client, user_test_data_to_payload(test_user))
     add_user_page = AddUserPage()
     add_user_page.navigate()
     add_user_page.add_user(test_user).save()
     users_page = UsersPage()
     users_page.navigate()
     users_page.pick_menu_option_for_column("ID", "Sort by DESC")
-    first_created_user = users_page.get_user_with_username(test_user.username)
-    add_user_page = AddUserPage()
-    add_user_page.navigate()
-    add_user_page.add_user(test_user).save()
-    users_page = UsersPage()
-    users_page.navigate()
-    users_page.pick_menu_option_for_column("ID", "Sort by DESC")
-    second_created_user = users_page.get_user_with_username(test_user.username)
-    validate_users_not_matching(first_created_user[0], second_created_user[0])
\ No newline at end of file
+    second_created_user = users_page.get_user_with_username(test_user.username, limit=1)
+    assert second_created_user, f"User {test_user.username!r} is missing from the grid"
+    if second_created_user[0].id != str(first_created_user.id):
+        api_client.track_created_user(second_created_user[0].id)
+    validate_users_not_matching(first_created_user, second_created_user[0])
@@ -0,0 +1,109 @@
+import pytest
+import requests
+
+from src.stubs.users_api_stub import UsersApiStub
+from src.wrappers.id_journal import RUN_ID_ENV
+from src.wrappers.user_api_client import UserApiClient
+
+BASE_URL = "http://api.test"
+# len("http://api.test/user/?")
+PREFIX_LENGTH = 22
+
+
+@pytest.fixture
+def client_for(monkeypatch, tmp_path):
+    """Builds a UserApiClient for a base URL, journaling into a temporary file."""
+    monkeypatch.setenv("API_ID_JOURNAL", str(tmp_path / "created_users.journal"))
+
+    def make(base_url: str) -> UserApiClient:
+        monkeypatch.setenv("API_BASE_URL", base_url)
+        return UserApiClient()
+
+    return make
+
+
+@pytest.fixture
+def stub_404_on_missing():
+    stub = UsersApiStub(missing_status=404).start()
+    yield stub
+    stub.stop()
+
+
+def _url_length(client: UserApiClient, chunk: list[int]) -> int:
+    return len(requests.Request("GET", client._url("/user/"), params={"id": chunk}).prepare().url)
+
+
+@pytest.mark.parametrize(
+    "ids, max_url_length, expected_chunks",
+    [
+        pytest.param([1, 2, 3], PREFIX_LENGTH + len("id=1&id=2&id=3"), [[1, 2, 3]], id="exact_fit"),
+        pytest.param([1, 2, 3], PREFIX_LENGTH + len("id=1&id=2&id=3") - 1, [[1, 2], [3]], id="one_over"),
+        pytest.param([1, 2, 3, 4], PREFIX_LENGTH + len("id=1&id=2"), [[1, 2], [3, 4]], id="no_separator_on_new_chunk"),
+        pytest.param([7, 100, 2000], PREFIX_LENGTH + len("id=2000"), [[7], [100], [2000]], id="one_id_per_chunk"),
+        pytest.param([5], 1, [[5]], id="single_id_over_limit"),
+    ],
+)
+def test_id_chunks_fit_the_url_length(client_for, ids, max_url_length, expected_chunks):
+    client = client_for(BASE_URL)
+
+    chunks = client._id_chunks(ids, max_url_length)
+
+    assert chunks == expected_chunks, f"Unexpected chunks for limit {max_url_length}: {chunks}"
+    for chunk in chunks:
+        if len(chunk) > 1:
+            assert _url_length(client, chunk) <= max_url_length, f"URL of {chunk} exceeds {max_url_length}"
+
+
+def test_get_users_by_ids_multi_id_chunks(client_for, users_api_stub):
+    client = client_for(users_api_stub.base_url)
+    missing_id = 999_999
+
+    max_url_length = len(client._url("/user/?")) + len("id=1&id=2&id=3")
+    assert client._id_chunks([1, 2, 3, 4, missing_id], max_url_length) == [[1, 2, 3], [4, missing_id]]
+
+    result = client.get_users_by_ids([3, 1, missing_id, 4, 2, 1], max_url_length=max_url_length)
+
+    assert [user.id for user in result.users] == [1, 2, 3, 4], f"Unexpected users: {result.users!r}"
+    assert result.missing == [missing_id], f"Unexpected missing ids: {result.missing}"
+
+
+@pytest.mark.parametrize("missing_ids", [[], [999_998], [999_997, 999_998]], ids=["none", "one", "two"])
+def test_get_users_by_ids_bisects_chunks_answered_with_404(client_for, stub_404_on_missing, missing_ids):
+    client = client_for(stub_404_on_missing.base_url)
+
+    result = client.get_users_by_ids([1, 2, 3, 4, 5, *missing_ids])
+
+    assert [user.id for user in result.users] == [1, 2, 3, 4, 5], f"Unexpected users: {result.users!r}"
+    assert result.missing == missing_ids, f"Unexpected missing ids: {result.missing}"
+
+
+def test_sweep_journal_of_a_run_leaves_other_runs_users(client_for, users_api_stub, monkeypatch):
+    payload = {"name": "Ann", "username": "ann", "email": "ann@example.com", "phone": "555-010-9999"}
+    created = {}
+    for run_id in ("this_run", "concurrent_run"):
+        monkeypatch.setenv(RUN_ID_ENV, run_id)
+        created[run_id] = client_for(users_api_stub.base_url).post("/user/", json=payload).json()["id"]
+
+    summary = client_for(users_api_stub.base_url).sweep_journal("this_run")
+
+    assert summary.deleted == [created["this_run"]]
+    assert created["concurrent_run"] in users_api_stub.store._users, "A concurrent run's user was swept"
+
+
+def test_failing_deletes_are_retried_by_cleanup_only(client_for, monkeypatch):
+    monkeypatch.setenv("API_CLEANUP_RETRIES", "2")
+    monkeypatch.setenv("API_CLEANUP_BACKOFF", "0")
+    monkeypatch.setenv("API_RETRIES", "3")
+    stub = UsersApiStub(error_rate=1.0).start()
+    attempts = []
+    inject = stub.inject
+    monkeypatch.setattr(stub, "inject", lambda: attempts.append(1) or inject())
+    try:
+        client = client_for(stub.base_url)
+        client.track_created_user(1)
+        summary = client.cleanup_created_users()
+    finally:
+        stub.stop()
+
+    assert summary.failed == [1]
+    assert len(attempts) == 3, "DELETE was retried by the transport as well as by cleanup"
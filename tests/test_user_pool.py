@@ -0,0 +1,51 @@
+import pytest
+
+from src.models.factories.user_pool import UserDataPool, generate_chunk
+
+
+def test_generate_chunk_is_deterministic_per_seed_and_index():
+    assert generate_chunk(42, "en_US", 0, 5) == generate_chunk(42, "en_US", 0, 5)
+    assert generate_chunk(42, "en_US", 0, 5) != generate_chunk(42, "en_US", 1, 5), "Chunks repeat across indexes"
+    assert generate_chunk(42, "en_US", 0, 5) != generate_chunk(43, "en_US", 0, 5), "Chunks repeat across seeds"
+
+
+@pytest.mark.parametrize("background", [None, "thread"])
+def test_pool_hands_out_unique_users_across_refills(tmp_path, background):
+    with UserDataPool(size=20, seed=7, background=background, cache_dir=tmp_path) as pool:
+        users = pool.take(75)
+
+    assert len({user.username for user in users}) == len(users), "Usernames repeat across chunks"
+    assert len({user.email for user in users}) == len(users), "Emails repeat across chunks"
+
+
+def test_seeded_pool_is_reproducible_and_served_from_cache(tmp_path):
+    with UserDataPool(size=10, seed=3, cache_dir=tmp_path) as pool:
+        first_run = pool.take(25)
+    cached = sorted(path.name for path in tmp_path.iterdir())
+    assert cached == [f"users-en_US-3-10-{index}.json" for index in range(3)], f"Unexpected cache files {cached}"
+
+    with UserDataPool(size=10, seed=3, cache_dir=tmp_path) as pool:
+        second_run = pool.take(25)
+
+    assert second_run == first_run, "A seeded pool did not replay the same users"
+
+
+def test_unseeded_pool_is_not_cached(tmp_path):
+    with UserDataPool(size=5, cache_dir=tmp_path) as pool:
+        pool.take(5)
+
+    assert not list(tmp_path.iterdir()), "Unseeded chunks were written to the cache"
+
+
+def test_unreadable_cache_is_regenerated(tmp_path):
+    with UserDataPool(size=5, seed=11, cache_dir=tmp_path) as pool:
+        expected = pool.take(5)
+    (tmp_path / "users-en_US-11-5-0.json").write_text("not json")
+
+    with UserDataPool(size=5, seed=11, cache_dir=tmp_path) as pool:
+        assert pool.take(5) == expected, "Chunk was not regenerated from the seed"
+
+
+def test_unknown_background_mode_is_rejected():
+    with pytest.raises(ValueError):
+        UserDataPool(size=1, background="fiber")
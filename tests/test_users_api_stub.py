@@ -0,0 +1,101 @@
+import pytest
+import requests
+
+from src.stubs.users_api_stub import StubValidationError, UsersApiStub, parse_id, validate_user
+
+VALID = {"name": "Ann", "username": "ann", "email": "ann@example.com", "phone": "(828)223-6000x6550"}
+
+
+@pytest.mark.parametrize(
+    "payload, partial, status",
+    [
+        pytest.param([], False, 422, id="not_an_object"),
+        pytest.param({"name": "Ann"}, False, 422, id="missing_fields"),
+        pytest.param({**VALID, "phone": None}, False, 422, id="null_phone"),
+        pytest.param({**VALID, "name": " "}, False, 400, id="blank_name"),
+        pytest.param({**VALID, "username": ""}, False, 400, id="empty_username"),
+        pytest.param({**VALID, "email": "not-an-email"}, False, 400, id="bad_email"),
+        pytest.param({"phone": "bad"}, True, 400, id="bad_phone_partial"),
+    ],
+)
+def test_validate_user_rejects(payload, partial, status):
+    with pytest.raises(StubValidationError) as error:
+        validate_user(payload, partial=partial)
+
+    assert error.value.status == status
+
+
+def test_validate_user_keeps_only_user_fields():
+    assert validate_user({**VALID, "id": 9, "extra": 1}) == VALID
+    assert validate_user({"email": "a@b.co"}, partial=True) == {"email": "a@b.co"}
+
+
+@pytest.mark.parametrize("raw", ["string", "!#", "-82", " ", "0"])
+def test_parse_id_rejects_malformed_ids(raw):
+    with pytest.raises(StubValidationError):
+        parse_id(raw)
+
+
+def test_get_by_ids(users_api_stub):
+    url = users_api_stub.base_url + "user/"
+
+    assert [user["id"] for user in requests.get(url, params={"id": [2, 1, 2]}).json()] == [2, 1]
+    assert requests.get(url, params={"id": 999_999}).json() == []
+    malformed = requests.get(url, params={"id": "string"})
+    assert (malformed.status_code, malformed.json()) == (400, [])
+
+
+def test_crud_round_trip(users_api_stub):
+    url = users_api_stub.base_url + "user/"
+    created = requests.post(url, json=VALID)
+    uid = created.json()["id"]
+
+    patched = requests.patch(f"{url}{uid}", json={"email": "new@example.com"})
+    deleted = requests.delete(f"{url}{uid}")
+
+    assert created.status_code == 201
+    assert patched.json() == {**VALID, "id": uid, "email": "new@example.com"}
+    assert deleted.status_code == 200
+    assert requests.delete(f"{url}{uid}").status_code == 404
+
+
+def test_injected_errors_and_missing_status():
+    stub = UsersApiStub(error_rate=1.0, missing_status=404, seed=1).start()
+    try:
+        assert requests.get(stub.base_url + "user/").status_code == 503
+        stub.error_rate = 0.0
+        assert requests.get(stub.base_url + "user/", params={"id": [1, 999_999]}).status_code == 404
+        assert requests.get(stub.base_url + "user/", params={"id": [1, 2]}).status_code == 200
+    finally:
+        stub.stop()
+
+    with pytest.raises(ValueError):
+        UsersApiStub(missing_status=500)
+
+
+@pytest.mark.parametrize(
+    "method, path",
+    [
+        pytest.param("PUT", "user/abc", id="bad_id"),
+        pytest.param("POST", "users/", id="wrong_path"),
+        pytest.param("PATCH", "user/999999", id="unknown_id"),
+    ],
+)
+def test_early_replies_leave_keep_alive_connections_usable(users_api_stub, method, path):
+    with requests.Session() as session:
+        rejected = session.request(method, users_api_stub.base_url + path, json=VALID)
+        follow_up = session.get(users_api_stub.base_url + "user/")
+
+    assert rejected.status_code in (400, 404)
+    assert follow_up.status_code == 200, "The unread request body was parsed as the next request"
+
+
+def test_injected_errors_leave_keep_alive_connections_usable():
+    stub = UsersApiStub(error_rate=0.5, seed=3).start()
+    try:
+        with requests.Session() as session:
+            statuses = [session.post(stub.base_url + "user/", json=VALID).status_code for _ in range(40)]
+    finally:
+        stub.stop()
+
+    assert set(statuses) == {201, 503}
@@ -0,0 +1,78 @@
+import copy
+import pickle
+
+import pytest
+
+from src.models.factories.users import UsersRowData
+
+VALUES = ("7", "Ann", "ann", "ann@example.com", "555-010-0007")
+
+
+class FakePage:
+    """Resolves row buttons to labels and records which rows asked."""
+
+    def __init__(self):
+        self.lookups = []
+
+    def row_buttons(self, key_attr: str, key: str) -> list:
+        self.lookups.append((key_attr, key))
+        return [f"edit {key}", f"remove {key}"]
+
+
+def _row(page=None, key_attr="data-id", data_id="7") -> UsersRowData:
+    return UsersRowData(*VALUES, data_id=data_id, _key_attr=key_attr, _page=page)
+
+
+def test_equality_and_hash_ignore_the_page():
+    assert _row(FakePage()) == _row(FakePage()) == _row()
+    assert hash(_row(FakePage())) == hash(_row())
+    assert _row() != _row(data_id="8")
+    assert len({_row(FakePage()), _row(), _row(data_id="8")}) == 2
+
+
+def test_buttons_resolve_through_the_page_by_the_key_attribute():
+    page = FakePage()
+    row = _row(page, key_attr="aria-rowindex", data_id="3")
+
+    assert (row.edit, row.remove) == ("edit 3", "remove 3")
+    assert page.lookups == [("aria-rowindex", "3")] * 2
+
+
+def test_rows_of_a_page_share_it():
+    page = FakePage()
+
+    assert _row(page)._page is _row(page, data_id="8")._page
+
+
+def test_pickling_keeps_values_but_not_the_page():
+    restored = pickle.loads(pickle.dumps(_row(FakePage(), key_attr="aria-rowindex")))
+
+    assert restored == _row()
+    assert restored._key_attr == "aria-rowindex"
+    with pytest.raises(RuntimeError):
+        restored.edit
+
+
+@pytest.mark.parametrize("copier", [copy.copy, copy.deepcopy], ids=["copy", "deepcopy"])
+def test_copies_keep_the_page(copier):
+    page = FakePage()
+
+    copied = copier(_row(page))
+
+    assert copied == _row()
+    assert copied.remove == "remove 7"
+
+
+def test_unbound_row_lookups_raise():
+    with pytest.raises(RuntimeError):
+        _row().edit
+    with pytest.raises(RuntimeError):
+        _row().remove
+
+
+def test_missing_buttons_are_none():
+    class NoButtons:
+        def row_buttons(self, key_attr, key):
+            return []
+
+    assert _row(NoButtons()).edit is None
@@ -0,0 +1,40 @@
+from datetime import timedelta
+
+import pytest
+from requests import Response
+
+from src.models.user_model import UserModel
+from src.steps.validation_steps import validate_response
+
+USER = b'{"id": 1, "name": "Ann", "username": "ann", "email": "ann@example.com", "phone": "555-010-0001"}'
+
+
+def _response(body: bytes) -> Response:
+    response = Response()
+    response.status_code = 200
+    response.headers["Content-Type"] = "application/json"
+    response.elapsed = timedelta(milliseconds=5)
+    response._content = body
+    return response
+
+
+def test_validates_one_or_many_users_from_the_body():
+    assert validate_response(_response(USER), UserModel, 200).id == 1
+    assert [user.id for user in validate_response(_response(b"[" + USER + b"]"), UserModel, 200)] == [1]
+
+
+@pytest.mark.parametrize(
+    "body, message",
+    [
+        pytest.param(b"not json", "Invalid JSON body", id="invalid_json"),
+        pytest.param(b'{"id": "x"}', "Schema validation failed", id="schema"),
+    ],
+)
+def test_invalid_bodies_fail_with_the_step_message(body, message):
+    with pytest.raises(pytest.fail.Exception, match=message):
+        validate_response(_response(body), UserModel, 200)
+
+
+def test_other_validator_errors_fail_with_the_step_message():
+    with pytest.raises(pytest.fail.Exception, match="Schema validation failed"):
+        validate_response(_response(USER), "not a model", 200)
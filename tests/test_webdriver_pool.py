@@ -0,0 +1,108 @@
+import pytest
+from selenium.common.exceptions import WebDriverException
+
+import core.container
+from core.container import WebDriverPool, pooled_webdriver_resource
+
+
+class FakeWrapper:
+    """Stands in for WebDriverWrapper; `broken` lists the calls that raise WebDriverException."""
+    launched: list["FakeWrapper"] = []
+
+    def __init__(self):
+        self.calls: list[str] = []
+        self.broken: set[str] = set()
+        FakeWrapper.launched.append(self)
+
+    def _call(self, name: str, *args):
+        self.calls.append(" ".join([name, *args]))
+        if name in self.broken:
+            raise WebDriverException(f"{name} failed")
+
+    def execute_script(self, script):
+        self._call("execute_script")
+
+    def delete_all_cookies(self):
+        self._call("delete_all_cookies")
+
+    def get_url(self, url):
+        self._call("get_url", url)
+
+    def get_current_url(self):
+        self._call("get_current_url")
+        return "about:blank"
+
+    def quit(self):
+        self._call("quit")
+
+
+@pytest.fixture
+def pool(monkeypatch) -> WebDriverPool:
+    FakeWrapper.launched = []
+    monkeypatch.setattr(core.container, "WebDriverWrapper", FakeWrapper)
+    return WebDriverPool()
+
+
+def test_acquire_reuses_one_browser(pool):
+    first = pool.acquire()
+    pool.release(first)
+
+    assert pool.acquire() is first
+    assert len(FakeWrapper.launched) == 1
+
+
+def test_release_resets_the_browser_state(pool):
+    wrapper = pool.acquire()
+
+    pool.release(wrapper)
+
+    assert wrapper.calls == ["execute_script", "delete_all_cookies", "get_url about:blank"]
+
+
+def test_release_still_clears_cookies_when_storage_is_unreachable(pool):
+    wrapper = pool.acquire()
+    wrapper.broken.add("execute_script")
+
+    pool.release(wrapper)
+
+    assert pool.acquire() is wrapper
+    assert "delete_all_cookies" in wrapper.calls
+
+
+def test_release_discards_a_browser_that_cannot_be_reset(pool):
+    wrapper = pool.acquire()
+    wrapper.broken.add("delete_all_cookies")
+
+    pool.release(wrapper)
+    replacement = pool.acquire()
+
+    assert replacement is not wrapper
+    assert wrapper.calls[-1] == "quit"
+
+
+def test_acquire_replaces_a_broken_session(pool):
+    wrapper = pool.acquire()
+    wrapper.broken.update({"get_current_url", "quit"})
+
+    replacement = pool.acquire()
+
+    assert replacement is not wrapper
+    assert wrapper.calls[-2:] == ["get_current_url", "quit"], "The broken browser was not quit"
+    assert len(FakeWrapper.launched) == 2
+
+
+def test_shutdown_quits_the_browser(pool):
+    wrapper = pool.acquire()
+
+    pool.shutdown()
+    pool.shutdown()
+
+    assert wrapper.calls.count("quit") == 1
+
+
+def test_pooled_resource_releases_after_use(pool):
+    with pooled_webdriver_resource(pool) as wrapper:
+        assert wrapper.calls == []
+
+    assert wrapper.calls[-1] == "get_url about:blank"
+    assert pool.acquire() is wrapper
@@ -0,0 +1,249 @@
+import pytest
+from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException, TimeoutException
+from selenium.webdriver.common.by import By
+
+from src.wrappers.webdriver_wrapper import (
+    _FILL_INPUTS_SCRIPT,
+    _WAIT_EVENT_SCRIPT,
+    _WAIT_POLL_SCRIPT,
+    CLICKABLE,
+    ElementWrapper,
+)
+
+SAVE = (By.CSS_SELECTOR, "button.save")
+NAME = (By.NAME, "name")
+
+
+class FakeElement:
+    """Stands in for a WebElement; goes stale after `stale_after` clicks."""
+
+    def __init__(self, label: str, stale_after: int = None):
+        self.label = label
+        self.tag_name = "input"
+        self.text = label
+        self.clicks = 0
+        self.keys: list = []
+        self.stale_after = stale_after
+
+    def click(self):
+        if self.stale_after is not None and self.clicks >= self.stale_after:
+            raise StaleElementReferenceException(f"{self.label} is gone")
+        self.clicks += 1
+
+    def send_keys(self, *keys):
+        self.keys.extend(keys)
+
+
+class FakeDriver:
+    """Answers the injected scripts from `elements` (locator value -> element) and records the calls.
+    A locator in `pending` is not ready for that many more checks.
+    """
+
+    def __init__(self, url: str = "http://app.test/users"):
+        self.current_url = url
+        self.elements: dict[str, FakeElement] = {}
+        self.pending: dict[str, int] = {}
+        self.lookups: list[str] = []
+        self.scripts: list[tuple] = []
+        self.script_timeout = None
+
+    def set_script_timeout(self, seconds):
+        self.script_timeout = seconds
+
+    def _check(self, value, element):
+        if element is not None:
+            return element
+        self.lookups.append(value)
+        if self.pending.get(value):
+            self.pending[value] -= 1
+            return None
+        return self.elements.get(value)
+
+    def execute_script(self, script, *args):
+        self.scripts.append((script, args))
+        if script is _FILL_INPUTS_SCRIPT:
+            return [value for by, value, text in args[0] if value not in self.elements]
+        by, value, element, condition = args
+        return self._check(value, element)
+
+    def execute_async_script(self, script, *args):
+        self.scripts.append((script, args))
+        by, value, element, condition, timeout_ms, recheck_ms = args
+        # the injected script waits in the page itself, so one call answers with the element or null
+        self.pending.pop(value, None)
+        return self._check(value, element)
+
+    def find_element(self, by, value):
+        self.lookups.append(value)
+        if value not in self.elements:
+            raise NoSuchElementException(value)
+        return self.elements[value]
+
+
+@pytest.fixture
+def driver(monkeypatch) -> FakeDriver:
+    monkeypatch.setenv("DEFAULT_TIMEOUT", "1")
+    monkeypatch.setenv("WAIT_POLL_INTERVAL", "0.01")
+    monkeypatch.setenv("WAIT_STRATEGY", "poll")
+    driver = FakeDriver()
+    driver.elements = {"button.save": FakeElement("save"), "name": FakeElement("name input")}
+    return driver
+
+
+def test_cached_lookups_hit_after_the_first_miss(driver):
+    wrapper = ElementWrapper(driver)
+
+    wrapper.find_element(SAVE, cached=True)
+    wrapper.find_element(SAVE, cached=True)
+    wrapper.find_element(NAME, cached=True)
+
+    assert driver.lookups == ["button.save", "name"]
+    assert wrapper.element_cache_stats == {"hits": 1, "misses": 2, "size": 2}
+
+
+def test_uncached_lookups_always_locate(driver):
+    wrapper = ElementWrapper(driver)
+
+    wrapper.find_element(SAVE)
+    wrapper.find_element(SAVE)
+
+    assert driver.lookups == ["button.save", "button.save"]
+    assert wrapper.element_cache_stats == {"hits": 0, "misses": 0, "size": 0}
+
+
+def test_in_app_navigation_drops_the_cache(driver):
+    wrapper = ElementWrapper(driver)
+    wrapper.find_element(SAVE, cached=True).click()
+    first = driver.elements["button.save"]
+    driver.current_url = "http://app.test/users/7/edit"
+    driver.elements["button.save"] = FakeElement("save on the edit route")
+
+    wrapper.find_element(SAVE, cached=True).click()
+
+    assert driver.lookups == ["button.save", "button.save"]
+    assert (first.clicks, driver.elements["button.save"].clicks) == (1, 1), "The previous route's element was reused"
+
+
+def test_invalidate_drops_the_cache(driver):
+    wrapper = ElementWrapper(driver)
+    wrapper.find_element(SAVE, cached=True)
+
+    wrapper.invalidate_element_cache()
+    wrapper.find_element(SAVE, cached=True)
+
+    assert driver.lookups == ["button.save", "button.save"]
+
+
+def test_stale_cached_element_is_located_once_more(driver):
+    wrapper = ElementWrapper(driver)
+    stale = driver.elements["button.save"] = FakeElement("re-rendered save", stale_after=0)
+    wrapper.find_element(SAVE, cached=True)
+    fresh = driver.elements["button.save"] = FakeElement("save")
+
+    wrapper.click()
+    wrapper.find_element(SAVE, cached=True).click()
+
+    assert (stale.clicks, fresh.clicks) == (0, 2)
+    assert driver.lookups == ["button.save", "button.save"], "The re-located element was not cached"
+
+
+def test_stale_retry_happens_only_once(driver):
+    wrapper = ElementWrapper(driver)
+    driver.elements["button.save"] = FakeElement("always stale", stale_after=0)
+    wrapper.find_element(SAVE, cached=True)
+
+    with pytest.raises(StaleElementReferenceException):
+        wrapper.click()
+
+
+def test_poll_strategy_checks_with_one_script_call_per_poll(driver):
+    driver.pending["button.save"] = 3
+    wrapper = ElementWrapper(driver)
+
+    found = wrapper._wait_until(CLICKABLE, locator=SAVE)
+
+    assert found is driver.elements["button.save"]
+    assert [script for script, _ in driver.scripts] == [_WAIT_POLL_SCRIPT] * 4
+    assert driver.scripts[-1][1] == (By.CSS_SELECTOR, "button.save", None, CLICKABLE)
+
+
+def test_poll_strategy_times_out_with_the_locator(driver):
+    wrapper = ElementWrapper(driver)
+
+    with pytest.raises(TimeoutException, match="button.missing.*not present"):
+        wrapper.find_element((By.CSS_SELECTOR, "button.missing"))
+
+
+def test_event_strategy_waits_in_one_async_script(driver, monkeypatch):
+    monkeypatch.setenv("WAIT_STRATEGY", "event")
+    driver.pending["button.save"] = 3
+    wrapper = ElementWrapper(driver)
+
+    found = wrapper._wait_until(CLICKABLE, locator=SAVE)
+
+    assert found is driver.elements["button.save"]
+    assert driver.script_timeout == 6, "The script timeout must outlast the in-page wait"
+    ((script, args),) = driver.scripts
+    assert script is _WAIT_EVENT_SCRIPT
+    assert args == (By.CSS_SELECTOR, "button.save", None, CLICKABLE, 1000, 10.0)
+
+
+def test_event_strategy_times_out_when_the_script_gives_up(driver, monkeypatch):
+    monkeypatch.setenv("WAIT_STRATEGY", "event")
+    wrapper = ElementWrapper(driver)
+
+    with pytest.raises(TimeoutException):
+        wrapper.find_element((By.CSS_SELECTOR, "button.missing"))
+
+
+def test_waits_on_an_element_pass_it_to_the_script(driver):
+    wrapper = ElementWrapper(driver)
+    element = driver.elements["name"]
+
+    wrapper.wait_for_element_to_load(element)
+
+    assert driver.scripts == [(_WAIT_POLL_SCRIPT, (None, None, element, "visible"))]
+
+
+def test_other_locator_strategies_fall_back_to_selenium_waits(driver):
+    driver.elements["save-class"] = FakeElement("save")
+    wrapper = ElementWrapper(driver)
+
+    wrapper.find_element((By.CLASS_NAME, "save-class"))
+
+    assert driver.scripts == []
+    assert driver.lookups == ["save-class"]
+
+
+def test_fill_inputs_sets_every_value_in_one_script_call(driver):
+    driver.elements["email"] = FakeElement("email input")
+    wrapper = ElementWrapper(driver)
+
+    wrapper.fill_inputs({NAME: "Ann", (By.NAME, "email"): "ann@example.com"})
+
+    (wait, fill) = driver.scripts
+    assert wait == (_WAIT_POLL_SCRIPT, (By.NAME, "name", None, "visible")), "Did not wait for the first input"
+    assert fill == (_FILL_INPUTS_SCRIPT, ([[By.NAME, "name", "Ann"], [By.NAME, "email", "ann@example.com"]],))
+
+
+def test_fill_inputs_reports_inputs_it_could_not_find(driver):
+    wrapper = ElementWrapper(driver)
+
+    with pytest.raises(NoSuchElementException, match="phone"):
+        wrapper.fill_inputs({NAME: "Ann", (By.NAME, "phone"): "555"})
+
+
+def test_fill_inputs_without_values_does_nothing(driver):
+    ElementWrapper(driver).fill_inputs({})
+
+    assert driver.scripts == []
+
+
+def test_fill_inputs_types_into_locators_the_script_cannot_resolve(driver):
+    field = driver.elements["name-class"] = FakeElement("name input")
+    wrapper = ElementWrapper(driver)
+
+    wrapper.fill_inputs({(By.CLASS_NAME, "name-class"): "Ann"})
+
+    assert not any(script is _FILL_INPUTS_SCRIPT for script, _ in driver.scripts)
+    assert field.keys[-1] == "Ann", "The value was not typed after clearing the field"